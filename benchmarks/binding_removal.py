@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""Measure how long it takes to remove the bindings of a few objects depending on the total number of bindings.
+
+Usage: python benchmarks/binding_removal.py [--removed 100] [--totals 1000 10000 100000]
+"""
+import argparse
+import time
+from typing import List
+
+from nicegui import binding
+
+
+class Model:
+    value = binding.BindableProperty()
+
+    def __init__(self) -> None:
+        self.value = 0
+
+
+class PlainModel:
+
+    def __init__(self) -> None:
+        self.value = 0
+
+
+def measure(total: int, removed: int) -> float:
+    """Create `total` bindings and return the time in seconds to remove the bindings of `removed` objects."""
+    binding.reset()
+    sources = [PlainModel() for _ in range(total // 2)]
+    targets: List[Model] = []
+    for source in sources:
+        target = Model()
+        binding.bind(target, 'value', source, 'value')
+        targets.append(target)
+    t = time.perf_counter()
+    for target in targets[:removed]:
+        binding.remove([target])
+    return time.perf_counter() - t
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--removed', type=int, default=100, help='number of objects to remove')
+    parser.add_argument('--totals', type=int, nargs='+', default=[1_000, 10_000, 100_000], help='total bindings')
+    args = parser.parse_args()
+
+    print(f'{"total bindings":>15} {"removed objects":>16} {"time [ms]":>10} {"per object [µs]":>16}')
+    for total in args.totals:
+        dt = measure(total, args.removed)
+        print(f'{total:>15} {args.removed:>16} {dt * 1e3:>10.2f} {dt / args.removed * 1e6:>16.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Compare payload size and encoding/decoding time of the JSON and the msgpack wire format.
+
+Usage: python benchmarks/wire_format.py [--points 10000] [--repetitions 100]
+
+Decoding is measured with the Python packages instead of the browser's parsers.
+Typed arrays are left as raw bytes, because the browser wraps them without parsing.
+"""
+import argparse
+import time
+from typing import Any, Callable, Dict
+
+import msgpack
+import numpy as np
+from socketio import packet
+
+from nicegui import json
+from nicegui.msgpack_packet import MsgPackPacket
+
+
+def create_payloads(points: int) -> Dict[str, Any]:
+    """Create typical payloads: element updates, plot data, scene coordinates and image bytes."""
+    rng = np.random.default_rng(0)
+    return {
+        'element updates': {str(i): {'tag': 'div', 'text': f'label {i}', 'class': ['text-lg'], 'props': {'data-id': i}}
+                            for i in range(points // 10)},
+        'line plot': {'x': np.arange(points, dtype=np.float64), 'y': rng.normal(size=(3, points))},
+        'scene coordinates': rng.random(size=(points, 3), dtype=np.float32).ravel(),
+        'image bytes': rng.integers(0, 256, size=points * 4, dtype=np.uint8),
+    }
+
+
+def measure(function: Callable[[], Any], repetitions: int) -> float:
+    """Return the average time in milliseconds to call the given function."""
+    t = time.perf_counter()
+    for _ in range(repetitions):
+        function()
+    return (time.perf_counter() - t) / repetitions * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--points', type=int, default=10_000, help='number of data points per payload')
+    parser.add_argument('--repetitions', type=int, default=100, help='number of repetitions per measurement')
+    args = parser.parse_args()
+
+    print(f'{"payload":>18} {"format":>8} {"size [kB]":>10} {"encode [ms]":>12} {"decode [ms]":>12}')
+    for name, payload in create_payloads(args.points).items():
+        data = ['update', payload]
+        json_packet = packet.Packet(packet.EVENT, data=data)
+        json_packet.json = json
+        msgpack_packet = MsgPackPacket(packet.EVENT, data=data, namespace='/')
+        json_encoded = json_packet.encode()
+        msgpack_encoded = msgpack_packet.encode()
+        results = {
+            'json': (len(json_encoded.encode()),
+                     measure(json_packet.encode, args.repetitions),
+                     measure(lambda: json.loads(json_encoded[1:]), args.repetitions)),
+            'msgpack': (len(msgpack_encoded),
+                        measure(msgpack_packet.encode, args.repetitions),
+                        measure(lambda: msgpack.unpackb(msgpack_encoded), args.repetitions)),
+        }
+        for format_, (size, encode_time, decode_time) in results.items():
+            print(f'{name:>18} {format_:>8} {size / 1e3:>10.1f} {encode_time:>12.3f} {decode_time:>12.3f}')
+
+
+if __name__ == '__main__':
+    main()
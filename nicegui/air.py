@@ -207,7 +207,7 @@ class Air:
             await stream.response.aclose()
         self.streams.clear()
 
-    async def emit(self, message_type: str, data: Dict[str, Any], room: str) -> None:
+    async def emit(self, message_type: str, data: Any, room: str) -> None:
         """Emit a message to the NiceGUI On Air server."""
         if self.relay.connected:
             await self.relay.emit('forward', {'event': message_type, 'data': data, 'room': room})
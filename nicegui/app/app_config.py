@@ -32,6 +32,9 @@ class AppConfig:
     language: Language = field(init=False)
     binding_refresh_interval: float = field(init=False)
     reconnect_timeout: float = field(init=False)
+    flush_interval: float = field(init=False)
+    flush_batch_size: int = field(init=False)
+    wire_format: Literal['json', 'msgpack'] = field(init=False)
     tailwind: bool = field(init=False)
     prod_js: bool = field(init=False)
     show_welcome_message: bool = field(init=False)
@@ -47,6 +50,9 @@ class AppConfig:
                        language: Language,
                        binding_refresh_interval: float,
                        reconnect_timeout: float,
+                       flush_interval: float,
+                       flush_batch_size: int,
+                       wire_format: Literal['json', 'msgpack'],
                        tailwind: bool,
                        prod_js: bool,
                        show_welcome_message: bool,
@@ -60,6 +66,9 @@ class AppConfig:
         self.language = language
         self.binding_refresh_interval = binding_refresh_interval
         self.reconnect_timeout = reconnect_timeout
+        self.flush_interval = flush_interval
+        self.flush_batch_size = flush_batch_size
+        self.wire_format = wire_format
         self.tailwind = tailwind
         self.prod_js = prod_js
         self.show_welcome_message = show_welcome_message
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Callable
 
-from . import background_tasks
+from . import core
 
 
 class AwaitableResponse:
@@ -20,13 +20,17 @@ class AwaitableResponse:
         self.wait_for_result = wait_for_result
         self._is_fired = False
         self._is_awaited = False
-        background_tasks.create(self._fire(), name='fire')
+        assert core.loop is not None
+        core.loop.call_soon(self._fire)  # NOTE: a plain callback is much cheaper than a task
 
-    async def _fire(self) -> None:
+    def _fire(self) -> None:
         if self._is_awaited:
             return
         self._is_fired = True
-        self.fire_and_forget()
+        try:
+            self.fire_and_forget()
+        except Exception as e:
+            core.app.handle_exception(e)
 
     def __await__(self):
         if self._is_fired:
@@ -1,17 +1,32 @@
 import asyncio
+import dataclasses
+import itertools
 import time
+import weakref
 from collections import defaultdict
 from collections.abc import Mapping
-from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Optional, Set, Tuple, Union
+from functools import lru_cache
+from typing import Any, Callable, DefaultDict, Dict, Iterable, Optional, Set, Tuple, Type, TypeVar, Union
 
 from . import core
 from .logging import log
+from .observables import ObservableDict
 
 MAX_PROPAGATION_TIME = 0.01
 
-bindings: DefaultDict[Tuple[int, str], List] = defaultdict(list)
+bindings: DefaultDict[Tuple[int, str], Dict[int, Tuple[Any, Any, str, Callable[[Any], Any]]]] = defaultdict(dict)
+"""Maps (source object ID, source name) to the bindings starting there, indexed by link ID."""
 bindable_properties: Dict[Tuple[int, str], Any] = {}
-active_links: List[Tuple[Any, str, Any, str, Callable[[Any], Any]]] = []
+active_links: Dict[int, Tuple[Any, str, Any, str, Callable[[Any], Any]]] = {}
+"""Maps link IDs to the bindings that need to be refreshed actively."""
+object_links: DefaultDict[int, Dict[int, Tuple[int, str]]] = defaultdict(dict)
+"""Maps object IDs to the IDs of all links involving the object and the corresponding keys in `bindings`."""
+observed_objects: 'weakref.WeakValueDictionary[int, ObservableDict]' = weakref.WeakValueDictionary()
+observed_names: DefaultDict[int, Set[str]] = defaultdict(set)
+_muted_object_ids: Set[int] = set()
+_link_ids = itertools.count()
+
+T = TypeVar('T', bound=type)
 
 
 def _has_attribute(obj: Union[object, Mapping], name: str) -> Any:
@@ -28,11 +43,40 @@ def _get_attribute(obj: Union[object, Mapping], name: str) -> Any:
 
 def _set_attribute(obj: Union[object, Mapping], name: str, value: Any) -> None:
     if isinstance(obj, dict):
-        obj[name] = value
+        _muted_object_ids.add(id(obj))  # NOTE: the caller propagates the change itself
+        try:
+            obj[name] = value
+        finally:
+            _muted_object_ids.discard(id(obj))
     else:
         setattr(obj, name, value)
 
 
+def _observe(obj: Any, name: str) -> bool:
+    """Try to observe the given object for changes instead of actively checking it in the refresh loop.
+
+    Returns True if the object notifies about changes itself, False if it needs to be refreshed actively.
+    """
+    if not isinstance(obj, ObservableDict):
+        return False
+    obj_id = id(obj)
+    if observed_objects.get(obj_id) is not obj:
+        obj.on_change(lambda: _propagate_observed(obj_id))
+        observed_objects[obj_id] = obj
+    observed_names[obj_id].add(name)
+    return True
+
+
+def _propagate_observed(obj_id: int) -> None:
+    if obj_id in _muted_object_ids:
+        return
+    obj = observed_objects.get(obj_id)
+    if obj is None:
+        return
+    for name in list(observed_names.get(obj_id, ())):
+        _propagate(obj, name)
+
+
 async def refresh_loop() -> None:
     """Refresh all bindings in an endless loop."""
     while True:
@@ -43,7 +87,7 @@ async def refresh_loop() -> None:
 def _refresh_step() -> None:
     visited: Set[Tuple[int, str]] = set()
     t = time.time()
-    for link in active_links:
+    for link in list(active_links.values()):
         (source_obj, source_name, target_obj, target_name, transform) = link
         if _has_attribute(source_obj, source_name):
             value = transform(_get_attribute(source_obj, source_name))
@@ -67,7 +111,7 @@ def _propagate(source_obj: Any, source_name: str, visited: Optional[Set[Tuple[in
         return
     source_value = _get_attribute(source_obj, source_name)
 
-    for _, target_obj, target_name, transform in bindings.get((source_obj_id, source_name), []):
+    for _, target_obj, target_name, transform in list(bindings.get((source_obj_id, source_name), {}).values()):
         if (id(target_obj), target_name) in visited:
             continue
 
@@ -77,6 +121,17 @@ def _propagate(source_obj: Any, source_name: str, visited: Optional[Set[Tuple[in
             _propagate(target_obj, target_name, visited)
 
 
+def _register_link(source_obj: Any, source_name: str, target_obj: Any, target_name: str,
+                   transform: Callable[[Any], Any]) -> None:
+    link_id = next(_link_ids)
+    key = (id(source_obj), source_name)
+    bindings[key][link_id] = (source_obj, target_obj, target_name, transform)
+    if key not in bindable_properties and not _observe(source_obj, source_name):
+        active_links[link_id] = (source_obj, source_name, target_obj, target_name, transform)
+    object_links[id(source_obj)][link_id] = key
+    object_links[id(target_obj)][link_id] = key
+
+
 def bind_to(self_obj: Any, self_name: str, other_obj: Any, other_name: str, forward: Callable[[Any], Any]) -> None:
     """Bind the property of one object to the property of another object.
 
@@ -89,9 +144,7 @@ def bind_to(self_obj: Any, self_name: str, other_obj: Any, other_name: str, forw
     :param other_name: The name of the property to bind to.
     :param forward: A function to apply to the value before applying it.
     """
-    bindings[(id(self_obj), self_name)].append((self_obj, other_obj, other_name, forward))
-    if (id(self_obj), self_name) not in bindable_properties:
-        active_links.append((self_obj, self_name, other_obj, other_name, forward))
+    _register_link(self_obj, self_name, other_obj, other_name, forward)
     _propagate(self_obj, self_name)
 
 
@@ -107,9 +160,7 @@ def bind_from(self_obj: Any, self_name: str, other_obj: Any, other_name: str, ba
     :param other_name: The name of the property to bind from.
     :param backward: A function to apply to the value before applying it.
     """
-    bindings[(id(other_obj), other_name)].append((other_obj, self_obj, self_name, backward))
-    if (id(other_obj), other_name) not in bindable_properties:
-        active_links.append((other_obj, other_name, self_obj, self_name, backward))
+    _register_link(other_obj, other_name, self_obj, self_name, backward)
     _propagate(other_obj, other_name)
 
 
@@ -158,25 +209,79 @@ class BindableProperty:
 def remove(objects: Iterable[Any]) -> None:
     """Remove all bindings that involve the given objects.
 
+    The cost only depends on the number of bindings involving these objects, not on the total number of bindings.
+
     :param objects: The objects to remove.
     """
-    object_ids = set(map(id, objects))
-    active_links[:] = [
-        (source_obj, source_name, target_obj, target_name, transform)
-        for source_obj, source_name, target_obj, target_name, transform in active_links
-        if id(source_obj) not in object_ids and id(target_obj) not in object_ids
-    ]
-    for key, binding_list in list(bindings.items()):
-        binding_list[:] = [
-            (source_obj, target_obj, target_name, transform)
-            for source_obj, target_obj, target_name, transform in binding_list
-            if id(source_obj) not in object_ids and id(target_obj) not in object_ids
-        ]
-        if not binding_list:
-            del bindings[key]
-    for (obj_id, name), obj in list(bindable_properties.items()):
-        if id(obj) in object_ids:
-            del bindable_properties[(obj_id, name)]
+    for obj in objects:
+        obj_id = id(obj)
+        for link_id, key in object_links.pop(obj_id, {}).items():
+            active_links.pop(link_id, None)
+            links = bindings.get(key)
+            if links is None or link_id not in links:
+                continue
+            source_obj, target_obj, _, _ = links.pop(link_id)
+            other_id = id(target_obj) if id(source_obj) == obj_id else id(source_obj)
+            other_links = object_links.get(other_id)
+            if other_links is not None:
+                other_links.pop(link_id, None)
+                if not other_links:
+                    del object_links[other_id]
+            if not links:
+                del bindings[key]
+                _forget_observed_name(*key)
+        for name in _bindable_property_names(type(obj)):
+            bindable_properties.pop((obj_id, name), None)
+
+
+def _forget_observed_name(obj_id: int, name: str) -> None:
+    names = observed_names.get(obj_id)
+    if names is None:
+        return
+    names.discard(name)
+    if not names:
+        del observed_names[obj_id]
+
+
+@lru_cache(maxsize=None)
+def _bindable_property_names(cls: type) -> Tuple[str, ...]:
+    """Return the names of all bindable properties of the given class."""
+    return tuple(
+        value.name
+        for base in cls.__mro__
+        for value in vars(base).values()
+        if isinstance(value, BindableProperty)
+    )
+
+
+def bindable_dataclass(cls: Optional[T] = None, *,
+                       bindable_fields: Optional[Iterable[str]] = None,
+                       **kwargs: Any) -> Union[T, Callable[[T], T]]:
+    """A decorator that transforms a class into a dataclass with bindable fields.
+
+    This allows for the use of bindable properties in dataclasses.
+    Because bindable properties detect write access, bindings to these fields are propagated immediately
+    and do not need to be checked in the refresh loop.
+
+    :param cls: class to be transformed into a dataclass
+    :param bindable_fields: optional list of field names to make bindable (default: all fields)
+    :param kwargs: optional keyword arguments to be forwarded to `dataclasses.dataclass`
+    """
+    if kwargs.get('slots'):
+        raise ValueError('`slots=True` is not supported with bindable_dataclass')
+
+    def wrap(cls_: T) -> T:
+        dataclass: Type = dataclasses.dataclass(**kwargs)(cls_)
+        field_names = {field.name for field in dataclasses.fields(dataclass)}
+        for field_name in (field_names if bindable_fields is None else bindable_fields):
+            if field_name not in field_names:
+                raise ValueError(f'"{field_name}" is not a dataclass field')
+            bindable_property = BindableProperty()
+            bindable_property.__set_name__(dataclass, field_name)
+            setattr(dataclass, field_name, bindable_property)
+        return dataclass
+
+    return wrap if cls is None else wrap(cls)
 
 
 def reset() -> None:
@@ -187,3 +292,6 @@ def reset() -> None:
     bindings.clear()
     bindable_properties.clear()
     active_links.clear()
+    object_links.clear()
+    observed_objects.clear()
+    observed_names.clear()
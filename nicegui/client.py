@@ -62,6 +62,9 @@ class Client:
         self._disconnect_task: Optional[asyncio.Task] = None
         self._deleted = False
         self.tab_id: Optional[str] = None
+        self._session_id: Optional[str] = request.scope.get('session', {}).get('id') if request is not None else None
+        if self._session_id is not None:
+            core.app.storage._add_session_client(self._session_id)  # pylint: disable=protected-access
 
         self.outbox = Outbox(self)
 
@@ -82,6 +85,9 @@ class Client:
         self.disconnect_handlers: List[Union[Callable[..., Any], Awaitable]] = []
 
         self._temporary_socket_id: Optional[str] = None
+        self._connection_waiters: List[asyncio.Future] = []
+        self._connection_request_waiters: List[asyncio.Future] = []
+        self._disconnection_waiters: List[asyncio.Future] = []
 
     @property
     def is_auto_index_client(self) -> bool:
@@ -118,7 +124,7 @@ class Client:
 
     def build_response(self, request: Request, status_code: int = 200) -> Response:
         """Build a FastAPI response for the client."""
-        self.outbox.updates.clear()
+        self.outbox.clear_updates()
         prefix = request.headers.get('X-Forwarded-Prefix', request.scope.get('root_path', ''))
         elements = json.dumps({
             id: element._to_dict() for id, element in self.elements.items()  # pylint: disable=protected-access
@@ -131,16 +137,12 @@ class Client:
             context={
                 'request': request,
                 'version': __version__,
-                'elements': elements.replace('&', '&amp;')
-                                    .replace('<', '&lt;')
-                                    .replace('>', '&gt;')
-                                    .replace('`', '&#96;')
-                                    .replace('$', '&#36;'),
+                'elements': _escape_for_template_literal(elements),
                 'head_html': self.head_html,
-                'body_html': '<style>' + '\n'.join(vue_styles) + '</style>\n' + self.body_html + '\n' + '\n'.join(vue_html),
-                'vue_scripts': '\n'.join(vue_scripts),
-                'imports': json.dumps(imports),
-                'js_imports': '\n'.join(js_imports),
+                'body_html': '<style>' + vue_styles + '</style>\n' + self.body_html + '\n' + vue_html,
+                'vue_scripts': vue_scripts,
+                'imports': imports,
+                'js_imports': js_imports,
                 'quasar_config': json.dumps(core.app.config.quasar_config),
                 'title': self.resolve_title(),
                 'viewport': self.page.resolve_viewport(),
@@ -153,6 +155,7 @@ class Client:
                 'socket_io_js_query_params': socket_io_js_query_params,
                 'socket_io_js_extra_headers': core.app.config.socket_io_js_extra_headers,
                 'socket_io_js_transports': core.app.config.socket_io_js_transports,
+                'wire_format': core.app.config.wire_format,
             },
             status_code=status_code,
             headers={'Cache-Control': 'no-store', 'X-NiceGUI-Content': 'page'},
@@ -163,24 +166,54 @@ class Client:
         return self.page.resolve_title() if self.title is None else self.title
 
     async def connected(self, timeout: float = 3.0, check_interval: float = 0.1) -> None:
-        """Block execution until the client is connected."""
+        """Block execution until the client is connected.
+
+        The `check_interval` parameter is not used anymore, because waiting is resumed by the handshake of the client.
+        """
+        if self.has_socket_connection:
+            return
         self.is_waiting_for_connection = True
-        deadline = time.time() + timeout
-        while not self.has_socket_connection:
-            if time.time() > deadline:
-                raise TimeoutError(f'No connection after {timeout} seconds')
-            await asyncio.sleep(check_interval)
+        self._resolve(self._connection_request_waiters)
+        try:
+            await asyncio.wait_for(self._wait(self._connection_waiters), timeout)
+        except asyncio.TimeoutError:
+            raise TimeoutError(f'No connection after {timeout} seconds') from None
         self.is_waiting_for_connection = False
 
     async def disconnected(self, check_interval: float = 0.1) -> None:
-        """Block execution until the client disconnects."""
+        """Block execution until the client disconnects.
+
+        The `check_interval` parameter is not used anymore, because waiting is resumed when the client is deleted.
+        """
         if not self.has_socket_connection:
             await self.connected()
         self.is_waiting_for_disconnect = True
-        while self.id in self.instances:
-            await asyncio.sleep(check_interval)
+        if self.id in self.instances:
+            await self._wait(self._disconnection_waiters)
         self.is_waiting_for_disconnect = False
 
+    async def _connection_requested(self) -> None:
+        """Block execution until some code starts waiting for the client connection."""
+        if not self.is_waiting_for_connection:
+            await self._wait(self._connection_request_waiters)
+
+    @staticmethod
+    async def _wait(waiters: List[asyncio.Future]) -> None:
+        future = asyncio.get_running_loop().create_future()
+        waiters.append(future)
+        try:
+            await future
+        finally:
+            if future in waiters:
+                waiters.remove(future)
+
+    @staticmethod
+    def _resolve(waiters: List[asyncio.Future]) -> None:
+        for future in waiters:
+            if not future.done():
+                future.set_result(None)
+        waiters.clear()
+
     def run_javascript(self, code: str, *, timeout: float = 1.0) -> AwaitableResponse:
         """Execute JavaScript on the client.
 
@@ -210,6 +243,33 @@ class Client:
 
         return AwaitableResponse(send_and_forget, send_and_wait)
 
+    def run_element_method(self, element_id: int, name: str, *args: Any, timeout: float = 1.0) -> AwaitableResponse:
+        """Call a method of an element on the client.
+
+        In contrast to `run_javascript`, the method call is sent as structured message without generating JavaScript code.
+
+        :param element_id: ID of the element
+        :param name: name of the method
+        :param args: arguments to pass to the method
+        :param timeout: timeout in seconds (default: `1.0`)
+
+        :return: AwaitableResponse that can be awaited to get the result of the method call
+        """
+        target_id = self._temporary_socket_id or self.id
+
+        def send_and_forget():
+            self.outbox.enqueue_method_call(element_id, name, args, target_id)
+
+        async def send_and_wait():
+            if self is self.auto_index_client:
+                raise RuntimeError('Cannot await JavaScript responses on the auto-index page. '
+                                   'There could be multiple clients connected and it is not clear which one to wait for.')
+            request_id = str(uuid.uuid4())
+            self.outbox.enqueue_method_call(element_id, name, args, target_id, request_id)
+            return await JavaScriptRequest(request_id, timeout=timeout)
+
+        return AwaitableResponse(send_and_forget, send_and_wait)
+
     def open(self, target: Union[Callable[..., Any], str], new_tab: bool = False) -> None:
         """Open a new page in the client."""
         path = target if isinstance(target, str) else self.page_routes[target]
@@ -232,6 +292,8 @@ class Client:
         if self._disconnect_task:
             self._disconnect_task.cancel()
             self._disconnect_task = None
+        self.outbox.forget_all()
+        self._resolve(self._connection_waiters)
         storage.request_contextvar.set(self.request)
         for t in self.connect_handlers:
             self.safe_invoke(t)
@@ -310,7 +372,10 @@ class Client:
         self.remove_all_elements()
         self.outbox.stop()
         del Client.instances[self.id]
+        if self._session_id is not None:
+            core.app.storage._remove_session_client(self._session_id)  # pylint: disable=protected-access
         self._deleted = True
+        self._resolve(self._disconnection_waiters)
 
     def check_existence(self) -> None:
         """Check if the client still exists and print a warning if it doesn't."""
@@ -346,3 +411,12 @@ class Client:
                 # NOTE: make sure the loop doesn't crash
                 log.exception('Error while pruning clients')
             await asyncio.sleep(10)
+
+
+def _escape_for_template_literal(json_string: str) -> str:
+    """Escape a JSON string to be embedded into a JavaScript template literal within an HTML script tag.
+
+    The characters "<", "`" and "$" can only occur within JSON strings, where they can be replaced by their Unicode escapes.
+    This way the result is still valid JSON and the browser can parse it without unescaping it first.
+    """
+    return json_string.replace('<', '\\u003c').replace('`', '\\u0060').replace('$', '\\u0024')
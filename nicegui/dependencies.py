@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Dict, Iterable, List, Set, Tuple
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple
 
 import vbuild
 
+from . import json
 from .dataclasses import KWONLY_SLOTS
 from .helpers import hash_file_path
 from .version import __version__
@@ -126,48 +128,56 @@ def _get_name(path: Path) -> str:
     return path.name.split('.', 1)[0]
 
 
-def generate_resources(prefix: str, elements: Iterable[Element]) -> Tuple[List[str],
-                                                                          List[str],
-                                                                          List[str],
-                                                                          Dict[str, str],
-                                                                          List[str]]:
-    """Generate the resources required by the elements to be sent to the client."""
-    done_libraries: Set[str] = set()
-    done_components: Set[str] = set()
-    vue_scripts: List[str] = []
-    vue_html: List[str] = []
-    vue_styles: List[str] = []
-    js_imports: List[str] = []
-    imports: Dict[str, str] = {}
-
-    # build the importmap structure for exposed libraries
-    for key, library in libraries.items():
-        if key not in done_libraries and library.expose:
-            imports[library.name] = f'{prefix}/_nicegui/{__version__}/libraries/{key}'
-            done_libraries.add(key)
-
-    # build the none-optimized component (i.e. the Vue component)
-    for key, vue_component in vue_components.items():
-        if key not in done_components:
-            vue_html.append(vue_component.html)
-            vue_scripts.append(vue_component.script.replace(f"Vue.component('{vue_component.name}',",
-                                                            f"app.component('{vue_component.tag}',", 1))
-            vue_styles.append(vue_component.style)
-            done_components.add(key)
-
-    # build the resources associated with the elements
+def generate_resources(prefix: str, elements: Iterable[Element]) -> Tuple[str, str, str, str, str]:
+    """Generate the resources required by the elements to be sent to the client.
+
+    The resulting HTML, styles, scripts, import map and imports are cached for each combination of registered components,
+    libraries and resources used by the elements, so that they are not built again for every single request.
+    """
+    resource_keys: Dict[Tuple[str, str], None] = {}  # NOTE: an ordered set of libraries and JS components
     for element in elements:
         for library in element.libraries:
-            if library.key not in done_libraries:
-                if not library.expose:
-                    url = f'{prefix}/_nicegui/{__version__}/libraries/{library.key}'
-                    js_imports.append(f'import "{url}";')
-                done_libraries.add(library.key)
-        if element.component:
-            js_component = element.component
-            if js_component.key not in done_components and js_component.path.suffix.lower() == '.js':
-                url = f'{prefix}/_nicegui/{__version__}/components/{js_component.key}'
-                js_imports.append(f'import {{ default as {js_component.name} }} from "{url}";')
-                js_imports.append(f'app.component("{js_component.tag}", {js_component.name});')
-                done_components.add(js_component.key)
+            resource_keys[('library', library.key)] = None
+        if element.component and element.component.path.suffix.lower() == '.js':
+            resource_keys[('component', element.component.key)] = None
+    vue_html, vue_styles, vue_scripts, imports = _generate_static_resources(prefix, tuple(vue_components), tuple(libraries))
+    js_imports = _generate_js_imports(prefix, tuple(resource_keys))
     return vue_html, vue_styles, vue_scripts, imports, js_imports
+
+
+@lru_cache(maxsize=32)
+def _generate_static_resources(prefix: str,
+                               vue_component_keys: Tuple[str, ...],
+                               library_keys: Tuple[str, ...],
+                               ) -> Tuple[str, str, str, str]:
+    """Generate the HTML, styles and scripts of all Vue components as well as the import map of all exposed libraries."""
+    imports = {
+        libraries[key].name: f'{prefix}/_nicegui/{__version__}/libraries/{key}'
+        for key in library_keys if libraries[key].expose
+    }
+    vue_html: List[str] = []
+    vue_styles: List[str] = []
+    vue_scripts: List[str] = []
+    for key in vue_component_keys:
+        vue_component = vue_components[key]
+        vue_html.append(vue_component.html)
+        vue_scripts.append(vue_component.script.replace(f"Vue.component('{vue_component.name}',",
+                                                        f"app.component('{vue_component.tag}',", 1))
+        vue_styles.append(vue_component.style)
+    return '\n'.join(vue_html), '\n'.join(vue_styles), '\n'.join(vue_scripts), json.dumps(imports)
+
+
+@lru_cache(maxsize=256)
+def _generate_js_imports(prefix: str, resource_keys: Tuple[Tuple[str, str], ...]) -> str:
+    """Generate the imports of libraries and JS components which are not part of the import map."""
+    js_imports: List[str] = []
+    for kind, key in resource_keys:
+        if kind == 'library':
+            if key not in libraries or not libraries[key].expose:
+                js_imports.append(f'import "{prefix}/_nicegui/{__version__}/libraries/{key}";')
+        else:
+            js_component = js_components[key]
+            url = f'{prefix}/_nicegui/{__version__}/components/{key}'
+            js_imports.append(f'import {{ default as {js_component.name} }} from "{url}";')
+            js_imports.append(f'app.component("{js_component.tag}", {js_component.name});')
+    return '\n'.join(js_imports)
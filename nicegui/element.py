@@ -21,7 +21,7 @@ from typing import (
 
 from typing_extensions import Self
 
-from . import core, events, helpers, json, storage
+from . import core, events, helpers, storage
 from .awaitable_response import AwaitableResponse, NullResponse
 from .classes import Classes
 from .context import context
@@ -406,7 +406,7 @@ class Element(Visibility):
         """
         if not core.loop:
             return NullResponse()
-        return self.client.run_javascript(f'return runMethod({self.id}, "{name}", {json.dumps(args)})', timeout=timeout)
+        return self.client.run_element_method(self.id, name, *args, timeout=timeout)
 
     def get_computed_prop(self, prop_name: str, *, timeout: float = 1) -> AwaitableResponse:
         """Return a computed property.
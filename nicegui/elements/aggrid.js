@@ -42,8 +42,35 @@ export default {
         checkboxRenderer: CheckboxRenderer,
       };
 
+      if (this.has_datasource) {
+        this.pendingRequests = {};
+        this.gridOptions.datasource = {
+          getRows: (params) => {
+            const request_id = (this.lastRequestId = (this.lastRequestId || 0) + 1);
+            this.pendingRequests[request_id] = params;
+            const { startRow, endRow, sortModel, filterModel } = params;
+            this.$emit("getRows", { request_id, startRow, endRow, sortModel, filterModel });
+          },
+        };
+      }
+
       this.api = agGrid.createGrid(this.$el, this.gridOptions);
       this.api.addGlobalListener(this.handle_event);
+      this.appliedTransactionVersion = this.transaction_version;
+    },
+    apply_transaction(transaction, version) {
+      if (version <= this.appliedTransactionVersion) return; // NOTE: the rows are already contained in the options
+      this.appliedTransactionVersion = version;
+      if (this.gridOptions.asyncTransactionWaitMillis !== undefined) this.api.applyTransactionAsync(transaction);
+      else this.api.applyTransaction(transaction);
+    },
+    resolve_rows(request_id, rows, lastRow) {
+      this.pendingRequests[request_id]?.successCallback(rows, lastRow);
+      delete this.pendingRequests[request_id];
+    },
+    reject_rows(request_id) {
+      this.pendingRequests[request_id]?.failCallback();
+      delete this.pendingRequests[request_id];
     },
     run_grid_method(name, ...args) {
       return runMethod(this.api, name, args);
@@ -93,5 +120,7 @@ export default {
     options: Object,
     html_columns: Array,
     auto_size_columns: Boolean,
+    transaction_version: Number,
+    has_datasource: Boolean,
   },
 };
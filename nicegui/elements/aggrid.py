@@ -1,11 +1,15 @@
 import importlib.util
-from typing import TYPE_CHECKING, Dict, List, Literal, Optional, cast
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Literal, Optional, Set, Tuple, cast
 
 from typing_extensions import Self
 
-from .. import helpers, optional_features
+from .. import core, helpers, json, optional_features
 from ..awaitable_response import AwaitableResponse
+from ..dataclasses import KWONLY_SLOTS
 from ..element import Element
+from ..events import GenericEventArguments
 
 if importlib.util.find_spec('pandas'):
     optional_features.register('pandas')
@@ -13,6 +17,14 @@ if importlib.util.find_spec('pandas'):
         import pandas as pd
 
 
+@dataclass(**KWONLY_SLOTS)
+class AgGridRequest:
+    start_row: int
+    end_row: int
+    sort_model: List[Dict]
+    filter_model: Dict
+
+
 class AgGrid(Element, component='aggrid.js', dependencies=['lib/aggrid/ag-grid-community.min.js']):
 
     def __init__(self,
@@ -20,6 +32,9 @@ class AgGrid(Element, component='aggrid.js', dependencies=['lib/aggrid/ag-grid-c
                  html_columns: List[int] = [],  # noqa: B006
                  theme: str = 'balham',
                  auto_size_columns: bool = True,
+                 row_id: Optional[str] = None,
+                 datasource: Optional[Callable[[AgGridRequest], Any]] = None,
+                 max_cached_blocks: int = 100,
                  ) -> None:
         """AG Grid
 
@@ -27,24 +42,54 @@ class AgGrid(Element, component='aggrid.js', dependencies=['lib/aggrid/ag-grid-c
 
         The methods `run_grid_method` and `run_row_method` can be used to interact with the AG Grid instance on the client.
 
+        For large data sets, a datasource function can be passed instead of ``rowData``.
+        The grid then uses AG Grid's `infinite row model <https://www.ag-grid.com/javascript-data-grid/infinite-scrolling/>`_
+        and requests blocks of rows while scrolling.
+        The datasource is called with an `AgGridRequest` containing the requested row range as well as AG Grid's sort and filter model.
+        It returns a tuple of the rows and the total number of rows (or `None` if it is unknown yet).
+        Slow queries should be implemented as async function (e.g. using `run.io_bound`) to not block the event loop.
+        The blocks are cached on the server; call `refresh_datasource` after the data has changed.
+
         :param options: dictionary of AG Grid options
         :param html_columns: list of columns that should be rendered as HTML (default: `[]`)
         :param theme: AG Grid theme (default: 'balham')
         :param auto_size_columns: whether to automatically resize columns to fit the grid width (default: `True`)
+        :param row_id: name of the field containing unique row IDs; required for row transactions like `add_rows` (default: `None`)
+        :param datasource: function returning blocks of rows for the infinite row model (default: `None`)
+        :param max_cached_blocks: maximum number of blocks returned by the datasource to cache on the server (default: 100)
         """
         super().__init__()
         self._props['options'] = options
         self._props['html_columns'] = html_columns[:]
         self._props['auto_size_columns'] = auto_size_columns
+        self._props['transaction_version'] = 0
         self._classes.append('nicegui-aggrid')
         self._classes.append(f'ag-theme-{theme}')
+        self.row_id = row_id
+        if row_id is not None and 'getRowId' not in options and ':getRowId' not in options:
+            options[':getRowId'] = f'(params) => String(params.data[{json.dumps(row_id)}])'
+        self._transaction: Dict[str, Dict[Any, Dict]] = {'add': {}, 'update': {}, 'remove': {}}
+        self._transaction_add_index: Optional[int] = None
+        self._is_transaction_scheduled = False
+        self._indexed_rows: Optional[List[Dict]] = None
+        self._row_positions: Dict[Any, int] = {}  # NOTE: index in the row data plus `_row_offset`
+        self._row_offset = 0
+
+        self.datasource = datasource
+        self.max_cached_blocks = max_cached_blocks
+        self._blocks: OrderedDict[str, Tuple[List[Dict], Optional[int]]] = OrderedDict()
+        if datasource is not None:
+            options['rowModelType'] = 'infinite'
+            self._props['has_datasource'] = True
+            self.on('getRows', self._handle_get_rows)
 
     @classmethod
     def from_pandas(cls,
                     df: 'pd.DataFrame', *,
                     theme: str = 'balham',
                     auto_size_columns: bool = True,
-                    options: Dict = {}) -> Self:  # noqa: B006
+                    options: Dict = {},  # noqa: B006
+                    row_id: Optional[str] = None) -> Self:
         """Create an AG Grid from a Pandas DataFrame.
 
         Note:
@@ -57,6 +102,7 @@ class AgGrid(Element, component='aggrid.js', dependencies=['lib/aggrid/ag-grid-c
         :param theme: AG Grid theme (default: 'balham')
         :param auto_size_columns: whether to automatically resize columns to fit the grid width (default: `True`)
         :param options: dictionary of additional AG Grid options
+        :param row_id: name of the column containing unique row IDs; required for row transactions like `add_rows` (default: `None`)
         :return: AG Grid element
         """
         import pandas as pd  # pylint: disable=import-outside-toplevel
@@ -81,7 +127,7 @@ class AgGrid(Element, component='aggrid.js', dependencies=['lib/aggrid/ag-grid-c
             'rowData': df.to_dict('records'),
             'suppressFieldDotNotation': True,
             **options,
-        }, theme=theme, auto_size_columns=auto_size_columns)
+        }, theme=theme, auto_size_columns=auto_size_columns, row_id=row_id)
 
     @property
     def options(self) -> Dict:
@@ -89,9 +135,183 @@ class AgGrid(Element, component='aggrid.js', dependencies=['lib/aggrid/ag-grid-c
         return self._props['options']
 
     def update(self) -> None:
+        if any(self._transaction.values()):
+            self._props['transaction_version'] += 1  # NOTE: the grid is recreated with all rows anyway
+            self._clear_transaction()
+        self._indexed_rows = None  # NOTE: the row data might have been changed directly
         super().update()
         self.run_method('update_grid')
 
+    def add_rows(self, rows: List[Dict], *, index: Optional[int] = None) -> None:
+        """Add rows to the grid without sending all row data to the client.
+
+        The rows are also added to ``options['rowData']``.
+        All row transactions until the next update cycle are sent to the client as a single transaction.
+        They are applied with AG Grid's ``applyTransaction`` or ``applyTransactionAsync``
+        if the grid option ``asyncTransactionWaitMillis`` is set.
+
+        :param rows: list of row data (each containing the field defined by ``row_id``)
+        :param index: index at which the rows should be inserted (default: `None` to append them)
+        """
+        self._assert_row_id()
+        row_data = self.options.setdefault('rowData', [])
+        positions = self._get_row_positions(row_data)
+        if index is None or index >= len(row_data):
+            start = len(row_data) + self._row_offset
+            row_data.extend(rows)
+        elif index == 0:
+            self._row_offset -= len(rows)
+            start = self._row_offset
+            row_data[:0] = rows
+        else:
+            row_data[index:index] = rows
+            self._indexed_rows = None  # NOTE: the following rows have moved, so they are re-indexed when needed
+        if self._indexed_rows is not None:
+            positions.update((row[self.row_id], start + i) for i, row in enumerate(rows))
+        if self._transaction['add'] and self._transaction_add_index != index:
+            self._send_transaction()  # NOTE: a transaction can only have a single add index
+        self._transaction_add_index = index
+        for row in rows:
+            self._transaction['add'][row[self.row_id]] = row
+        self._schedule_transaction()
+
+    def update_rows(self, rows: List[Dict]) -> None:
+        """Update rows of the grid without sending all row data to the client.
+
+        The rows are identified by the field defined by ``row_id`` and also replaced in ``options['rowData']``.
+        See `add_rows` for details about transactions.
+
+        :param rows: list of updated row data
+        """
+        self._assert_row_id()
+        row_data = self.options.get('rowData', [])
+        for row in rows:
+            row_id = row[self.row_id]
+            index = self._find_row(row_data, row_id)
+            if index is not None:
+                row_data[index] = row
+            if row_id in self._transaction['add']:
+                self._transaction['add'][row_id] = row  # NOTE: AG Grid applies updates before adding rows
+            else:
+                self._transaction['update'][row_id] = row
+        self._schedule_transaction()
+
+    def remove_rows(self, rows: List[Dict]) -> None:
+        """Remove rows from the grid without sending all row data to the client.
+
+        The rows are identified by the field defined by ``row_id`` and also removed from ``options['rowData']``.
+        See `add_rows` for details about transactions.
+
+        :param rows: list of row data to remove (only the field defined by ``row_id`` is needed)
+        """
+        self._assert_row_id()
+        row_ids = {row[self.row_id] for row in rows}
+        if 'rowData' in self.options:
+            self._remove_from_row_data(self.options['rowData'], row_ids)
+        for row_id in row_ids:
+            self._transaction['update'].pop(row_id, None)
+            if self._transaction['add'].pop(row_id, None) is None:
+                self._transaction['remove'][row_id] = {self.row_id: row_id}
+        self._schedule_transaction()
+
+    def refresh_datasource(self) -> None:
+        """Clear the cached blocks and request the rows from the datasource again."""
+        self._blocks.clear()
+        self.run_grid_method('refreshInfiniteCache')
+
+    async def _handle_get_rows(self, e: GenericEventArguments) -> None:
+        assert self.datasource is not None
+        request = AgGridRequest(
+            start_row=e.args['startRow'],
+            end_row=e.args['endRow'],
+            sort_model=e.args.get('sortModel') or [],
+            filter_model=e.args.get('filterModel') or {},
+        )
+        key = json.dumps([request.start_row, request.end_row, request.sort_model, request.filter_model])
+        if key in self._blocks:
+            self._blocks.move_to_end(key)
+            rows, total = self._blocks[key]
+        else:
+            try:
+                result = self.datasource(request)
+                rows, total = await result if isinstance(result, Awaitable) else result
+            except Exception:
+                self.run_method('reject_rows', e.args['request_id'])
+                raise
+            self._blocks[key] = (rows, total)
+            while len(self._blocks) > self.max_cached_blocks:
+                self._blocks.popitem(last=False)
+        self.run_method('resolve_rows', e.args['request_id'], rows, -1 if total is None else total)
+
+    def _assert_row_id(self) -> None:
+        if self.row_id is None:
+            raise ValueError('Row transactions require the `row_id` parameter to identify rows.')
+
+    def _get_row_positions(self, row_data: List[Dict]) -> Dict[Any, int]:
+        if row_data is not self._indexed_rows or len(row_data) != len(self._row_positions):
+            self._indexed_rows = row_data
+            self._row_positions = {row[self.row_id]: i for i, row in enumerate(row_data)}
+            self._row_offset = 0
+        return self._row_positions
+
+    def _find_row(self, row_data: List[Dict], row_id: Any) -> Optional[int]:
+        position = self._get_row_positions(row_data).get(row_id)
+        if position is None:
+            return None
+        index = position - self._row_offset
+        if 0 <= index < len(row_data) and row_data[index][self.row_id] == row_id:
+            return index
+        self._indexed_rows = None  # NOTE: the row data has been changed directly, so it is re-indexed
+        return self._get_row_positions(row_data).get(row_id)
+
+    def _remove_from_row_data(self, row_data: List[Dict], row_ids: Set[Any]) -> None:
+        found = [self._find_row(row_data, row_id) for row_id in row_ids]
+        indices = sorted(index for index in found if index is not None)
+        if not indices:
+            return
+        first, last = indices[0], indices[-1]
+        if last - first + 1 != len(indices):
+            row_data[:] = [row for row in row_data if row[self.row_id] not in row_ids]
+            self._indexed_rows = None
+            return
+        del row_data[first:last + 1]
+        for row_id in row_ids:
+            self._row_positions.pop(row_id, None)
+        if first == 0:
+            self._row_offset += len(indices)  # NOTE: the remaining rows moved to the front
+        elif first != len(row_data):
+            self._indexed_rows = None  # NOTE: the following rows have moved, so they are re-indexed when needed
+
+    def _schedule_transaction(self) -> None:
+        if self._is_transaction_scheduled or core.loop is None or not core.loop.is_running():
+            return
+        self._is_transaction_scheduled = True
+        self.client.outbox.before_next_flush(self._send_transaction)
+
+    def _send_transaction(self) -> None:
+        self._is_transaction_scheduled = False
+        if self.is_deleted or not any(self._transaction.values()):
+            return
+        transaction: Dict[str, Any] = {key: list(rows.values()) for key, rows in self._transaction.items() if rows}
+        if self._transaction['add'] and self._transaction_add_index is not None:
+            transaction['addIndex'] = self._transaction_add_index
+        self._clear_transaction()
+        self._props['transaction_version'] += 1
+        self.client.outbox.enqueue_method_call(self.id, 'apply_transaction',
+                                               [transaction, self._props['transaction_version']], self.client.id)
+
+    def _clear_transaction(self) -> None:
+        for rows in self._transaction.values():
+            rows.clear()
+        self._transaction_add_index = None
+
+    def _to_dict(self) -> Dict[str, Any]:
+        data = super()._to_dict()
+        if any(self._transaction.values()):
+            # NOTE: the row data already contains the pending transaction, which will be sent with the next version
+            data['props'] = {**data['props'], 'transaction_version': self._props['transaction_version'] + 1}
+        return data
+
     def run_grid_method(self, name: str, *args, timeout: float = 1) -> AwaitableResponse:
         """Run an AG Grid API method.
 
@@ -86,9 +86,57 @@ export default {
       }
       return runMethod(this.chart, name, args);
     },
+    append_data(seriesData, maxPoints, version) {
+      if (version > this.data_version) {
+        // NOTE: otherwise the points are already contained in the options
+        seriesData.forEach((data, i) => {
+          const series = this.options.series[i];
+          series.data.push(...data);
+          if (maxPoints !== null && series.data.length > maxPoints) series.data.splice(0, series.data.length - maxPoints);
+        });
+      }
+      if (!this.chart) return; // NOTE: the options will be applied when the chart is mounted
+      this.chart.setOption({ series: this.options.series.map((series) => ({ data: series.data })) });
+    },
+    merge_options(options) {
+      convertDynamicProperties(options, true);
+      mergeOptions(this.options, options); // NOTE: keep the options in sync for later calls of append_data
+      if (!this.chart) return; // NOTE: the options will be applied when the chart is mounted
+      this.chart.setOption(options);
+    },
   },
   props: {
     options: Object,
     enable_3d: Boolean,
+    data_version: Number,
   },
 };
+
+// NOTE: needs to match EChart.merge_options in echart.py
+function mergeOptions(target, source) {
+  for (const [key, value] of Object.entries(source)) {
+    const current = target[key];
+    if (Array.isArray(current) && Array.isArray(value)) {
+      value.forEach((item, i) => {
+        if (i < current.length && isObject(current[i]) && isObject(item)) merge(current[i], item);
+        else if (i < current.length) current[i] = item;
+        else current.push(item);
+      });
+    } else if (isObject(current) && isObject(value)) {
+      merge(current, value);
+    } else {
+      target[key] = value;
+    }
+  }
+}
+
+function merge(target, source) {
+  for (const [key, value] of Object.entries(source)) {
+    if (isObject(target[key]) && isObject(value)) merge(target[key], value);
+    else target[key] = value;
+  }
+}
+
+function isObject(value) {
+  return typeof value === "object" && value !== null && !Array.isArray(value);
+}
@@ -1,4 +1,4 @@
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
 
 from typing_extensions import Self
 
@@ -25,6 +25,7 @@ class EChart(Element, component='echart.js', dependencies=['lib/echarts/echarts.
         An element to create a chart using `ECharts <https://echarts.apache.org/>`_.
         Updates can be pushed to the chart by changing the `options` property.
         After data has changed, call the `update` method to refresh the chart.
+        To only send changes to the client, use the methods `append_data`, `set_series_data` and `merge_options`.
 
         :param options: dictionary of EChart options
         :param on_click_point: callback that is invoked when a point is clicked
@@ -33,6 +34,7 @@ class EChart(Element, component='echart.js', dependencies=['lib/echarts/echarts.
         super().__init__()
         self._props['options'] = options
         self._props['enable_3d'] = enable_3d or any('3D' in key for key in options)
+        self._props['data_version'] = 0  # NOTE: number of appends, used by the client to skip points it already received
         self._classes.append('nicegui-echart')
 
         if on_point_click:
@@ -99,6 +101,57 @@ class EChart(Element, component='echart.js', dependencies=['lib/echarts/echarts.
         super().update()
         self.run_method('update_chart')
 
+    def append_data(self, data: Union[List[List[Any]], Dict[int, List[Any]]], *, max_points: Optional[int] = None) -> None:
+        """Append data points to the series without sending the whole options to the client.
+
+        :param data: list of new data points per series or dictionary mapping series indices to new data points
+        :param max_points: maximum number of data points per series; older points are removed (default: `None`)
+        """
+        series_list = self.options['series']
+        series_data = data if isinstance(data, list) else [data.get(i, []) for i in range(len(series_list))]
+        for series, points in zip(series_list, series_data):
+            series_points = series.setdefault('data', [])
+            series_points.extend(points)
+            if max_points is not None and len(series_points) > max_points:
+                del series_points[:-max_points]
+        self._props['data_version'] += 1
+        self.run_method('append_data', series_data, max_points, self._props['data_version'])
+
+    def set_series_data(self, index: int, data: List[Any], *, max_points: Optional[int] = None) -> None:
+        """Replace the data of a single series and only send this series to the client.
+
+        :param index: index of the series
+        :param data: list of data points (values or [x, y] pairs)
+        :param max_points: downsample the data to this number of points using the LTTB algorithm (default: `None`)
+        """
+        if max_points is not None:
+            data = lttb(data, max_points)
+        self.merge_options({'series': [{'data': data} if i == index else {} for i in range(index + 1)]})
+
+    def merge_options(self, options: Dict) -> None:
+        """Merge partial options into the options and only send them to the client.
+
+        Like ECharts' `setOption <https://echarts.apache.org/en/api.html#echartsInstance.setOption>`_ in merge mode,
+        lists of components like "series" are merged by index, other lists are replaced.
+
+        :param options: partial options
+        """
+        for key, value in options.items():
+            current = self.options.get(key)
+            if isinstance(current, list) and isinstance(value, list):
+                for i, item in enumerate(value):
+                    if i < len(current) and isinstance(current[i], dict) and isinstance(item, dict):
+                        _merge(current[i], item)
+                    elif i < len(current):
+                        current[i] = item
+                    else:
+                        current.append(item)
+            elif isinstance(current, dict) and isinstance(value, dict):
+                _merge(current, value)
+            else:
+                self.options[key] = value
+        self.run_method('merge_options', options)
+
     def run_chart_method(self, name: str, *args, timeout: float = 1) -> AwaitableResponse:
         """Run a method of the JSONEditor instance.
 
@@ -114,3 +167,54 @@ class EChart(Element, component='echart.js', dependencies=['lib/echarts/echarts.
         :return: AwaitableResponse that can be awaited to get the result of the method call
         """
         return self.run_method('run_chart_method', name, *args, timeout=timeout)
+
+
+def _merge(target: Dict, source: Dict) -> None:
+    for key, value in source.items():
+        if isinstance(target.get(key), dict) and isinstance(value, dict):
+            _merge(target[key], value)
+        else:
+            target[key] = value
+
+
+def lttb(data: List[Any], threshold: int) -> List[Any]:
+    """Downsample data points using the Largest-Triangle-Three-Buckets algorithm.
+
+    The algorithm keeps the first and the last point and picks one point per bucket in between,
+    which forms the largest triangle with the previously picked point and the average of the next bucket.
+    This preserves the visual shape of the series much better than picking every n-th point.
+    See https://skemman.is/handle/1946/15343 for details.
+
+    :param data: list of data points (values with their index as x or [x, y] pairs)
+    :param threshold: number of data points to keep
+    :return: list of picked data points
+    """
+    n = len(data)
+    if threshold >= n or threshold < 3:
+        return list(data) if threshold >= n else [data[0], data[-1]][:max(threshold, 0)]
+    xs: List[float] = []
+    ys: List[float] = []
+    for i, point in enumerate(data):
+        x, y = point if isinstance(point, (list, tuple)) else (i, point)
+        xs.append(x if isinstance(x, (int, float)) else i)
+        ys.append(y if isinstance(y, (int, float)) else 0.0)
+
+    picked = [data[0]]
+    bucket_size = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        next_start = int((i + 1) * bucket_size) + 1
+        next_end = min(int((i + 2) * bucket_size) + 1, n)
+        avg_x = sum(xs[next_start:next_end]) / (next_end - next_start)
+        avg_y = sum(ys[next_start:next_end]) / (next_end - next_start)
+        max_area = -1.0
+        next_a = a
+        for j in range(int(i * bucket_size) + 1, next_start):
+            area = abs((xs[a] - avg_x) * (ys[j] - ys[a]) - (xs[a] - xs[j]) * (avg_y - ys[a]))
+            if area > max_area:
+                max_area = area
+                next_a = j
+        picked.append(data[next_a])
+        a = next_a
+    picked.append(data[-1])
+    return picked
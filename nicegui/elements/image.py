@@ -2,12 +2,14 @@ import base64
 import io
 import time
 from pathlib import Path
-from typing import Union
+from typing import Any, Union
 
 from .. import optional_features
+from ..image_cache import image_cache
 from .mixins.source_element import SourceElement
 
 try:
+    import PIL.Image
     from PIL.Image import Image as PIL_Image
     optional_features.register('pillow')
 except ImportError:
@@ -17,22 +19,25 @@ except ImportError:
 class Image(SourceElement, component='image.js'):
     PIL_CONVERT_FORMAT = 'PNG'
 
-    def __init__(self, source: Union[str, Path, 'PIL_Image'] = '') -> None:
+    def __init__(self, source: Union[str, Path, 'PIL_Image', Any] = '') -> None:
         """Image
 
         Displays an image.
         This element is based on Quasar's `QImg <https://quasar.dev/vue-components/img>`_ component.
 
-        :param source: the source of the image; can be a URL, local file path, a base64 string or a PIL image
+        PIL images and NumPy arrays are served from an in-memory cache under a URL containing a hash of the image data,
+        so that the browser can cache them and updates only need to send a short URL.
+
+        :param source: the source of the image; can be a URL, local file path, a base64 string, a PIL image or a NumPy array
         """
-        super().__init__(source=source)
+        super().__init__(source=array_to_pil(source))
 
-    def set_source(self, source: Union[str, Path, 'PIL_Image']) -> None:
-        return super().set_source(source)
+    def set_source(self, source: Union[str, Path, 'PIL_Image', Any]) -> None:
+        return super().set_source(array_to_pil(source))
 
-    def _set_props(self, source: Union[str, Path, 'PIL_Image']) -> None:
-        if optional_features.has('pillow') and isinstance(source, PIL_Image):
-            source = pil_to_base64(source, self.PIL_CONVERT_FORMAT)
+    def _set_props(self, source: Union[str, Path, 'PIL_Image', Any]) -> None:
+        if optional_features.has('pillow'):
+            source = image_to_url(source, self.PIL_CONVERT_FORMAT)
         super()._set_props(source)
 
     def force_reload(self) -> None:
@@ -41,6 +46,30 @@ class Image(SourceElement, component='image.js'):
         self.update()
 
 
+def array_to_pil(source: Any) -> Any:
+    """Convert a NumPy array to a PIL image (or return other sources unchanged).
+
+    NOTE: arrays can't be used as value of a bindable property because they can't be compared with `!=`.
+    """
+    if optional_features.has('pillow') and hasattr(source, '__array_interface__') and not isinstance(source, PIL_Image):
+        return PIL.Image.fromarray(source)
+    return source
+
+
+def image_to_url(source: Any, image_format: str) -> Any:
+    """Add a PIL image to the image cache and return its URL (or return other sources unchanged).
+
+    :param source: the image source
+    :param image_format: the image format
+    :return: the URL of the cached image or the original source
+    """
+    if not isinstance(source, PIL_Image):
+        return source
+    buffer = io.BytesIO()
+    source.save(buffer, image_format)
+    return image_cache.add(buffer.getvalue(), f'image/{image_format.lower()}')
+
+
 def pil_to_base64(pil_image: 'PIL_Image', image_format: str) -> str:
     """Convert a PIL image to a base64 string which can be used as image source.
 
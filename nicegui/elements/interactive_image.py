@@ -8,7 +8,7 @@ from typing_extensions import Self
 
 from .. import optional_features
 from ..events import GenericEventArguments, MouseEventArguments, handle_event
-from .image import pil_to_base64
+from .image import array_to_pil, image_to_url
 from .mixins.content_element import ContentElement
 from .mixins.source_element import SourceElement
 
@@ -49,14 +49,14 @@ class InteractiveImage(SourceElement, ContentElement, component='interactive_ima
         You can also pass a tuple of width and height instead of an image source.
         This will create an empty image with the given size.
 
-        :param source: the source of the image; can be an URL, local file path, a base64 string or just an image size
+        :param source: the source of the image; can be an URL, local file path, a base64 string, a PIL image, a NumPy array or just an image size
         :param content: SVG content which should be overlaid; viewport has the same dimensions as the image
         :param size: size of the image (width, height) in pixels; only used if `source` is not set
         :param on_mouse: callback for mouse events (contains image coordinates `image_x` and `image_y` in pixels)
         :param events: list of JavaScript events to subscribe to (default: `['click']`)
         :param cross: whether to show crosshairs or a color string (default: `False`)
         """
-        super().__init__(source=source, content=content)
+        super().__init__(source=array_to_pil(source), content=content)
         self._props['events'] = events[:]
         self._props['cross'] = cross
         self._props['size'] = size
@@ -65,7 +65,7 @@ class InteractiveImage(SourceElement, ContentElement, component='interactive_ima
             self.on_mouse(on_mouse)
 
     def set_source(self, source: Union[str, Path, 'PIL_Image']) -> None:  # noqa: UP037
-        return super().set_source(source)
+        return super().set_source(array_to_pil(source))
 
     def on_mouse(self, on_mouse: Callable[..., Any]) -> Self:
         """Add a callback to be invoked when a mouse event occurs."""
@@ -89,8 +89,8 @@ class InteractiveImage(SourceElement, ContentElement, component='interactive_ima
         return self
 
     def _set_props(self, source: Union[str, Path, 'PIL_Image']) -> None:  # noqa: UP037
-        if optional_features.has('pillow') and isinstance(source, PIL_Image):
-            source = pil_to_base64(source, self.PIL_CONVERT_FORMAT)
+        if optional_features.has('pillow'):
+            source = image_to_url(source, self.PIL_CONVERT_FORMAT)
         super()._set_props(source)
 
     def force_reload(self) -> None:
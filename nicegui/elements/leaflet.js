@@ -23,6 +23,7 @@ export default {
         loadResource(window.path_prefix + `${this.resource_path}/leaflet-draw/leaflet.draw.js`),
       ]);
     }
+    this.layers = new Map();
     this.map = L.map(this.$el, {
       ...this.options,
       center: this.center,
@@ -73,6 +74,7 @@ export default {
           sourceTarget: undefined,
           center: [e.target.getCenter().lat, e.target.getCenter().lng],
           zoom: e.target.getZoom(),
+          bounds: this.get_bounds(),
         });
       });
     }
@@ -120,7 +122,7 @@ export default {
     }
     const connectInterval = setInterval(async () => {
       if (window.socket.id === undefined) return;
-      this.$emit("init", { socket_id: window.socket.id });
+      this.$emit("init", { socket_id: window.socket.id, bounds: this.get_bounds() });
       clearInterval(connectInterval);
     }, 100);
   },
@@ -128,16 +130,56 @@ export default {
     this.map?.setView(this.center, this.zoom);
   },
   methods: {
+    get_bounds() {
+      const bounds = this.map.getBounds();
+      return [
+        [bounds.getSouth(), bounds.getWest()],
+        [bounds.getNorth(), bounds.getEast()],
+      ];
+    },
     add_layer(layer, id) {
-      const l = L[layer.type](...layer.args);
+      this.remove_layer(id); // NOTE: the layer might have been sent again, e.g. after a reconnect
+      const l = layer.type === "markers" ? L.layerGroup() : L[layer.type](...layer.args);
       l.id = id;
       l.addTo(this.map);
+      this.layers.set(id, l);
+      if (layer.type === "markers") {
+        l.markerOptions = layer.args[0];
+        l.markers = new Map();
+        this.update_markers(id, layer.ids, layer.latlngs, []);
+      }
+    },
+    update_markers(id, ids, latlngs, removed_ids) {
+      const group = this.layers.get(id);
+      if (!group) return;
+      for (const marker_id of removed_ids) {
+        const marker = group.markers.get(marker_id);
+        if (!marker) continue;
+        group.removeLayer(marker);
+        group.markers.delete(marker_id);
+      }
+      ids.forEach((marker_id, i) => {
+        const latlng = [latlngs[2 * i], latlngs[2 * i + 1]];
+        const marker = group.markers.get(marker_id);
+        if (marker) {
+          marker.setLatLng(latlng);
+        } else {
+          const newMarker = L.marker(latlng, group.markerOptions);
+          newMarker.id = marker_id;
+          group.markers.set(marker_id, newMarker);
+          group.addLayer(newMarker);
+        }
+      });
     },
     remove_layer(id) {
-      this.map.eachLayer((layer) => layer.id === id && this.map.removeLayer(layer));
+      const layer = this.layers.get(id);
+      if (!layer) return;
+      this.map.removeLayer(layer);
+      this.layers.delete(id);
     },
     clear_layers() {
       this.map.eachLayer((layer) => this.map.removeLayer(layer));
+      this.layers.clear();
     },
     run_map_method(name, ...args) {
       if (name.startsWith(":")) {
@@ -147,16 +189,13 @@ export default {
       return runMethod(this.map, name, args);
     },
     run_layer_method(id, name, ...args) {
-      let result = null;
-      this.map.eachLayer((layer) => {
-        if (layer.id !== id) return;
-        if (name.startsWith(":")) {
-          name = name.slice(1);
-          args = args.map((arg) => new Function(`return (${arg})`)());
-        }
-        result = runMethod(layer, name, args);
-      });
-      return result;
+      const layer = this.layers.get(id);
+      if (!layer) return null;
+      if (name.startsWith(":")) {
+        name = name.slice(1);
+        args = args.map((arg) => new Function(`return (${arg})`)());
+      }
+      return runMethod(layer, name, args);
     },
   },
 };
@@ -1,6 +1,6 @@
 import asyncio
 from pathlib import Path
-from typing import Any, Dict, List, Tuple, Union, cast
+from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from typing_extensions import Self
 
@@ -14,7 +14,9 @@ from .leaflet_layer import Layer
 class Leaflet(Element, component='leaflet.js'):
     # pylint: disable=import-outside-toplevel
     from .leaflet_layers import GenericLayer as generic_layer
+    from .leaflet_layers import GeoJson as geo_json
     from .leaflet_layers import Marker as marker
+    from .leaflet_layers import Markers as markers
     from .leaflet_layers import TileLayer as tile_layer
 
     center = binding.BindableProperty(lambda sender, value: cast(Leaflet, sender).set_center(value))
@@ -44,6 +46,8 @@ class Leaflet(Element, component='leaflet.js'):
 
         self.layers: List[Layer] = []
         self.is_initialized = False
+        # NOTE: visible area ((south, west), (north, east)) as last reported by the client
+        self.bounds: Optional[Tuple[Tuple[float, float], Tuple[float, float]]] = None
 
         self.center = center
         self.zoom = zoom
@@ -74,9 +78,11 @@ class Leaflet(Element, component='leaflet.js'):
 
     def _handle_init(self, e: GenericEventArguments) -> None:
         self.is_initialized = True
+        self._set_bounds(e.args.get('bounds'))
         with self.client.individual_target(e.args['socket_id']):
             for layer in self.layers:
                 self.run_method('add_layer', layer.to_dict(), layer.id)
+                layer._handle_add(e.args['socket_id'])  # pylint: disable=protected-access
 
     async def initialized(self) -> None:
         """Wait until the map is initialized."""
@@ -85,7 +91,15 @@ class Leaflet(Element, component='leaflet.js'):
         await self.client.connected()
         await event.wait()
 
+    def _set_bounds(self, bounds: Optional[List[List[float]]]) -> None:
+        if bounds is None:
+            return
+        self.bounds = ((bounds[0][0], bounds[0][1]), (bounds[1][0], bounds[1][1]))
+        for layer in self.layers:
+            layer._handle_bounds_change()  # pylint: disable=protected-access
+
     async def _handle_moveend(self, e: GenericEventArguments) -> None:
+        self._set_bounds(e.args.get('bounds'))
         await asyncio.sleep(0.02)  # NOTE: wait for zoom to be updated as well
         self.center = e.args['center']
 
@@ -24,11 +24,20 @@ class Layer:
         self.leaflet = self.current_leaflet
         self.leaflet.layers.append(self)
         self.leaflet.run_method('add_layer', self.to_dict(), self.id)
+        if self.leaflet.is_initialized:
+            client = self.leaflet.client
+            self._handle_add(client._temporary_socket_id or client.id)  # pylint: disable=protected-access
 
     @abstractmethod
     def to_dict(self) -> dict:
         """Return a dictionary representation of the layer."""
 
+    def _handle_add(self, target_id: str) -> None:
+        """Called after the layer has been sent to the given target (a client or a single socket)."""
+
+    def _handle_bounds_change(self) -> None:
+        """Called when the map reports new bounds."""
+
     def run_method(self, name: str, *args: Any, timeout: float = 1) -> AwaitableResponse:
         """Run a method of the Leaflet layer.
 
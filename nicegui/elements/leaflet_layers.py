@@ -1,11 +1,14 @@
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 from typing_extensions import Self
 
 from ..dataclasses import KWONLY_SLOTS
 from .leaflet_layer import Layer
 
+VIEWPORT_PADDING = 0.5
+"""Fraction of the viewport size by which the culling area is extended in each direction."""
+
 
 @dataclass(**KWONLY_SLOTS)
 class GenericLayer(Layer):
@@ -55,3 +58,201 @@ class Marker(Layer):
         """
         self.latlng = (lat, lng)
         self.run_method('setLatLng', (lat, lng))
+
+
+@dataclass(**KWONLY_SLOTS)
+class Markers(Layer):
+    positions: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    options: Dict = field(default_factory=dict)
+    viewport_culling: bool = False
+    _changed_ids: Dict[str, None] = field(init=False, default_factory=dict)
+    _sent_ids: Set[str] = field(init=False, default_factory=set)
+    _needs_culling: bool = field(init=False, default=False)
+    _is_flush_scheduled: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        self.positions = dict(self.positions)
+        Layer.__post_init__(self)  # NOTE: zero-argument super() does not work with slotted dataclasses
+
+    def to_dict(self) -> Dict:
+        area = self._get_visible_area()
+        visible = {marker_id: latlng for marker_id, latlng in self.positions.items() if _contains(area, latlng)}
+        self._sent_ids = set(visible)  # NOTE: the dictionary is only created when sending the layer to the client
+        return {
+            'type': 'markers',
+            'args': [self.options],
+            'ids': list(visible),
+            'latlngs': [value for latlng in visible.values() for value in latlng],
+        }
+
+    def add(self, positions: Dict[str, Tuple[float, float]]) -> None:
+        """Add markers or move existing ones.
+
+        All changes made before the next update cycle are sent to the client in a single message.
+
+        :param positions: dictionary mapping marker IDs to their latitude/longitude
+        """
+        self.positions.update(positions)
+        self._mark_changed(positions)
+
+    def move(self, positions: Dict[str, Tuple[float, float]]) -> None:
+        """Move existing markers to new positions.
+
+        :param positions: dictionary mapping marker IDs to their new latitude/longitude
+        """
+        for marker_id in positions:
+            if marker_id not in self.positions:
+                raise KeyError(f'Marker "{marker_id}" does not exist')
+        self.add(positions)
+
+    def remove(self, ids: Iterable[str]) -> None:
+        """Remove markers.
+
+        :param ids: IDs of the markers to remove
+        """
+        ids = list(ids)
+        for marker_id in ids:
+            self.positions.pop(marker_id, None)
+        self._mark_changed(ids)
+
+    def clear(self) -> None:
+        """Remove all markers."""
+        self.remove(list(self.positions))
+
+    def _mark_changed(self, ids: Iterable[str]) -> None:
+        if not self.leaflet.is_initialized:
+            return  # NOTE: all markers will be sent when the map is initialized
+        self._changed_ids.update(dict.fromkeys(ids))
+        self._schedule_flush()
+
+    def _handle_bounds_change(self) -> None:
+        if self.viewport_culling and self.leaflet.is_initialized:
+            self._needs_culling = True
+            self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if not self._is_flush_scheduled:
+            self._is_flush_scheduled = True
+            # NOTE: layers are unhashable dataclasses, so their bound methods can't be registered directly
+            self.leaflet.client.outbox.before_next_flush(lambda: self._flush())  # pylint: disable=unnecessary-lambda
+
+    def _flush(self) -> None:
+        """Send all markers that have been added, moved or removed or that entered or left the visible area."""
+        self._is_flush_scheduled = False
+        changed_ids, self._changed_ids = self._changed_ids, {}
+        needs_culling, self._needs_culling = self._needs_culling, False
+        if not any(layer is self for layer in self.leaflet.layers):
+            return
+        area = self._get_visible_area()
+        ids: List[str] = []
+        latlngs: List[float] = []
+        removed_ids: List[str] = []
+        for marker_id in changed_ids:
+            latlng = self.positions.get(marker_id)
+            if latlng is not None and _contains(area, latlng):
+                ids.append(marker_id)
+                latlngs.extend(latlng)
+                self._sent_ids.add(marker_id)
+            elif marker_id in self._sent_ids:
+                removed_ids.append(marker_id)
+                self._sent_ids.discard(marker_id)
+        if needs_culling:
+            for marker_id, latlng in self.positions.items():
+                if marker_id in changed_ids:
+                    continue
+                is_visible = _contains(area, latlng)
+                if is_visible and marker_id not in self._sent_ids:
+                    ids.append(marker_id)
+                    latlngs.extend(latlng)
+                    self._sent_ids.add(marker_id)
+                elif not is_visible and marker_id in self._sent_ids:
+                    removed_ids.append(marker_id)
+                    self._sent_ids.discard(marker_id)
+        if ids or removed_ids:
+            self.leaflet.run_method('update_markers', self.id, ids, latlngs, removed_ids)
+
+    def _get_visible_area(self) -> Optional[Tuple[float, float, float, float]]:
+        if not self.viewport_culling or self.leaflet.bounds is None:
+            return None
+        if self.leaflet.client.shared:
+            return None  # NOTE: the browsers of a shared page have different viewports but share a single map element
+        (south, west), (north, east) = self.leaflet.bounds
+        lat_padding = (north - south) * VIEWPORT_PADDING
+        lng_padding = (east - west) * VIEWPORT_PADDING
+        return south - lat_padding, west - lng_padding, north + lat_padding, east + lng_padding
+
+
+@dataclass(**KWONLY_SLOTS)
+class GeoJson(Layer):
+    data: Union[Dict, List[Dict]] = field(default_factory=list)
+    options: Dict = field(default_factory=dict)
+    chunk_size: int = 1000
+    features: List[Dict] = field(init=False, default_factory=list)
+    _sent_count: int = field(init=False, default=0)
+    _is_streaming: bool = field(init=False, default=False)
+    _needs_clear: bool = field(init=False, default=False)
+    _is_flush_scheduled: bool = field(init=False, default=False)
+
+    def __post_init__(self) -> None:
+        self.features = _get_features(self.data)
+        Layer.__post_init__(self)  # NOTE: zero-argument super() does not work with slotted dataclasses
+
+    def to_dict(self) -> Dict:
+        return {
+            'type': 'geoJSON',
+            'args': [None, self.options],
+        }
+
+    def add_data(self, data: Union[Dict, List[Dict]]) -> None:
+        """Add features to the layer.
+
+        Like the initial data, the features are streamed to the client in chunks.
+
+        :param data: GeoJSON feature collection, single feature or list of features
+        """
+        self.features.extend(_get_features(data))
+        if self._is_streaming:
+            self._schedule_flush()
+
+    def _handle_add(self, target_id: str) -> None:
+        # NOTE: features are streamed to all browsers of the client, which start over when one of them (re)connects
+        self._needs_clear = self._sent_count > 0
+        self._sent_count = 0
+        self._is_streaming = True
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if not self._is_flush_scheduled:
+            self._is_flush_scheduled = True
+            # NOTE: layers are unhashable dataclasses, so their bound methods can't be registered directly
+            self.leaflet.client.outbox.before_next_flush(lambda: self._flush())  # pylint: disable=unnecessary-lambda
+
+    def _flush(self) -> None:
+        """Send the next chunk of features and schedule the following one."""
+        self._is_flush_scheduled = False
+        if not any(layer is self for layer in self.leaflet.layers):
+            return
+        if self._needs_clear:
+            self._needs_clear = False
+            self.run_method('clearLayers')
+        chunk = self.features[self._sent_count:self._sent_count + self.chunk_size]
+        if chunk:
+            self.run_method('addData', {'type': 'FeatureCollection', 'features': chunk})
+            self._sent_count += len(chunk)
+        if self._sent_count < len(self.features):
+            self._schedule_flush()
+
+
+def _contains(area: Optional[Tuple[float, float, float, float]], latlng: Tuple[float, float]) -> bool:
+    if area is None:
+        return True
+    south, west, north, east = area
+    return south <= latlng[0] <= north and west <= latlng[1] <= east
+
+
+def _get_features(data: Union[Dict, List[Dict]]) -> List[Dict]:
+    if isinstance(data, list):
+        return list(data)
+    if data.get('type') == 'FeatureCollection':
+        return list(data.get('features', []))
+    return [data]
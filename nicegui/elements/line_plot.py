@@ -1,7 +1,17 @@
-from typing import Any, List
+from __future__ import annotations
 
+import importlib.util
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from typing_extensions import Self
+
+from ..element import Element
+from .echart import EChart
 from .pyplot import Pyplot
 
+if TYPE_CHECKING:
+    import numpy as np
+
 
 class LinePlot(Pyplot):
 
@@ -10,6 +20,7 @@ class LinePlot(Pyplot):
                  limit: int = 100,
                  update_every: int = 1,
                  close: bool = True,
+                 streaming: bool = False,
                  **kwargs: Any,
                  ) -> None:
         """Line Plot
@@ -17,29 +28,132 @@ class LinePlot(Pyplot):
         Create a line plot using pyplot.
         The `push` method provides live updating when utilized in combination with `ui.timer`.
 
+        In streaming mode the plot is rendered in the browser with `ECharts <https://echarts.apache.org/>`_ instead
+        and only new data points are sent to the client, which allows for high-frequency updates.
+        There is no Matplotlib figure in streaming mode, so `fig` is not available.
+
         :param n: number of lines
         :param limit: maximum number of datapoints per line (new points will displace the oldest)
         :param update_every: update plot only after pushing new data multiple times to save CPU and bandwidth
         :param close: whether the figure should be closed after exiting the context; set to `False` if you want to update it later (default: `True`)
+        :param streaming: whether to render the plot in the browser and only send new data points (default: `False`)
         :param kwargs: arguments like `figsize` which should be passed to `pyplot.figure <https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.figure.html>`_
         """
-        super().__init__(close=close, **kwargs)
+        if streaming:
+            if importlib.util.find_spec('numpy') is None:
+                raise ImportError('NumPy is not installed. Please run "pip install numpy".')
+            Element.__init__(self, 'div')  # pylint: disable=non-parent-init-called
+            self._classes.append('nicegui-line-plot')
+            self.close = close
+        else:
+            super().__init__(close=close, **kwargs)
 
-        self.x: List[float] = []
-        self.Y: List[List[float]] = [[] for _ in range(n)]
-        self.lines = [self.fig.gca().plot([], [])[0] for _ in range(n)]
-        self.slice = slice(0 if limit is None else -limit, None)
+        self.limit = limit
+        self.streaming = streaming
+        self._x_buffer: Optional[RingBuffer] = None  # NOTE: created on first push when the type of x values is known
+        self._y_buffer = RingBuffer(n, limit)
+        self._total = 0  # NOTE: number of pushed data points, used by the client to skip points it already received
+        self._unsent = 0
+        self.lines = [] if streaming else [self.fig.gca().plot([], [])[0] for _ in range(n)]
         self.update_every = update_every
         self.push_counter = 0
+        self.chart: Optional[EChart] = None
+        if streaming:
+            with self.default_slot:
+                self.chart = _StreamingChart(self, {
+                    'animation': False,
+                    'xAxis': {'type': 'value', 'scale': True},
+                    'yAxis': {'type': 'value', 'scale': True},
+                    'series': [{'type': 'line', 'showSymbol': False, 'data': []} for _ in range(n)],
+                }).classes('w-full h-full')
+
+    def __enter__(self) -> Self:
+        if self.streaming:
+            return Element.__enter__(self)
+        return super().__enter__()
+
+    def __exit__(self, *_) -> None:
+        if self.streaming:
+            Element.__exit__(self, *_)
+        else:
+            super().__exit__(*_)
+
+    async def rendered(self) -> None:
+        if not self.streaming:
+            await super().rendered()
+
+    @property
+    def x(self) -> List[Any]:
+        """The x values of the plot.
+
+        Assigning new values replaces the x values (keeping at most `limit` values);
+        call `update` or push new data to redraw the plot.
+        """
+        return [] if self._x_buffer is None else self._x_buffer.view()[:, 0].tolist()
+
+    @x.setter
+    def x(self, x: List[Any]) -> None:
+        x_values = self._to_x_values(x)
+        if self._x_buffer is not None:
+            self._x_buffer.clear()
+        self._extend_x(x_values)
+        self._handle_data_replaced()
+
+    @property
+    def Y(self) -> List[List[float]]:  # pylint: disable=invalid-name
+        """The y values of the plot (one list per line).
+
+        Assigning new values replaces the y values (keeping at most `limit` values per line);
+        call `update` or push new data to redraw the plot.
+        """
+        return self._y_buffer.view().T.tolist()
+
+    @Y.setter
+    def Y(self, Y: List[List[float]]) -> None:  # pylint: disable=invalid-name
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        self._y_buffer.clear()
+        self._y_buffer.extend(np.asarray(Y, dtype=float).reshape(self._y_buffer.columns, -1).T)
+        self._handle_data_replaced()
+
+    @staticmethod
+    def _to_x_values(x: List[Any]) -> np.ndarray:
+        """Convert x values into floats or, for datetime objects, into datetime64 values."""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        x_values = np.asarray(x)
+        if x_values.dtype == object or np.issubdtype(x_values.dtype, np.datetime64):
+            return x_values.astype('datetime64[us]')
+        return x_values.astype(float)  # NOTE: always use floats so that later fractional values are not truncated
+
+    def _extend_x(self, x_values: np.ndarray) -> None:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        if self._x_buffer is None:
+            self._x_buffer = RingBuffer(1, self.limit, dtype=x_values.dtype)
+            if self.chart is not None and np.issubdtype(x_values.dtype, np.datetime64):
+                self.chart.options['xAxis']['type'] = 'time'
+                self.chart.update()
+        self._x_buffer.extend(x_values[:, np.newaxis])
+
+    def _handle_data_replaced(self) -> None:
+        self._unsent = 0
+        if self.chart is not None:
+            self.chart.update()
 
     def with_legend(self, titles: List[str], **kwargs: Any):
         """Add a legend to the plot.
 
         :param titles: list of titles for the lines
         :param kwargs: additional arguments which should be passed to `pyplot.legend <https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.legend.html>`_
+            (or to the `ECharts legend <https://echarts.apache.org/en/option.html#legend>`_ in streaming mode)
         """
+        if self.chart is not None:
+            for series, title in zip(self.chart.options['series'], titles):
+                series['name'] = title
+            self.chart.options['legend'] = {'data': titles, **kwargs}
+            self.chart.update()
+            return self
         self.fig.gca().legend(titles, **kwargs)
-        self._convert_to_html()
+        if self._convert_to_html():
+            self.update()
         return self
 
     def push(self, x: List[float], Y: List[List[float]]) -> None:
@@ -48,38 +162,134 @@ class LinePlot(Pyplot):
         :param x: list of x values
         :param Y: list of lists of y values (one list per line)
         """
+        import numpy as np  # pylint: disable=import-outside-toplevel
         self.push_counter += 1
 
-        self.x = [*self.x, *x][self.slice]
-        for i in range(len(self.lines)):
-            self.Y[i] = [*self.Y[i], *Y[i]][self.slice]
+        x_values = self._to_x_values(x)
+        self._extend_x(x_values)
+        self._y_buffer.extend(np.asarray(Y, dtype=float).T)
+        self._total += len(x_values)
+        self._unsent += len(x_values)
 
         if self.push_counter % self.update_every != 0:
             return
 
+        x_data = self._x_buffer.view()[:, 0]
+        y_data = self._y_buffer.view()
+        if self.chart is not None:
+            count = min(self._unsent, len(x_data))
+            self._unsent = 0
+            self.chart.run_method('append_data', _to_series(x_data[len(x_data) - count:], y_data[len(y_data) - count:]),
+                                  self.limit, self._total)
+            return
+
+        x_data = x_data.copy()  # NOTE: the ring buffers keep changing until the figure is rendered
         for i, line in enumerate(self.lines):
-            line.set_xdata(self.x)
-            line.set_ydata(self.Y[i])
-
-        flat_y = [y_i for y in self.Y for y_i in y]
-        min_x = min(self.x)
-        max_x = max(self.x)
-        min_y = min(flat_y)
-        max_y = max(flat_y)
-        pad_x = 0.01 * (max_x - min_x)
-        pad_y = 0.01 * (max_y - min_y)
-        self.fig.gca().set_xlim(min_x - pad_x, max_x + pad_x)
-        self.fig.gca().set_ylim(min_y - pad_y, max_y + pad_y)
-        self._convert_to_html()
-        self.update()
+            line.set_xdata(x_data)
+            line.set_ydata(y_data[:, i].copy())
+
+        if len(x_data):
+            min_x, max_x = np.min(x_data), np.max(x_data)
+            min_y, max_y = np.nanmin(y_data), np.nanmax(y_data)
+            pad_x = 0.01 * (max_x - min_x)
+            pad_y = 0.01 * (max_y - min_y)
+            self.fig.gca().set_xlim(min_x - pad_x, max_x + pad_x)
+            self.fig.gca().set_ylim(min_y - pad_y, max_y + pad_y)
+        if self._convert_to_html():
+            self.update()
+
+    def _series(self) -> List[List[List[float]]]:
+        if self._x_buffer is None:
+            return [[] for _ in range(self._y_buffer.view().shape[1])]
+        return _to_series(self._x_buffer.view()[:, 0], self._y_buffer.view())
 
     def clear(self) -> None:
         """Clear the line plot."""
+        if self._x_buffer is not None:
+            self._x_buffer.clear()
+        self._y_buffer.clear()
+        self._unsent = 0
+        if self.chart is not None:
+            self.chart.update()
+            return
         super().clear()
-        self.x.clear()
-        for y in self.Y:
-            y.clear()
         for line in self.lines:
             line.set_data([], [])
-        self._convert_to_html()
-        self.update()
+        if self._convert_to_html():
+            self.update()
+
+
+class RingBuffer:
+
+    def __init__(self, columns: int, capacity: Optional[int], *, dtype: Any = float) -> None:
+        """A preallocated NumPy buffer holding the last `capacity` rows (or all rows if `capacity` is `None`).
+
+        The rows are kept contiguous so that `view` does not need to copy them.
+        To this end the buffer allocates twice the capacity and moves the retained rows to the front when it is full.
+        """
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        self.capacity = capacity
+        self._data = np.empty((2 * capacity if capacity else 1024, columns), dtype=dtype)
+        self._start = 0
+        self._end = 0
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def columns(self) -> int:
+        """The number of columns."""
+        return self._data.shape[1]
+
+    def view(self) -> np.ndarray:
+        """Return the rows in chronological order (without copying)."""
+        return self._data[self._start:self._end]
+
+    def extend(self, rows: np.ndarray) -> None:
+        """Append the given rows, dropping the oldest ones if the capacity is exceeded."""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        if self.capacity is not None:
+            rows = rows[len(rows) - min(len(rows), self.capacity):]
+        count = len(rows)
+        if self._end + count > len(self._data):
+            keep_from = self._start if self.capacity is None else max(self._start, self._end + count - self.capacity)
+            kept = self._data[keep_from:self._end]
+            size = len(self._data) if self.capacity is not None else max(2 * len(self._data), 2 * (len(kept) + count))
+            data = np.empty((size, self._data.shape[1]), dtype=self._data.dtype)
+            data[:len(kept)] = kept
+            self._data = data
+            self._start = 0
+            self._end = len(kept)
+        self._data[self._end:self._end + count] = rows
+        self._end += count
+        if self.capacity is not None:
+            self._start = max(self._start, self._end - self.capacity)
+
+    def clear(self) -> None:
+        """Remove all rows."""
+        self._start = 0
+        self._end = 0
+
+
+class _StreamingChart(EChart):
+
+    def __init__(self, line_plot: LinePlot, options: Dict) -> None:
+        super().__init__(options)
+        self.line_plot = line_plot
+
+    def _to_dict(self) -> Dict[str, Any]:
+        data = super()._to_dict()
+        series_data = self.line_plot._series()  # pylint: disable=protected-access
+        options = {**self.options, 'series': [{**series, 'data': series_data[i]}
+                                              for i, series in enumerate(self.options['series'])]}
+        data['props'] = {**data['props'], 'options': options, 'data_version': self.line_plot._total}  # pylint: disable=protected-access
+        return data
+
+
+def _to_series(x: np.ndarray, y: np.ndarray) -> List[List[List[float]]]:
+    """Convert x values and rows of y values into a list of [x, y] pairs per line."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+    if np.issubdtype(x.dtype, np.datetime64):
+        x = x.astype('datetime64[ms]').astype(float)  # NOTE: ECharts expects timestamps in milliseconds
+    x = x.astype(float)
+    return [np.column_stack([x, y[:, i]]).tolist() for i in range(y.shape[1])]
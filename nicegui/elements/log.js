@@ -0,0 +1,34 @@
+export default {
+  template: `<div><slot></slot><div v-for="(line, i) in streamedLines" :key="streamedTotal - streamedLines.length + i">{{ line }}</div></div>`,
+  props: {
+    lines: Array,
+    total: Number,
+  },
+  data() {
+    return {
+      streamedLines: [...(this.lines || [])],
+      streamedTotal: this.total || 0,
+    };
+  },
+  watch: {
+    // NOTE: a patch might only change one of both props, e.g. when clearing after pushing lines within one update cycle
+    lines() {
+      this.reset();
+    },
+    total() {
+      this.reset();
+    },
+  },
+  methods: {
+    reset() {
+      this.streamedLines = [...(this.lines || [])];
+      this.streamedTotal = this.total || 0;
+    },
+    push(lines, total, evicted) {
+      if (total <= this.streamedTotal) return; // NOTE: the lines have already been received with an element update
+      this.streamedLines.push(...lines);
+      this.streamedLines.splice(0, evicted);
+      this.streamedTotal = total;
+    },
+  },
+};
@@ -1,29 +1,75 @@
-from typing import Any, Optional
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional
 
 from ..element import Element
 from .label import Label
 
+STREAMING_MAX_LINES = 10_000
 
-class Log(Element):
 
-    def __init__(self, max_lines: Optional[int] = None) -> None:
+class Log(Element, component='log.js'):
+
+    def __init__(self, max_lines: Optional[int] = None, *, streaming: bool = False) -> None:
         """Log View
 
         Create a log view that allows to add new lines without re-transmitting the whole history to the client.
 
+        By default, each line is a label element.
+        In streaming mode the lines are kept in a ring buffer of `max_lines` lines instead
+        and only new lines are sent to the client, which is much faster for high-frequency logs.
+        To bound the memory of server and browser, streaming logs keep at most 10,000 lines unless `max_lines` is given.
+
         :param max_lines: maximum number of lines before dropping oldest ones (default: `None`)
+        :param streaming: whether to stream the lines without creating an element per line (default: `False`)
         """
         super().__init__()
+        if streaming and max_lines is None:
+            max_lines = STREAMING_MAX_LINES
         self.max_lines = max_lines
+        self.streaming = streaming
+        self._lines: Deque[str] = deque(maxlen=max_lines)
+        self._total = 0  # NOTE: number of pushed lines, used by the client to skip lines it already received
         self._classes.append('nicegui-log')
 
+    @property
+    def lines(self) -> List[str]:
+        """The lines currently shown in the log."""
+        if self.streaming:
+            return list(self._lines)
+        return [child.text for child in self.default_slot.children if isinstance(child, Label)]
+
     def push(self, line: Any) -> None:
         """Add a new line to the log.
 
         :param line: the line to add (can contain line breaks)
         """
+        if self.streaming:
+            self._push_lines(str(line).splitlines())
+            return
         for text in str(line).splitlines():
             with self:
                 Label(text)
         while self.max_lines is not None and len(self.default_slot.children) > self.max_lines:
             self.remove(0)
+
+    def _push_lines(self, lines: List[str]) -> None:
+        if not lines:
+            return
+        count = len(self._lines)
+        self._lines.extend(lines)
+        self._total += len(lines)
+        if self.max_lines is not None:
+            lines = lines[-self.max_lines:]
+        evicted = count + len(lines) - len(self._lines)
+        self.run_method('push', lines, self._total, evicted)
+
+    def clear(self) -> None:
+        """Remove all lines."""
+        self._lines.clear()
+        super().clear()
+
+    def _to_dict(self) -> Dict[str, Any]:
+        data = super()._to_dict()
+        if self.streaming:
+            data['props'] = {**data.get('props', {}), 'lines': list(self._lines), 'total': self._total}
+        return data
@@ -7,6 +7,7 @@ from ... import core
 from ...binding import BindableProperty, bind, bind_from, bind_to
 from ...element import Element
 from ...helpers import is_file
+from ...image_cache import image_cache
 
 
 class SourceElement(Element):
@@ -101,9 +102,11 @@ class SourceElement(Element):
             self.auto_route = source
         if isinstance(source, Path) and not source.exists():
             raise FileNotFoundError(f'File not found: {source}')
+        image_cache.release(self._props.get('src'))
         self._props['src'] = source
 
     def _handle_delete(self) -> None:
         if self.auto_route:
             core.app.remove_route(self.auto_route)
+        image_cache.release(self._props.get('src'))
         return super()._handle_delete()
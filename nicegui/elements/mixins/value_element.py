@@ -36,6 +36,8 @@ class ValueElement(Element):
         self._change_handlers: List[Callable[..., Any]] = [on_value_change] if on_value_change else []
 
         def handle_change(e: GenericEventArguments) -> None:
+            if self.LOOPBACK is not True:
+                self.client.outbox.forget(self, self.VALUE_PROP)  # NOTE: the browser has already updated its value
             self._send_update_on_value_change = self.LOOPBACK is True
             self.set_value(self._event_args_to_value(e))
             self._send_update_on_value_change = True
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Dict, Union
+import base64
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from .. import optional_features
 from ..element import Element
+from .line_plot import RingBuffer
 
 try:
     import plotly.graph_objects as go
@@ -11,10 +13,21 @@ try:
 except ImportError:
     pass
 
+TYPED_ARRAY_DTYPES = {  # NOTE: dtypes supported by Plotly.js' typed array specification and static/plotly.vue
+    'int8': 'i1',
+    'uint8': 'u1',
+    'int16': 'i2',
+    'uint16': 'u2',
+    'int32': 'i4',
+    'uint32': 'u4',
+    'float32': 'f4',
+    'float64': 'f8',
+}
+
 
 class Plotly(Element, component='plotly.vue', dependencies=['lib/plotly/plotly.min.js']):
 
-    def __init__(self, figure: Union[Dict, go.Figure]) -> None:
+    def __init__(self, figure: Union[Dict, go.Figure], *, typed_arrays: bool = False) -> None:
         """Plotly Element
 
         Renders a Plotly chart.
@@ -25,9 +38,11 @@ class Plotly(Element, component='plotly.vue', dependencies=['lib/plotly/plotly.m
         * Pass a Python `dict` object with keys `data`, `layout`, `config` (optional), see https://plotly.com/javascript/
 
         For best performance, use the declarative `dict` approach for creating a Plotly chart.
+        To only send changes to the client, use the methods `extend_traces`, `restyle` and `relayout`.
 
         :param figure: Plotly figure to be rendered. Can be either a `go.Figure` instance, or
                        a `dict` object with keys `data`, `layout`, `config` (optional).
+        :param typed_arrays: whether to send NumPy arrays in the trace data as base64-encoded typed arrays (default: `False`)
         """
         if not optional_features.has('plotly'):
             raise ImportError('Plotly is not installed. Please run "pip install nicegui[plotly]".')
@@ -35,18 +50,135 @@ class Plotly(Element, component='plotly.vue', dependencies=['lib/plotly/plotly.m
         super().__init__()
 
         self.figure = figure
+        self.typed_arrays = typed_arrays
+        self._buffers: Dict[Tuple[int, str], Tuple[RingBuffer, Any]] = {}
+        self._props['data_version'] = 0  # NOTE: number of extensions, used by the client to skip data it already received
         self.update()
         self._classes.append('js-plotly-plot')
 
     def update_figure(self, figure: Union[Dict, go.Figure]):
         """Overrides figure instance of this Plotly chart and updates chart on client side."""
         self.figure = figure
+        self._buffers.clear()
         self.update()
 
     def update(self) -> None:
         self._props['options'] = self._get_figure_json()
         super().update()
 
+    def extend_traces(self,
+                      update: Dict[str, List[Any]],
+                      indices: List[int], *,
+                      max_points: Optional[int] = None) -> None:
+        """Append data to traces without sending the whole figure to the client.
+
+        This corresponds to `Plotly.extendTraces <https://plotly.com/javascript/plotlyjs-function-reference/#plotlyextendtraces>`_.
+
+        :param update: dictionary mapping attributes like "x" and "y" to a list of new values per trace
+        :param indices: indices of the traces to extend
+        :param max_points: maximum number of values per attribute and trace; older values are removed (default: `None`)
+        """
+        options = self._props['options']
+        for key, values_per_trace in update.items():
+            for index, values in zip(indices, values_per_trace):
+                trace = self.figure['data'][index]
+                if isinstance(trace, dict):
+                    trace[key] = self._extend((index, key), trace.get(key), values, max_points)
+                else:
+                    trace[key] = _concatenate(trace[key], values, max_points)
+                    options_trace = options['data'][index]  # NOTE: only append the new values to the figure JSON
+                    options_trace[key] = self._extend((index, key), options_trace.get(key), values, max_points)
+        self._props['data_version'] += 1
+        self.run_method('extend_traces', self._encode(update), indices, max_points, self._props['data_version'])
+
+    def restyle(self, update: Dict[str, Any], indices: Optional[List[int]] = None) -> None:
+        """Change attributes of traces without sending the whole figure to the client.
+
+        This corresponds to `Plotly.restyle <https://plotly.com/javascript/plotlyjs-function-reference/#plotlyrestyle>`_:
+        Keys can be nested attributes like "marker.color".
+        If a value is a list, its items are applied to the traces in turn,
+        so array attributes like "x" need to be wrapped in another list.
+
+        :param update: dictionary mapping attributes to new values
+        :param indices: indices of the traces to change (default: all traces)
+        """
+        if indices is None:
+            indices = list(range(len(self.figure['data'])))
+        for key, value in update.items():
+            if isinstance(value, list) and not value:
+                continue
+            for i, index in enumerate(indices):
+                _set(self.figure['data'][index], key, value[i % len(value)] if isinstance(value, list) else value)
+        self._sync_traces(indices)
+        self.run_method('restyle', self._encode(update), indices)
+
+    def relayout(self, update: Dict[str, Any]) -> None:
+        """Change attributes of the layout without sending the whole figure to the client.
+
+        This corresponds to `Plotly.relayout <https://plotly.com/javascript/plotlyjs-function-reference/#plotlyrelayout>`_:
+        Keys can be nested attributes like "xaxis.range".
+
+        :param update: dictionary mapping layout attributes to new values
+        """
+        if isinstance(self.figure, dict):
+            layout = self.figure.setdefault('layout', {})
+        else:
+            layout = self.figure.layout
+        for key, value in update.items():
+            _set(layout, key, value)
+        options = self._props['options']
+        if options is not self.figure:
+            options['layout'] = layout if isinstance(layout, dict) else layout.to_plotly_json()
+        self.run_method('relayout', update)
+
+    def _sync_traces(self, indices: List[int]) -> None:
+        """Refresh the traces in the figure JSON, so that new clients receive the current state."""
+        options = self._props['options']
+        if options is self.figure:
+            return
+        for index in set(indices):
+            options['data'][index] = self.figure['data'][index].to_plotly_json()
+            for key in list(self._buffers):
+                if key[0] == index:
+                    del self._buffers[key]
+
+    def _extend(self, key: Tuple[int, str], current: Any, values: Any, max_points: Optional[int]) -> Any:
+        """Append values to a value array of a trace in place, dropping the oldest ones beyond `max_points`.
+
+        Lists are extended directly, NumPy arrays are replaced by a view into a preallocated ring buffer.
+        Either way the cost only depends on the number of new values, not on the length of the trace.
+        """
+        if current is None or len(current) == 0:
+            current = values[:0] if hasattr(values, '__array_interface__') else []
+        if isinstance(current, tuple):
+            current = list(current)  # NOTE: converted once, extended in place afterwards
+        if isinstance(current, list):
+            current.extend(values.tolist() if hasattr(values, 'tolist') else values)
+            if max_points is not None and len(current) > max_points:
+                del current[:len(current) - max_points]
+            return current
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        values = np.asarray(values)
+        buffer, view = self._buffers.get(key, (None, None))
+        if buffer is None or view is not current or buffer.capacity != max_points or \
+                np.result_type(buffer.view(), values) != buffer.view().dtype:
+            current = np.asarray(current)
+            buffer = RingBuffer(1, max_points, dtype=np.result_type(current, values))
+            buffer.extend(current.reshape(-1, 1))
+        buffer.extend(values.reshape(-1, 1))
+        view = buffer.view()[:, 0]
+        self._buffers[key] = (buffer, view)
+        return view
+
+    def _encode(self, obj: Any) -> Any:
+        return encode_typed_arrays(obj) if self.typed_arrays else obj
+
+    def _to_dict(self) -> Dict[str, Any]:
+        data = super()._to_dict()
+        if self.typed_arrays:  # NOTE: encode when sending, so that extending traces does not re-encode them every time
+            data['props'] = {**data.get('props', {}), 'options': encode_typed_arrays(self._props['options'])}
+        return data
+
     def _get_figure_json(self) -> Dict:
         if isinstance(self.figure, go.Figure):
             # convert go.Figure to dict object which is directly JSON serializable
@@ -58,3 +190,61 @@ class Plotly(Element, component='plotly.vue', dependencies=['lib/plotly/plotly.m
             return self.figure
 
         raise ValueError(f'Plotly figure is of unknown type "{self.figure.__class__.__name__}".')
+
+
+def encode_typed_arrays(obj: Any) -> Any:
+    """Replace numeric NumPy arrays with base64-encoded typed array specifications understood by Plotly.js.
+
+    Dictionaries and lists are copied if they contain NumPy arrays, other objects are returned unchanged.
+    64-bit integer arrays are converted to 32-bit integers if their values fit, otherwise they are kept as they are.
+    """
+    if isinstance(obj, dict):
+        encoded = {key: encode_typed_arrays(value) for key, value in obj.items()}
+        return encoded if any(encoded[key] is not value for key, value in obj.items()) else obj
+    if isinstance(obj, (list, tuple)):
+        encoded_items = [encode_typed_arrays(value) for value in obj]
+        return encoded_items if any(a is not b for a, b in zip(encoded_items, obj)) else obj
+    if not hasattr(obj, '__array_interface__') or not hasattr(obj, 'dtype') or obj.size == 0:
+        return obj
+    if obj.dtype.name in ('int64', 'uint64'):
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        info = np.iinfo(np.int32 if obj.dtype.name == 'int64' else np.uint32)
+        if obj.min() < info.min or obj.max() > info.max:
+            return obj
+        obj = obj.astype(info.dtype)
+    if obj.dtype.name not in TYPED_ARRAY_DTYPES:
+        return obj
+    little_endian = obj.astype(obj.dtype.newbyteorder('<'), copy=False)
+    spec = {
+        'dtype': TYPED_ARRAY_DTYPES[obj.dtype.name],
+        'bdata': base64.b64encode(little_endian.tobytes()).decode(),
+    }
+    if obj.ndim > 1:
+        spec['shape'] = ','.join(str(n) for n in obj.shape)
+    return spec
+
+
+def _concatenate(current: Any, values: Any, max_points: Optional[int]) -> Any:
+    if current is None or len(current) == 0:
+        result = values if hasattr(values, '__array_interface__') else list(values)
+    elif isinstance(current, (list, tuple)):
+        result = [*current, *(values.tolist() if hasattr(values, 'tolist') else values)]
+    else:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        result = np.concatenate((current, values))
+    if max_points is not None and len(result) > max_points:
+        result = result[len(result) - max_points:]
+    return result
+
+
+def _set(target: Any, path: str, value: Any) -> None:
+    if not isinstance(target, dict):
+        target[path] = value  # NOTE: Plotly's graph objects support nested paths like "marker.color"
+        return
+    *keys, last = path.split('.')
+    for key in keys:
+        target = target.setdefault(key, {})
+    if value is None:
+        target.pop(last, None)
+    else:
+        target[last] = value
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import asyncio
+import base64
+import copyreg
 import io
 import os
-from typing import Any
+import pickle
+from typing import Any, Callable, List, Literal, Optional
 
 from typing_extensions import Self
 
-from .. import background_tasks, optional_features
+from .. import background_tasks, core, optional_features, run
 from ..client import Client
 from ..element import Element
 
@@ -33,14 +36,118 @@ except ImportError:
     pass
 
 
+FORMAT = Literal['svg', 'png']
+
+
+def render_figure(figure: matplotlib.figure.Figure, format: FORMAT) -> str:  # pylint: disable=redefined-builtin
+    """Render a Matplotlib figure as SVG or as PNG image (with twice the figure's resolution for high-DPI screens)."""
+    if format == 'png':
+        with io.BytesIO() as output:
+            figure.savefig(output, format='png', dpi=2 * figure.dpi)
+            data = base64.b64encode(output.getvalue()).decode()
+        width = round(figure.get_figwidth() * figure.dpi)
+        return f'<img src="data:image/png;base64,{data}" width="{width}">'
+    with io.StringIO() as output:
+        figure.savefig(output, format='svg')
+        return output.getvalue()
+
+
+class _FigurePickler(pickle.Pickler):
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, matplotlib.figure.Figure):
+            state = obj.__getstate__()
+            state.pop('_restore_to_pylab', None)  # NOTE: the copy must not be registered with pyplot
+            state.pop('element', None)
+            return copyreg.__newobj__, (type(obj),), state
+        return NotImplemented
+
+
+def _pickle_figure(figure: matplotlib.figure.Figure) -> bytes:
+    with io.BytesIO() as output:
+        _FigurePickler(output).dump(figure)
+        return output.getvalue()
+
+
+def _render_snapshot(snapshot: bytes, format: FORMAT) -> str:  # pylint: disable=redefined-builtin
+    return render_figure(pickle.loads(snapshot), format)
+
+
+class FigureRenderer:
+
+    def __init__(self, element: Element, figure: matplotlib.figure.Figure) -> None:
+        """Render a figure into the `innerHTML` property of an element.
+
+        When the event loop is running, a copy of the figure is rendered in a separate thread.
+        Because Matplotlib is not thread-safe, the copy is pickled on the event loop,
+        so that the figure can be changed at any time without waiting for the rendering to finish.
+        If the figure changes again while it is being rendered, only the latest state is rendered once more.
+        """
+        self.element = element
+        self.figure = figure
+        self._version = 0
+        self._rendered_version = 0
+        self._callbacks: List[Callable[[], None]] = []
+        self._waiters: List[asyncio.Future] = []
+
+    def render(self, format: FORMAT, *, then: Optional[Callable[[], None]] = None) -> bool:  # pylint: disable=redefined-builtin
+        """Render the figure and call `then` afterwards.
+
+        :return: whether the figure has been rendered synchronously, so that the element still needs to be updated
+        """
+        if then is not None:
+            self._callbacks.append(then)
+        self._version += 1
+        if core.loop is None or not core.loop.is_running():
+            self.element._props['innerHTML'] = render_figure(self.figure, format)  # pylint: disable=protected-access
+            self._finish(self._version)
+            return True
+
+        async def render(version: int) -> None:
+            try:
+                snapshot = _pickle_figure(self.figure)
+            except Exception:  # NOTE: figures with artists that can not be pickled are rendered on the event loop
+                html: Optional[str] = render_figure(self.figure, format)
+            else:
+                html = await run.io_bound(_render_snapshot, snapshot, format)
+            if html is not None and not self.element.is_deleted:  # NOTE: html is None if the app is stopping
+                self.element._props['innerHTML'] = html  # pylint: disable=protected-access
+                Element.update(self.element)
+            self._finish(version)
+        background_tasks.create_lazy(render(self._version),
+                                     name=f'render figure {self.element.client.id}-{self.element.id}')
+        return False
+
+    def _finish(self, version: int) -> None:
+        self._rendered_version = max(self._rendered_version, version)
+        if self._rendered_version < self._version:
+            return  # NOTE: a newer state is waiting to be rendered
+        callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            callback()
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    async def rendered(self) -> None:
+        """Wait until the latest state of the figure has been rendered."""
+        if self._rendered_version < self._version:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            await waiter
+
+
 class Pyplot(Element):
 
-    def __init__(self, *, close: bool = True, **kwargs: Any) -> None:
+    def __init__(self, *, close: bool = True, format: FORMAT = 'svg', **kwargs: Any) -> None:  # pylint: disable=redefined-builtin
         """Pyplot Context
 
         Create a context to configure a `Matplotlib <https://matplotlib.org/>`_ plot.
+        The figure is rendered in a separate thread to not block the event loop.
 
         :param close: whether the figure should be closed after exiting the context; set to `False` if you want to update it later (default: `True`)
+        :param format: output format of the rendered figure; use "png" for dense plots with a large SVG representation (default: "svg")
         :param kwargs: arguments like `figsize` which should be passed to `pyplot.figure <https://matplotlib.org/stable/api/_as_gen/matplotlib.pyplot.figure.html>`_
         """
         if not optional_features.has('matplotlib'):
@@ -49,26 +156,28 @@ class Pyplot(Element):
         super().__init__('div')
         self._classes.append('nicegui-pyplot')
         self.close = close
+        self.format = format
         self.fig = plt.figure(**kwargs)
+        self._renderer = FigureRenderer(self, self.fig)
         self._convert_to_html()
 
         if not self.client.shared:
             background_tasks.create(self._auto_close(), name='auto-close plot figure')
 
-    def _convert_to_html(self) -> None:
-        with io.StringIO() as output:
-            self.fig.savefig(output, format='svg')
-            self._props['innerHTML'] = output.getvalue()
+    def _convert_to_html(self, *, then: Optional[Callable[[], None]] = None) -> bool:
+        return self._renderer.render(self.format, then=then)
+
+    async def rendered(self) -> None:
+        """Wait until the latest state of the figure has been rendered."""
+        await self._renderer.rendered()
 
     def __enter__(self) -> Self:
         plt.figure(self.fig)
         return self
 
     def __exit__(self, *_) -> None:
-        self._convert_to_html()
-        if self.close:
-            plt.close(self.fig)
-        self.update()
+        if self._convert_to_html(then=(lambda: plt.close(self.fig)) if self.close else None):
+            self.update()
 
     async def _auto_close(self) -> None:
         while self.client.id in Client.instances:
@@ -78,26 +187,33 @@ class Pyplot(Element):
 
 class Matplotlib(Element):
 
-    def __init__(self, **kwargs: Any) -> None:
+    def __init__(self, *, format: FORMAT = 'svg', **kwargs: Any) -> None:  # pylint: disable=redefined-builtin
         """Matplotlib
 
         Create a `Matplotlib <https://matplotlib.org/>`_ element rendering a Matplotlib figure.
         The figure is automatically updated when leaving the figure context.
+        It is rendered in a separate thread to not block the event loop.
 
+        :param format: output format of the rendered figure; use "png" for dense plots with a large SVG representation (default: "svg")
         :param kwargs: arguments like `figsize` which should be passed to `matplotlib.figure.Figure <https://matplotlib.org/stable/api/figure_api.html#matplotlib.figure.Figure>`_
         """
         if not optional_features.has('matplotlib'):
             raise ImportError('Matplotlib is not installed. Please run "pip install matplotlib".')
 
         super().__init__('div')
+        self.format = format
         self.figure = MatplotlibFigure(self, **kwargs)
+        self._renderer = FigureRenderer(self, self.figure)
         self._convert_to_html()
 
-    def _convert_to_html(self) -> None:
-        with io.StringIO() as output:
-            self.figure.savefig(output, format='svg')
-            self._props['innerHTML'] = output.getvalue()
+    def _convert_to_html(self) -> bool:
+        return self._renderer.render(self.format)
+
+    async def rendered(self) -> None:
+        """Wait until the latest state of the figure has been rendered."""
+        await self._renderer.rendered()
 
     def update(self) -> None:
-        self._convert_to_html()
-        return super().update()
+        if self._convert_to_html():
+            super().update()
+        # NOTE: otherwise the element is updated as soon as the figure has been rendered
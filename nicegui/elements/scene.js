@@ -50,6 +50,56 @@ function texture_material(texture) {
   });
 }
 
+function decode_floats(data) {
+  if (data instanceof Uint8Array) return new Float32Array(data.buffer, data.byteOffset, data.byteLength / 4); // NOTE: MessagePack
+  const bytes = Uint8Array.from(atob(data), (c) => c.charCodeAt(0));
+  return new Float32Array(bytes.buffer);
+}
+
+function allocate_points(object, count) {
+  if (object.isInstancedMesh) {
+    object.dispatchEvent({ type: "dispose" }); // NOTE: releases the GPU buffers of the previous instances
+    object.instanceMatrix = new THREE.InstancedBufferAttribute(new Float32Array(count * 16), 16);
+    object.instanceColor = new THREE.InstancedBufferAttribute(new Float32Array(count * 3), 3);
+    object.count = 0;
+    object.boundingSphere = null;
+  } else {
+    object.geometry.dispose();
+    object.geometry.setAttribute("position", new THREE.Float32BufferAttribute(new Float32Array(count * 3), 3));
+    object.geometry.setAttribute("color", new THREE.Float32BufferAttribute(new Float32Array(count * 3), 3));
+    object.geometry.setDrawRange(0, 0);
+    object.geometry.boundingSphere = null;
+  }
+}
+
+function update_points(object, start, positions, colors) {
+  positions = decode_floats(positions);
+  colors = decode_floats(colors);
+  const count = positions.length / 3;
+  const positionAttribute = object.isInstancedMesh ? object.instanceMatrix : object.geometry.getAttribute("position");
+  const colorAttribute = object.isInstancedMesh ? object.instanceColor : object.geometry.getAttribute("color");
+  if (start + count > colorAttribute.count) return; // NOTE: outdated update for a previous set of points
+  if (object.isInstancedMesh) {
+    const matrix = new THREE.Matrix4();
+    for (let i = 0; i < count; ++i) {
+      matrix.makeTranslation(positions[3 * i], positions[3 * i + 1], positions[3 * i + 2]);
+      object.setMatrixAt(start + i, matrix);
+    }
+    positionAttribute.addUpdateRange(16 * start, 16 * count);
+    object.count = Math.max(object.count, start + count);
+    object.boundingSphere = null;
+  } else {
+    positionAttribute.array.set(positions, 3 * start);
+    positionAttribute.addUpdateRange(3 * start, 3 * count);
+    object.geometry.setDrawRange(0, Math.max(object.geometry.drawRange.count, start + count));
+    object.geometry.boundingSphere = null;
+  }
+  positionAttribute.needsUpdate = true;
+  colorAttribute.array.set(colors, 3 * start);
+  colorAttribute.addUpdateRange(3 * start, 3 * count);
+  colorAttribute.needsUpdate = true;
+}
+
 export default {
   template: `
     <div style="position:relative" data-initializing>
@@ -265,11 +315,22 @@ export default {
         mesh.add(light);
         mesh.add(light.target);
       } else if (type == "point_cloud") {
-        const geometry = new THREE.BufferGeometry();
-        geometry.setAttribute("position", new THREE.Float32BufferAttribute(args[0].flat(), 3));
-        geometry.setAttribute("color", new THREE.Float32BufferAttribute(args[1].flat(), 3));
-        const material = new THREE.PointsMaterial({ size: args[2], vertexColors: true });
-        mesh = new THREE.Points(geometry, material);
+        const [size, count, positions, colors] = args;
+        const material = new THREE.PointsMaterial({ size: size, vertexColors: true });
+        mesh = new THREE.Points(new THREE.BufferGeometry(), material);
+        allocate_points(mesh, count);
+        update_points(mesh, 0, positions, colors);
+      } else if (type == "instanced_mesh") {
+        const [geometry_type, geometry_args, count, positions, colors] = args;
+        const Geometry = {
+          box: THREE.BoxGeometry,
+          sphere: THREE.SphereGeometry,
+          cylinder: THREE.CylinderGeometry,
+        }[geometry_type];
+        const material = new THREE.MeshPhongMaterial({ transparent: true });
+        mesh = new THREE.InstancedMesh(new Geometry(...geometry_args), material, 0);
+        allocate_points(mesh, count);
+        update_points(mesh, 0, positions, colors);
       } else if (type == "gltf") {
         const url = args[0];
         mesh = new THREE.Group();
@@ -364,8 +425,9 @@ export default {
     draggable(object_id, value) {
       if (!this.objects.has(object_id)) return;
       const object = this.objects.get(object_id);
-      if (value) this.draggable_objects.push(object);
-      else {
+      if (value) {
+        if (!this.draggable_objects.includes(object)) this.draggable_objects.push(object);
+      } else {
         const index = this.draggable_objects.indexOf(object);
         if (index != -1) this.draggable_objects.splice(index, 1);
       }
@@ -394,10 +456,13 @@ export default {
       if (!this.objects.has(object_id)) return;
       this.objects.get(object_id).geometry = texture_geometry(coords);
     },
-    set_points(object_id, position, color) {
-      const geometry = this.objects.get(object_id).geometry;
-      geometry.setAttribute("position", new THREE.Float32BufferAttribute(position.flat(), 3));
-      geometry.setAttribute("color", new THREE.Float32BufferAttribute(color.flat(), 3));
+    set_points(object_id, count) {
+      if (!this.objects.has(object_id)) return;
+      allocate_points(this.objects.get(object_id), count);
+    },
+    update_points(object_id, start, positions, colors) {
+      if (!this.objects.has(object_id)) return;
+      update_points(this.objects.get(object_id), start, positions, colors);
     },
     move_camera(x, y, z, look_at_x, look_at_y, look_at_z, up_x, up_y, up_z, duration) {
       if (this.camera_tween) this.camera_tween.stop();
@@ -464,6 +529,19 @@ export default {
       }
       this.camera.updateProjectionMatrix();
     },
+    apply_commands(commands, ids, transforms) {
+      for (const [name, ...args] of commands) this[name](...args);
+      const R = new THREE.Matrix4();
+      ids.forEach((id, i) => {
+        const object = this.objects.get(id);
+        if (!object) return;
+        const t = transforms.slice(15 * i, 15 * (i + 1));
+        object.position.set(t[0], t[1], t[2]);
+        R.set(t[3], t[4], t[5], 0, t[6], t[7], t[8], 0, t[9], t[10], t[11], 0, 0, 0, 0, 1);
+        object.rotation.setFromRotationMatrix(R);
+        object.scale.set(t[12], t[13], t[14]);
+      });
+    },
     init_objects(data) {
       this.resize();
       this.$el.removeAttribute("data-initializing");
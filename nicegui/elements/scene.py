@@ -1,10 +1,11 @@
 import asyncio
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Tuple, Union
 
 from typing_extensions import Self
 
-from .. import binding
+from .. import binding, core
+from ..awaitable_response import AwaitableResponse
 from ..dataclasses import KWONLY_SLOTS
 from ..element import Element
 from ..events import (
@@ -57,6 +58,7 @@ class Scene(Element,
     from .scene_objects import Extrusion as extrusion
     from .scene_objects import Gltf as gltf
     from .scene_objects import Group as group
+    from .scene_objects import InstancedMesh as instanced_mesh
     from .scene_objects import Line as line
     from .scene_objects import PointCloud as point_cloud
     from .scene_objects import QuadraticBezierTube as quadratic_bezier_tube
@@ -108,6 +110,11 @@ class Scene(Element,
         self._props['camera_params'] = self.camera.params
         self.objects: Dict[str, Object3D] = {}
         self.stack: List[Union[Object3D, SceneObject]] = [SceneObject()]
+        self._commands: List[List[Any]] = []
+        self._updates: Dict[Tuple[str, str], List[Any]] = {}
+        self._transformed_ids: Dict[str, None] = {}
+        self._streams: Dict[str, Iterator[List[Any]]] = {}
+        self._is_flush_scheduled = False
         self._click_handlers = [on_click] if on_click else []
         self._props['click_events'] = click_events
         self._drag_start_handlers = [on_drag_start] if on_drag_start else []
@@ -169,6 +176,7 @@ class Scene(Element,
         return attribute
 
     def _handle_init(self, e: GenericEventArguments) -> None:
+        self._flush_commands()  # NOTE: objects created before must not be created again after initialization
         with self.client.individual_target(e.args['socket_id']):
             self.move_camera(duration=0)
             self.run_method('init_objects', [obj.data for obj in self.objects.values()])
@@ -259,6 +267,11 @@ class Scene(Element,
                         self.camera.look_at_x, self.camera.look_at_y, self.camera.look_at_z,
                         self.camera.up_x, self.camera.up_y, self.camera.up_z, duration)
 
+    def run_method(self, name: str, *args: Any, timeout: float = 1) -> AwaitableResponse:
+        if self._commands or self._updates or self._transformed_ids:
+            self._flush_commands()  # NOTE: send queued commands first so that the method call does not overtake them
+        return super().run_method(name, *args, timeout=timeout)
+
     async def get_camera(self) -> Dict[str, Any]:
         """Get the current camera parameters.
 
@@ -267,6 +280,76 @@ class Scene(Element,
         """
         return await self.run_method('get_camera')
 
+    def _queue_command(self, name: str, *args: Any) -> None:
+        """Queue a method call which is sent to the client with the next flush."""
+        if core.loop is None:
+            return  # NOTE: the objects are sent when the scene is initialized
+        self._commands.append([name, *args])
+        self._schedule_flush()
+
+    def _queue_update(self, name: str, object_id: str, *args: Any) -> None:
+        """Queue an update of an object's attribute, replacing previous updates of the same attribute."""
+        if core.loop is None:
+            return
+        self._updates[(object_id, name)] = [name, object_id, *args]
+        self._schedule_flush()
+
+    def _queue_transform(self, object_id: str) -> None:
+        """Queue sending the position, rotation and scale of an object with the next flush."""
+        if core.loop is None:
+            return
+        self._transformed_ids[object_id] = None
+        self._schedule_flush()
+
+    def _queue_stream(self, object_id: str, commands: Iterator[List[Any]]) -> None:
+        """Queue commands which are sent one per flush, replacing a previous stream of the same object.
+
+        This is used to send large buffers in chunks, so that they appear progressively
+        and other messages are not blocked until the whole buffer is transmitted.
+        """
+        if core.loop is None:
+            return
+        self._streams[object_id] = commands
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if not self._is_flush_scheduled:
+            self._is_flush_scheduled = True
+            self.client.outbox.before_next_flush(self._flush_commands)
+
+    def _flush_commands(self) -> None:
+        """Send all queued commands, attribute updates, the next chunk of each stream and transforms in a single message.
+
+        The transforms are sent as a flat list with 15 numbers per object:
+        the position (x, y, z), the rotation matrix (row by row) and the scale (sx, sy, sz).
+        """
+        self._is_flush_scheduled = False
+        commands = self._commands
+        commands.extend(update for (object_id, _), update in self._updates.items() if object_id in self.objects)
+        for object_id, stream in list(self._streams.items()):
+            command = next(stream, None) if object_id in self.objects else None
+            if command is None:
+                del self._streams[object_id]
+            else:
+                commands.append(command)
+        transformed_ids = [object_id for object_id in self._transformed_ids if object_id in self.objects]
+        transforms: List[float] = []
+        for object_id in transformed_ids:
+            obj = self.objects[object_id]
+            transforms.extend((obj.x, obj.y, obj.z, *obj.R[0], *obj.R[1], *obj.R[2], obj.sx, obj.sy, obj.sz))
+        self._commands = []
+        self._updates.clear()
+        self._transformed_ids.clear()
+        if self.is_deleted:
+            self._streams.clear()
+            return
+        if self._streams:
+            self._schedule_flush()
+        if not (commands or transformed_ids):
+            return
+        self.client.outbox.enqueue_method_call(self.id, 'apply_commands', [commands, transformed_ids, transforms],
+                                               self.client.id)
+
     def _handle_delete(self) -> None:
         binding.remove(list(self.objects.values()))
         super()._handle_delete()
@@ -64,31 +64,31 @@ class Object3D:
         self.scene.stack.pop()
 
     def _create(self) -> None:
-        self.scene.run_method('create', self.type, self.id, self.parent.id, *self.args)
+        self.scene._queue_command('create', self.type, self.id, self.parent.id, *self.args)  # pylint: disable=protected-access
 
     def _name(self) -> None:
-        self.scene.run_method('name', self.id, self.name)
+        self.scene._queue_update('name', self.id, self.name)  # pylint: disable=protected-access
 
     def _material(self) -> None:
-        self.scene.run_method('material', self.id, self.color, self.opacity, self.side_)
+        self.scene._queue_update('material', self.id, self.color, self.opacity, self.side_)  # pylint: disable=protected-access
 
     def _move(self) -> None:
-        self.scene.run_method('move', self.id, self.x, self.y, self.z)
+        self.scene._queue_transform(self.id)  # pylint: disable=protected-access
 
     def _rotate(self) -> None:
-        self.scene.run_method('rotate', self.id, self.R)
+        self.scene._queue_transform(self.id)  # pylint: disable=protected-access
 
     def _scale(self) -> None:
-        self.scene.run_method('scale', self.id, self.sx, self.sy, self.sz)
+        self.scene._queue_transform(self.id)  # pylint: disable=protected-access
 
     def _visible(self) -> None:
-        self.scene.run_method('visible', self.id, self.visible_)
+        self.scene._queue_update('visible', self.id, self.visible_)  # pylint: disable=protected-access
 
     def _draggable(self) -> None:
-        self.scene.run_method('draggable', self.id, self.draggable_)
+        self.scene._queue_update('draggable', self.id, self.draggable_)  # pylint: disable=protected-access
 
     def _delete(self) -> None:
-        self.scene.run_method('delete', self.id)
+        self.scene._queue_command('delete', self.id)  # pylint: disable=protected-access
 
     def material(self, color: str = '#ffffff', opacity: float = 1.0, side: Literal['front', 'back', 'both'] = 'front') -> Self:
         """Set the color and opacity of the object.
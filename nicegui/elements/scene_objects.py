@@ -1,6 +1,10 @@
+import array
+import base64
 import math
-from typing import List, Optional
+import sys
+from typing import Any, Iterator, List, Literal, Optional, Sequence, Union
 
+from .. import core
 from .scene_object3d import Object3D
 
 
@@ -280,12 +284,12 @@ class Texture(Object3D):
     def set_url(self, url: str) -> None:
         """Change the URL of the texture image."""
         self.args[0] = url
-        self.scene.run_method('set_texture_url', self.id, url)
+        self.scene._queue_update('set_texture_url', self.id, url)  # pylint: disable=protected-access
 
     def set_coordinates(self, coordinates: List[List[Optional[List[float]]]]) -> None:
         """Change the texture coordinates."""
         self.args[1] = coordinates
-        self.scene.run_method('set_texture_coordinates', self.id, coordinates)
+        self.scene._queue_update('set_texture_coordinates', self.id, coordinates)  # pylint: disable=protected-access
 
 
 class SpotLight(Object3D):
@@ -313,25 +317,173 @@ class SpotLight(Object3D):
         super().__init__('spot_light', color, intensity, distance, angle, penumbra, decay)
 
 
-class PointCloud(Object3D):
+class PointsObject3D(Object3D):
 
     def __init__(self,
-                 points: List[List[float]],
-                 colors: List[List[float]],
+                 type_: str,
+                 points: Any,
+                 colors: Optional[Any],
+                 *args: Any,
+                 chunk_size: int = 100_000,
+                 ) -> None:
+        """Base class for objects with a position and a color per point, which are sent to the client as binary buffers.
+
+        Points and colors can be lists of triples or NumPy arrays of shape (n, 3).
+        They are stored as 32-bit floats and sent in chunks of `chunk_size` points,
+        one chunk per update cycle, so that large objects appear progressively without blocking the connection.
+        With the MessagePack wire format the chunks are sent as raw bytes, otherwise as base64 strings.
+        """
+        self.chunk_size = chunk_size
+        self._positions = _to_float_array(points)
+        self._colors = _to_float_array(colors) if colors is not None else array.array('f', [1.0] * len(self._positions))
+        self._sent_count = 0
+        super().__init__(type_, *args)
+
+    @property
+    def count(self) -> int:
+        """Number of points."""
+        return len(self._positions) // 3
+
+    @property
+    def points(self) -> List[List[float]]:
+        """List of points."""
+        return _to_triples(self._positions)
+
+    @property
+    def colors(self) -> List[List[float]]:
+        """List of RGB colors."""
+        return _to_triples(self._colors)
+
+    @property
+    def data(self) -> List[Any]:
+        data = super().data
+        data[3] = [*self.args, self.count, _encode(self._positions), _encode(self._colors)]
+        return data
+
+    def _create(self) -> None:
+        empty = _encode(array.array('f'))
+        self.scene._queue_command('create', self.type, self.id, self.parent.id,  # pylint: disable=protected-access
+                                  *self.args, self.count, empty, empty)
+        self._stream()
+
+    def _stream(self) -> None:
+        self._sent_count = 0 if core.loop else self.count  # NOTE: without event loop all points are sent on initialization
+
+        def chunks() -> Iterator[List[Any]]:
+            for start in range(0, self.count, self.chunk_size):
+                end = min(start + self.chunk_size, self.count)
+                self._sent_count = end
+                yield ['update_points', self.id, start,
+                       _encode(self._positions, start, end), _encode(self._colors, start, end)]
+        self.scene._queue_stream(self.id, chunks())  # pylint: disable=protected-access
+
+    def set_points(self, points: Any, colors: Optional[Any] = None) -> None:
+        """Replace all points and colors.
+
+        :param points: list of points or NumPy array of shape (n, 3)
+        :param colors: list of RGB colors (0..1) or NumPy array of shape (n, 3) (default: white)
+        """
+        self._positions = _to_float_array(points)
+        self._colors = _to_float_array(colors) if colors is not None else array.array('f', [1.0] * len(self._positions))
+        self.scene._queue_update('set_points', self.id, self.count)  # pylint: disable=protected-access
+        self._stream()
+
+    def update_points(self, start: int, points: Optional[Any] = None, colors: Optional[Any] = None) -> None:
+        """Update a range of points and/or colors in place.
+
+        Only the changed range is sent to the client.
+
+        :param start: index of the first point to update
+        :param points: list of new points or NumPy array of shape (n, 3) (default: keep the points)
+        :param colors: list of new RGB colors (0..1) or NumPy array of shape (n, 3) (default: keep the colors)
+        """
+        end = start
+        for values, buffer in ((points, self._positions), (colors, self._colors)):
+            if values is None:
+                continue
+            new_values = _to_float_array(values)
+            end = start + len(new_values) // 3
+            if start < 0 or end > self.count:
+                raise IndexError(f'points {start}..{end} are out of range for {self.count} points')
+            buffer[3 * start:3 * end] = new_values
+        end = min(end, self._sent_count)  # NOTE: later points are sent with the remaining chunks anyway
+        if end > start:
+            self.scene._queue_command('update_points', self.id, start,  # pylint: disable=protected-access
+                                      _encode(self._positions, start, end), _encode(self._colors, start, end))
+
+
+class PointCloud(PointsObject3D):
+
+    def __init__(self,
+                 points: Any,
+                 colors: Optional[Any],
                  point_size: float = 1.0,
+                 *,
+                 chunk_size: int = 100_000,
                  ) -> None:
         """Point Cloud
 
         This element is based on Three.js' `Points <https://threejs.org/docs/index.html#api/en/objects/Points>`_ object.
+        Points and colors can be lists or NumPy arrays, which are sent to the client as binary buffers.
+        Large point clouds are loaded progressively in chunks.
+        Note that `args` only contains the point size; use `points` and `colors` to read the current points.
 
-        :param points: list of points
-        :param colors: list of colors (one per point)
+        :param points: list of points or NumPy array of shape (n, 3)
+        :param colors: list of RGB colors (0..1) or NumPy array of shape (n, 3), one per point (`None` for white)
         :param point_size: size of the points (default: 1.0)
+        :param chunk_size: number of points sent per update cycle (default: 100,000)
+        """
+        super().__init__('point_cloud', points, colors, point_size, chunk_size=chunk_size)
+
+
+class InstancedMesh(PointsObject3D):
+
+    def __init__(self,
+                 points: Any,
+                 colors: Optional[Any] = None,
+                 geometry: Literal['box', 'sphere', 'cylinder'] = 'box',
+                 geometry_args: Sequence[Any] = (),
+                 *,
+                 chunk_size: int = 100_000,
+                 ) -> None:
+        """Instanced Mesh
+
+        This element is based on Three.js' `InstancedMesh <https://threejs.org/docs/index.html#api/en/objects/InstancedMesh>`_ object.
+        It renders many copies of the same geometry with a single draw call, one at each point.
+        Like for point clouds, points and colors are sent as binary buffers and loaded progressively.
+
+        :param points: list of instance positions or NumPy array of shape (n, 3)
+        :param colors: list of RGB colors (0..1) or NumPy array of shape (n, 3), one per instance (default: white)
+        :param geometry: geometry of the instances (default: "box")
+        :param geometry_args: arguments of the corresponding Three.js geometry, e.g. `(0.1, 0.1, 0.1)` for a box (default: Three.js defaults)
+        :param chunk_size: number of instances sent per update cycle (default: 100,000)
         """
-        super().__init__('point_cloud', points, colors, point_size)
+        super().__init__('instanced_mesh', points, colors, geometry, list(geometry_args), chunk_size=chunk_size)
+
+
+def _to_float_array(values: Any) -> array.array:
+    if hasattr(values, '__array_interface__'):
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        result = array.array('f', np.ascontiguousarray(values, dtype=np.float32).tobytes())
+    else:
+        result = array.array('f', (value for point in values for value in point))
+    if len(result) % 3:
+        raise ValueError('expected three values per point')
+    return result
+
+
+def _to_triples(values: array.array) -> List[List[float]]:
+    return [values[i:i + 3].tolist() for i in range(0, len(values), 3)]
+
+
+def _encode(values: array.array, start: int = 0, end: Optional[int] = None) -> Union[str, bytes]:
+    """Encode a range of points as little-endian 32-bit floats.
 
-    def set_points(self, points: List[List[float]], colors: List[List[float]]) -> None:
-        """Change the points and colors of the point cloud."""
-        self.args[0] = points
-        self.args[1] = colors
-        self.scene.run_method('set_points', self.id, points, colors)
+    MessagePack transmits the raw bytes, JSON needs them as base64 string.
+    """
+    chunk = values[3 * start:] if end is None else values[3 * start:3 * end]
+    if sys.byteorder == 'big':
+        chunk.byteswap()
+    if core.app.config.wire_format == 'msgpack':
+        return chunk.tobytes()
+    return base64.b64encode(chunk.tobytes()).decode()
@@ -1,9 +1,12 @@
 import importlib.util
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+import math
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 from typing_extensions import Self
 
-from .. import optional_features
+from .. import background_tasks, optional_features
+from ..dataclasses import KWONLY_SLOTS
 from ..element import Element
 from ..events import GenericEventArguments, TableSelectionEventArguments, ValueChangeEventArguments, handle_event
 from ..helpers import warn_once
@@ -15,6 +18,19 @@ if importlib.util.find_spec('pandas'):
         import pandas as pd
 
 
+@dataclass(**KWONLY_SLOTS)
+class TableRequest:
+    page: int
+    rows_per_page: int
+    sort_by: Optional[str]
+    descending: bool
+    filter: Optional[str]
+    columns: List[Dict]
+
+
+ROW_SOURCE = Union[List[Dict], 'pd.DataFrame', Callable[[TableRequest], Any]]
+
+
 class Table(FilterElement, component='table.js'):
 
     def __init__(self,
@@ -64,6 +80,8 @@ class Table(FilterElement, component='table.js'):
         self._props['fullscreen'] = False
         self._selection_handlers = [on_select] if on_select else []
         self._pagination_change_handlers = [on_pagination_change] if on_pagination_change else []
+        self._source: Optional[ROW_SOURCE] = None
+        self._request_count = 0
 
         def handle_selection(e: GenericEventArguments) -> None:
             if e.args['added']:
@@ -81,11 +99,14 @@ class Table(FilterElement, component='table.js'):
         def handle_pagination_change(e: GenericEventArguments) -> None:
             self.pagination = e.args
             self.update()
-            arguments = ValueChangeEventArguments(sender=self, client=self.client, value=self.pagination)
-            for handler in self._pagination_change_handlers:
-                handle_event(handler, arguments)
+            self._handle_pagination_change()
         self.on('update:pagination', handle_pagination_change)
 
+    def _handle_pagination_change(self) -> None:
+        arguments = ValueChangeEventArguments(sender=self, client=self.client, value=self.pagination)
+        for handler in self._pagination_change_handlers:
+            handle_event(handler, arguments)
+
     def on_select(self, callback: Callable[..., Any]) -> Self:
         """Add a callback to be invoked when the selection changes."""
         self._selection_handlers.append(callback)
@@ -168,6 +189,126 @@ class Table(FilterElement, component='table.js'):
             self.selected.clear()
         self.update()
 
+    @classmethod
+    def from_source(cls,
+                    source: ROW_SOURCE, *,
+                    columns: Optional[List[Dict]] = None,
+                    column_defaults: Optional[Dict] = None,
+                    row_key: str = 'id',
+                    title: Optional[str] = None,
+                    selection: Optional[Literal['single', 'multiple']] = None,
+                    rows_per_page: int = 10,
+                    on_select: Optional[Callable[..., Any]] = None,
+                    on_pagination_change: Optional[Callable[..., Any]] = None,
+                    ) -> Self:
+        """Create a table with server-side pagination, sorting and filtering.
+
+        Only the rows of the current page are sent to the browser.
+        When the user changes the page, the sorting or the filter, the rows are fetched from the source.
+
+        The source can be a list of rows, a Pandas DataFrame (which is sorted and filtered vectorized)
+        or a (possibly async) function which is called with a `TableRequest`
+        and returns a tuple of the rows of the requested page and the total number of (filtered) rows.
+        The latter allows to query a database, for example.
+
+        :param source: list of rows, Pandas DataFrame or function returning the rows of a page and the total number of rows
+        :param columns: list of column objects (defaults to the columns of the first row or the DataFrame; required for functions)
+        :param column_defaults: optional default column properties
+        :param row_key: name of the column containing unique data identifying the row (default: "id")
+        :param title: title of the table
+        :param selection: selection type ("single" or "multiple"; default: `None`)
+        :param rows_per_page: number of rows per page (0 means "all"; default: 10)
+        :param on_select: callback which is invoked when the selection changes
+        :param on_pagination_change: callback which is invoked when the pagination changes
+        :return: table element
+        """
+        if columns is None:
+            if callable(source):
+                raise ValueError('Columns must be specified for a function as row source.')
+            if isinstance(source, list):
+                first_row = source[0] if source else {}
+                columns = [{'name': key, 'label': str(key).upper(), 'field': key, 'sortable': True} for key in first_row]
+            else:
+                columns = [{'name': col, 'label': col, 'field': col, 'sortable': True} for col in source.columns]
+        table = cls(
+            rows=[],
+            columns=columns,
+            column_defaults=column_defaults,
+            row_key=row_key,
+            title=title,
+            selection=selection,
+            pagination={'page': 1, 'rowsPerPage': rows_per_page, 'sortBy': None, 'descending': False, 'rowsNumber': 0},
+            on_select=on_select,
+            on_pagination_change=on_pagination_change,
+        )
+        table._source = source
+        table.on('request', lambda e: table._request_rows(e.args['pagination']), ['pagination'])
+        table._request_rows(table.pagination)
+        return table
+
+    @property
+    def source(self) -> Optional[ROW_SOURCE]:
+        """The row source of a table with server-side pagination (see `from_source()`)."""
+        return self._source
+
+    @source.setter
+    def source(self, value: ROW_SOURCE) -> None:
+        self._source = value
+        self.reload()
+
+    def reload(self) -> None:
+        """Fetch the rows of the current page again from the row source (e.g. after the source has changed)."""
+        assert self._source is not None, 'Only tables created with `from_source()` can be reloaded.'
+        self._request_rows(self.pagination)
+
+    def _request_rows(self, pagination: Dict) -> None:
+        assert self._source is not None
+        request = TableRequest(
+            page=pagination.get('page') or 1,
+            rows_per_page=pagination.get('rowsPerPage') or 0,
+            sort_by=pagination.get('sortBy'),
+            descending=bool(pagination.get('descending')),
+            filter=self.filter or None,
+            columns=self.columns,
+        )
+        self._request_count += 1
+        request_count = self._request_count
+        if callable(self._source):
+            result = self._source(request)
+        elif isinstance(self._source, list):
+            result = _fetch_from_list(self._source, request)
+        else:
+            result = _fetch_from_df(self._source, request)
+
+        if not isinstance(result, Awaitable):
+            self._apply_rows(request, *result)
+            return
+
+        async def apply_result() -> None:
+            try:
+                rows, total = await result
+            finally:
+                if request_count == self._request_count:
+                    self._props['loading'] = False
+                    self.update()
+            if request_count == self._request_count:  # NOTE: otherwise a newer request is pending
+                self._apply_rows(request, rows, total)
+        self._props['loading'] = True
+        self.update()
+        background_tasks.create(apply_result(), name=f'request rows of table {self.id}')
+
+    def _apply_rows(self, request: TableRequest, rows: List[Dict], total: int) -> None:
+        self._props['rows'] = rows
+        self._props['pagination'] = {
+            'page': request.page,
+            'rowsPerPage': request.rows_per_page,
+            'sortBy': request.sort_by,
+            'descending': request.descending,
+            'rowsNumber': total,
+        }
+        self.update()
+        self._handle_pagination_change()
+
     @staticmethod
     def _df_to_rows_and_columns(df: 'pd.DataFrame') -> Tuple[List[Dict], List[Dict]]:
         import pandas as pd  # pylint: disable=import-outside-toplevel
@@ -347,3 +488,41 @@ class Table(FilterElement, component='table.js'):
             This element is based on Quasar's `QTd <https://quasar.dev/vue-components/table#qtd-api>`_ component.
             """
             super().__init__('q-td')
+
+
+def _page_slice(request: TableRequest, total: int) -> slice:
+    if not request.rows_per_page:
+        return slice(None)
+    request.page = max(1, min(request.page, math.ceil(total / request.rows_per_page)))
+    start = (request.page - 1) * request.rows_per_page
+    return slice(start, start + request.rows_per_page)
+
+
+def _sort_field(request: TableRequest) -> Optional[str]:
+    return next((column['field'] for column in request.columns
+                 if column['name'] == request.sort_by and isinstance(column.get('field'), str)), None)
+
+
+def _fetch_from_list(rows: List[Dict], request: TableRequest) -> Tuple[List[Dict], int]:
+    if request.filter:
+        term = request.filter.lower()
+        fields = [column['field'] for column in request.columns if isinstance(column.get('field'), str)]
+        rows = [row for row in rows if any(term in str(row.get(field)).lower() for field in fields)]
+    sort_field = _sort_field(request)
+    if sort_field is not None:
+        missing = [row for row in rows if row.get(sort_field) is None]
+        rows = sorted((row for row in rows if row.get(sort_field) is not None),
+                      key=lambda row: row[sort_field], reverse=request.descending) + missing
+    return rows[_page_slice(request, len(rows))], len(rows)
+
+
+def _fetch_from_df(df: 'pd.DataFrame', request: TableRequest) -> Tuple[List[Dict], int]:
+    if request.filter:
+        fields = [column['field'] for column in request.columns if column.get('field') in df.columns]
+        matches = df[fields].astype(str).apply(lambda values: values.str.contains(request.filter, case=False, regex=False))
+        df = df[matches.any(axis=1)]
+    sort_field = _sort_field(request)
+    if sort_field in df.columns:
+        df = df.sort_values(sort_field, ascending=not request.descending, kind='stable', na_position='last')
+    rows, _ = Table._df_to_rows_and_columns(df.iloc[_page_slice(request, len(df))])  # pylint: disable=protected-access
+    return rows, len(df)
@@ -1,7 +1,11 @@
 import asyncio
+import heapq
+import itertools
+import math
 import time
+import weakref
 from contextlib import nullcontext
-from typing import Any, Awaitable, Callable, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from .. import background_tasks, core
 from ..awaitable_response import AwaitableResponse
@@ -10,6 +14,8 @@ from ..client import Client
 from ..element import Element
 from ..logging import log
 
+CONNECTION_TIMEOUT = 60.0
+
 
 class Timer(Element, component='timer.js'):
     active = BindableProperty()
@@ -36,13 +42,16 @@ class Timer(Element, component='timer.js'):
         self.interval = interval
         self.callback: Optional[Callable[..., Any]] = callback
         self.active = active
+        self.once = once
         self._is_canceled: bool = False
+        self._is_waiting_for_connection: bool = False
+        self._entry_id: Optional[int] = None
+        self._due: float = 0.0
 
-        coroutine = self._run_once if once else self._run_in_loop
         if core.app.is_started:
-            background_tasks.create(coroutine(), name=str(callback))
+            self._start()
         else:
-            core.app.on_startup(coroutine)
+            core.app.on_startup(self._start)
 
     def activate(self) -> None:
         """Activate the timer."""
@@ -57,62 +66,72 @@ class Timer(Element, component='timer.js'):
         """Cancel the timer."""
         self._is_canceled = True
 
-    async def _run_once(self) -> None:
-        try:
-            if not await self._connected():
-                return
-            with self.parent_slot or nullcontext():
-                await asyncio.sleep(self.interval)
-                if self.active and not self._should_stop():
-                    await self._invoke_callback()
-        finally:
-            self._cleanup()
+    def _start(self) -> None:
+        """Schedule the first execution as soon as the client is connected.
 
-    async def _run_in_loop(self) -> None:
-        try:
-            if not await self._connected():
-                return
-            with self.parent_slot or nullcontext():
-                while not self._should_stop():
-                    try:
-                        start = time.time()
-                        if self.active:
-                            await self._invoke_callback()
-                        dt = time.time() - start
-                        await asyncio.sleep(self.interval - dt)
-                    except asyncio.CancelledError:
-                        break
-                    except Exception as e:
-                        core.app.handle_exception(e)
-                        await asyncio.sleep(self.interval)
-        finally:
+        Timers must not manipulate the state before the client is connected.
+        See https://github.com/zauberzeug/nicegui/issues/206 for details.
+        """
+        if self.client.shared or self.client.has_socket_connection:
+            self._schedule_first()
+        else:
+            scheduler.wait_for_connection(self)
+
+    def _schedule_first(self) -> None:
+        self._due = time.time() + self.interval if self.once else time.time()
+        scheduler.add(self, self._due)
+
+    def _schedule_next(self) -> None:
+        """Schedule the next execution one interval after the previous one, skipping already missed executions.
+
+        The execution is aligned to the phase shared by all timers with the same interval, so that they fire together.
+        """
+        now = time.time()
+        interval = self.interval
+        if interval <= 0:
+            self._due = now
+        else:
+            self._due = scheduler.align(interval, self._due + interval)
+            if self._due < now:
+                self._due += math.ceil((now - self._due) / interval) * interval
+        scheduler.add(self, self._due)
+
+    def _fire(self) -> None:
+        if self._should_stop():
             self._cleanup()
+            return
+        if not self.active:
+            if self.once:
+                self._cleanup()
+            else:
+                self._schedule_next()
+            return
+        result = None
+        with self.parent_slot or nullcontext():
+            try:
+                assert self.callback is not None
+                result = self.callback()
+            except Exception as e:
+                core.app.handle_exception(e)
+        if isinstance(result, Awaitable) and not isinstance(result, AwaitableResponse):
+            background_tasks.create(self._await_result(result), name=str(self.callback))
+        else:
+            self._handle_completion()
 
-    async def _invoke_callback(self) -> None:
+    async def _await_result(self, result: Awaitable) -> None:
         try:
-            assert self.callback is not None
-            result = self.callback()
-            if isinstance(result, Awaitable) and not isinstance(result, AwaitableResponse):
+            with self.parent_slot or nullcontext():
                 await result
         except Exception as e:
             core.app.handle_exception(e)
+        finally:
+            self._handle_completion()
 
-    async def _connected(self, timeout: float = 60.0) -> bool:
-        """Wait for the client connection before the timer callback can be allowed to manipulate the state.
-
-        See https://github.com/zauberzeug/nicegui/issues/206 for details.
-        Returns True if the client is connected, False if the client is not connected and the timer should be cancelled.
-        """
-        if self.client.shared:
-            return True
-
-        # ignore served pages which do not reconnect to backend (e.g. monitoring requests, scrapers etc.)
-        try:
-            await self.client.connected(timeout=timeout)
-            return True
-        except TimeoutError:
-            log.error(f'Timer cancelled because client is not connected after {timeout} seconds')
-            return False
+    def _handle_completion(self) -> None:
+        if self.once or self._should_stop():
+            self._cleanup()
+        else:
+            self._schedule_next()
 
     def _should_stop(self) -> bool:
         return (
@@ -128,3 +147,106 @@ class Timer(Element, component='timer.js'):
         if not self.client._deleted:  # pylint: disable=protected-access
             assert self.parent_slot
             self.parent_slot.parent.remove(self)
+
+
+class Scheduler:
+
+    def __init__(self) -> None:
+        """Run all timers in a single task.
+
+        The timers are kept in a heap ordered by their due time.
+        Timers which are due at the same time are fired in the same loop iteration.
+        The heap only holds weak references, so that outdated entries do not keep deleted timers alive.
+        Timers with the same interval share a phase, so that their executions are batched into a single wakeup.
+        Timers of clients which are not connected yet are started by the client's handshake.
+        """
+        self._heap: List[Tuple[float, int, weakref.ref[Timer]]] = []
+        self._entry_ids = itertools.count()
+        self._waiting: Dict[str, List[Timer]] = {}
+        self._phases: Dict[float, float] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def add(self, timer: Timer, due: float) -> None:
+        """Schedule the timer to fire at the given time (replacing a previously scheduled time)."""
+        self._ensure_running()
+        assert self._wakeup is not None
+        timer._entry_id = next(self._entry_ids)  # pylint: disable=protected-access
+        heapq.heappush(self._heap, (due, timer._entry_id, weakref.ref(timer)))  # pylint: disable=protected-access
+        if self._heap[0][1] == timer._entry_id:  # pylint: disable=protected-access
+            self._wakeup.set()
+
+    def align(self, interval: float, due: float) -> float:
+        """Move the due time to the closest execution of the phase of the given interval.
+
+        The phase of an interval is defined by the first timer which is aligned to it.
+        This shifts the due time by at most half an interval and only once, because later due times are aligned already.
+        """
+        phase = self._phases.setdefault(interval, due)
+        return phase + round((due - phase) / interval) * interval
+
+    def wait_for_connection(self, timer: Timer) -> None:
+        """Start the timer when its client connects or clean it up if the client does not connect in time."""
+        self._ensure_running()
+        client = timer.client
+        if client.id not in self._waiting:
+            self._waiting[client.id] = []
+            client.on_connect(lambda: self._release(client.id))
+        self._waiting[client.id].append(timer)
+        timer._is_waiting_for_connection = True  # pylint: disable=protected-access
+        self.add(timer, time.time() + CONNECTION_TIMEOUT)
+
+    def _release(self, client_id: str) -> None:
+        for timer in self._waiting.pop(client_id, []):
+            timer._is_waiting_for_connection = False  # pylint: disable=protected-access
+            timer._schedule_first()  # pylint: disable=protected-access
+
+    def _ensure_running(self) -> None:
+        if self._loop is core.loop:
+            return
+        self._heap.clear()
+        self._waiting.clear()
+        self._phases.clear()
+        self._loop = core.loop
+        self._wakeup = asyncio.Event()
+        background_tasks.create(self._run(), name='timer scheduler')
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        while True:
+            now = time.time()
+            self._fire_due_timers(now)
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self._heap[0][0] - now if self._heap else None)
+            except asyncio.TimeoutError:
+                pass
+
+    def _fire_due_timers(self, now: float) -> None:
+        while self._heap and self._heap[0][0] <= now:
+            _, entry_id, timer_ref = heapq.heappop(self._heap)
+            timer = timer_ref()
+            if timer is None or entry_id != timer._entry_id:  # pylint: disable=protected-access
+                continue  # NOTE: the timer has been rescheduled in the meantime
+            timer._entry_id = None  # pylint: disable=protected-access
+            try:
+                if timer._is_waiting_for_connection:  # pylint: disable=protected-access
+                    self._handle_connection_timeout(timer)
+                else:
+                    timer._fire()  # pylint: disable=protected-access
+            except Exception as e:
+                core.app.handle_exception(e)
+
+    def _handle_connection_timeout(self, timer: Timer) -> None:
+        # ignore served pages which do not reconnect to backend (e.g. monitoring requests, scrapers etc.)
+        waiting_timers = self._waiting.get(timer.client.id, [])
+        if timer in waiting_timers:
+            waiting_timers.remove(timer)
+        if not waiting_timers:
+            self._waiting.pop(timer.client.id, None)
+        timer._is_waiting_for_connection = False  # pylint: disable=protected-access
+        log.error(f'Timer cancelled because client is not connected after {CONNECTION_TIMEOUT} seconds')
+        timer._cleanup()  # pylint: disable=protected-access
+
+
+scheduler = Scheduler()
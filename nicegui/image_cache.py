@@ -0,0 +1,108 @@
+"""
+An in-memory cache serving images like PIL images or NumPy arrays under content-addressed URLs.
+
+Instead of embedding images as base64 data URLs into the element props,
+they are stored in this cache and referenced by a short URL containing a hash of the image data.
+Because the content of a URL never changes, the browser can cache the image indefinitely
+and repeated frames or re-renders only send the URL.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from fastapi import HTTPException
+from fastapi.responses import Response
+
+from .version import __version__
+
+URL_PREFIX = f'/_nicegui/{__version__}/images/'
+
+
+class ImageCache:
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """Size-bounded cache of encoded images.
+
+        Images which are still referenced by an element are never evicted.
+        Unreferenced images are kept until the total size exceeds `max_bytes`
+        so that browsers can still load them, e.g. when a page is reloaded.
+        Then the least recently used images are evicted first.
+        """
+        self.max_bytes = max_bytes
+        self._images: OrderedDict[str, Tuple[bytes, str]] = OrderedDict()
+        self._references: Dict[str, int] = {}
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        """The total number of bytes of all cached images."""
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._images)
+
+    def __contains__(self, url: object) -> bool:
+        return isinstance(url, str) and url.startswith(URL_PREFIX) and url[len(URL_PREFIX):] in self._images
+
+    def add(self, data: bytes, media_type: str) -> str:
+        """Add an image, increase its reference count and return its URL.
+
+        :param data: the encoded image
+        :param media_type: the media type of the image (e.g. "image/png")
+        """
+        key = hashlib.sha256(data).hexdigest()[:32]
+        if key in self._images:
+            self._images.move_to_end(key)
+        else:
+            self._images[key] = (data, media_type)
+            self._size += len(data)
+        self._references[key] = self._references.get(key, 0) + 1
+        self._evict()
+        return URL_PREFIX + key
+
+    def release(self, url: Optional[str]) -> None:
+        """Decrease the reference count of the image with the given URL (if it is cached)."""
+        if url not in self:
+            return
+        assert url is not None
+        key = url[len(URL_PREFIX):]
+        if self._references.get(key, 0) > 1:
+            self._references[key] -= 1
+        else:
+            self._references.pop(key, None)
+            self._evict()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        """Get the encoded image and its media type for the given key."""
+        if key not in self._images:
+            return None
+        self._images.move_to_end(key)
+        return self._images[key]
+
+    def clear(self) -> None:
+        """Remove all images."""
+        self._images.clear()
+        self._references.clear()
+        self._size = 0
+
+    def _evict(self) -> None:
+        if self._size <= self.max_bytes:
+            return
+        for key in list(self._images):
+            if self._size <= self.max_bytes:
+                break
+            if key in self._references:
+                continue
+            data, _ = self._images.pop(key)
+            self._size -= len(data)
+
+    def response(self, key: str) -> Response:
+        """Create a response serving the image with the given key (or raise an HTTP 404 error)."""
+        image = self.get(key)
+        if image is None:
+            raise HTTPException(status_code=404, detail=f'image "{key}" not found')
+        data, media_type = image
+        return Response(data, media_type=media_type, headers={'Cache-Control': 'public, max-age=31536000, immutable'})
+
+
+image_cache = ImageCache()
@@ -3,19 +3,35 @@ Custom json module. Provides dumps and loads implementations
 wrapping the orjson package. If the orjson package is not available,
 the standard Python json module is used.
 
+A `Fragment` holds already serialized JSON which can be embedded into other objects without serializing it again.
+`join` combines already serialized values into a serialized JSON object.
+
 This custom module is required in order to override the json-module used
 in socketio.AsyncServer, which expects a module as parameter
 to override Python's default json module.
 """
 
+from typing import Dict
+
 try:
-    from nicegui.json.orjson_wrapper import NiceGUIJSONResponse, dumps, loads
+    from nicegui.json.orjson_wrapper import Fragment, NiceGUIJSONResponse, dumps, loads
 except ImportError:
-    from nicegui.json.builtin_wrapper import NiceGUIJSONResponse, dumps, loads  # type: ignore
+    from nicegui.json.builtin_wrapper import Fragment, NiceGUIJSONResponse, dumps, loads  # type: ignore
+
+
+def join(encoded_items: Dict[str, str]) -> str:
+    """Join already serialized values into a serialized JSON object.
+
+    The keys must be strings; they are still serialized because they may contain quotes or backslashes.
+    """
+    assert all(isinstance(key, str) for key in encoded_items), 'keys must be strings'
+    return '{' + ','.join(f'{dumps(key)}:{value}' for key, value in encoded_items.items()) + '}'
 
 
 __all__ = [
+    'Fragment',
     'dumps',
+    'join',
     'loads',
     'NiceGUIJSONResponse'
 ]
@@ -1,7 +1,7 @@
 import importlib.util
 import json
 from datetime import date, datetime
-from typing import Any, Optional, Tuple
+from typing import Any, Optional, Tuple, Union
 
 from fastapi import Response
 
@@ -28,6 +28,17 @@ def dumps(obj: Any,
         cls=NumpyJsonEncoder)
 
 
+class Fragment:
+    """Already serialized JSON which is embedded as it is when serializing an enclosing object.
+
+    This mimics `orjson.Fragment`.
+    Note that Python's default json module cannot embed raw JSON, so the content is parsed and serialized again.
+    """
+
+    def __init__(self, contents: Union[str, bytes]) -> None:
+        self.contents = contents
+
+
 def loads(value: str) -> Any:
     """Deserialize a JSON-encoded string to a corresponding Python object/value.
 
@@ -48,6 +59,8 @@ class NumpyJsonEncoder(json.JSONEncoder):
     """Special json encoder that supports NumPy arrays and date/datetime objects."""
 
     def default(self, o):
+        if isinstance(o, Fragment):
+            return json.loads(o.contents)
         if HAS_NUMPY:
             import numpy as np  # pylint: disable=import-outside-toplevel
             if isinstance(o, np.integer):
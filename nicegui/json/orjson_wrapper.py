@@ -10,6 +10,8 @@ HAS_NUMPY = importlib.util.find_spec('numpy') is not None
 
 ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
 
+Fragment = orjson.Fragment
+
 
 def dumps(obj: Any,
           sort_keys: bool = False,
@@ -0,0 +1,64 @@
+"""
+Socket.IO packets serialized with MessagePack instead of JSON.
+
+NumPy arrays with a numeric dtype are transmitted as raw bytes and arrive as typed arrays in the browser.
+Everything else MessagePack can not represent natively (e.g. JSON fragments, NumPy scalars or Decimals)
+is embedded as JSON, so that the payload is the same as with the default JSON serialization.
+
+The counterpart for the browser is implemented in static/msgpack.js.
+"""
+import importlib.util
+from typing import Any, Dict
+
+import msgpack
+from socketio.packet import Packet
+
+from . import json
+
+HAS_NUMPY = importlib.util.find_spec('numpy') is not None
+
+JSON_EXT_TYPE = 0
+TYPED_ARRAY_EXT_TYPES: Dict[str, int] = {  # NOTE: needs to match the extension types in static/msgpack.js
+    'int8': 1,
+    'uint8': 2,
+    'int16': 3,
+    'uint16': 4,
+    'int32': 5,
+    'uint32': 6,
+    'float32': 7,
+    'float64': 8,
+    'int64': 9,
+    'uint64': 10,
+}
+
+
+class MsgPackPacket(Packet):
+    uses_binary_events = False
+
+    def encode(self) -> bytes:
+        """Encode the packet for transmission."""
+        return msgpack.packb(self._to_dict(), default=_encode_default)
+
+    def decode(self, encoded_packet: bytes) -> None:
+        """Decode a transmitted packet."""
+        decoded = msgpack.unpackb(encoded_packet)
+        self.packet_type = decoded['type']
+        self.data = decoded.get('data')
+        self.id = decoded.get('id')
+        self.namespace = decoded['nsp']
+
+
+def _encode_default(obj: Any) -> Any:
+    """Convert objects which MessagePack can not serialize natively."""
+    if HAS_NUMPY:
+        import numpy as np  # pylint: disable=import-outside-toplevel
+        if isinstance(obj, np.generic):
+            return obj.item()
+        if isinstance(obj, np.ndarray) and obj.dtype.name in TYPED_ARRAY_EXT_TYPES:
+            if obj.ndim == 0:
+                return obj.item()
+            if obj.ndim > 1:
+                return list(obj)
+            little_endian = obj.astype(obj.dtype.newbyteorder('<'), copy=False)
+            return msgpack.ExtType(TYPED_ARRAY_EXT_TYPES[obj.dtype.name], little_endian.tobytes())
+    return msgpack.ExtType(JSON_EXT_TYPE, json.dumps(obj).encode())
@@ -16,6 +16,7 @@ from .app import App
 from .client import Client
 from .dependencies import js_components, libraries, resources
 from .error import error_content
+from .image_cache import image_cache
 from .json import NiceGUIJSONResponse
 from .logging import log
 from .middlewares import RedirectWithPrefixMiddleware
@@ -107,6 +108,11 @@ def _get_resource(key: str, path: str) -> FileResponse:
     raise HTTPException(status_code=404, detail=f'resource "{key}" not found')
 
 
+@app.get(f'/_nicegui/{__version__}' + '/images/{key}')
+def _get_image(key: str) -> Response:
+    return image_cache.response(key)
+
+
 async def _startup() -> None:
     """Handle the startup event."""
     if not app.config.has_run_config:
@@ -117,6 +123,11 @@ async def _startup() -> None:
                            'remove the guard or replace it with\n'
                            '   if __name__ in {"__main__", "__mp_main__"}:\n'
                            'to allow for multiprocessing.')
+    if app.config.wire_format == 'msgpack':
+        if core.air is not None:
+            raise RuntimeError('NiceGUI On Air does not support the msgpack wire format.')
+        from .msgpack_packet import MsgPackPacket  # pylint: disable=import-outside-toplevel
+        sio.packet_class = MsgPackPacket
     await welcome.collect_urls()
     # NOTE ping interval and timeout need to be lower than the reconnect timeout, but can't be too low
     sio.eio.ping_interval = max(app.config.reconnect_timeout * 0.8, 4)
@@ -134,6 +145,7 @@ async def _startup() -> None:
     background_tasks.create(Client.prune_instances(), name='prune clients')
     background_tasks.create(Slot.prune_stacks(), name='prune slot stacks')
     background_tasks.create(core.app.storage.prune_tab_storage(), name='prune tab storage')
+    background_tasks.create(core.app.storage.prune_user_storage(), name='prune user storage')
     air.connect()
 
 
@@ -143,6 +155,7 @@ async def _shutdown() -> None:
         app.native.webview_proxy.stop()
     air.disconnect()
     app.stop()
+    app.storage.flush()
     run.tear_down()
 
 
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+import time
 from collections import deque
-from typing import TYPE_CHECKING, Any, Deque, Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List, Optional, Tuple
 
-from . import background_tasks, core
+from . import background_tasks, core, json
 
 if TYPE_CHECKING:
     from .client import Client
@@ -14,6 +15,10 @@ ClientId = str
 ElementId = int
 MessageType = str
 Message = Tuple[ClientId, MessageType, Any]
+Snapshot = Dict[str, Any]
+
+NESTED_KEYS = ('props', 'style')
+"""Keys of an element dictionary whose entries are compared and patched individually."""
 
 
 class Outbox:
@@ -22,6 +27,10 @@ class Outbox:
         self.client = client
         self.updates: Dict[ElementId, Optional[Element]] = {}
         self.messages: Deque[Message] = deque()
+        self._snapshots: Dict[ElementId, Snapshot] = {}
+        self._flush_callbacks: Dict[Callable[[], None], None] = {}
+        self.flush_interval: Optional[float] = None
+        self._last_flush = 0.0
         self._should_stop = False
         self._enqueue_event: Optional[asyncio.Event] = None
         if core.app.is_started:
@@ -44,6 +53,7 @@ class Outbox:
         """Enqueue a deletion for the given element."""
         self.client.check_existence()
         self.updates[element.id] = None
+        self._snapshots.pop(element.id, None)
         self._set_enqueue_event()
 
     def enqueue_message(self, message_type: MessageType, data: Any, target_id: ClientId) -> None:
@@ -52,6 +62,96 @@ class Outbox:
         self.messages.append((target_id, message_type, data))
         self._set_enqueue_event()
 
+    def enqueue_method_call(self,
+                            element_id: ElementId,
+                            name: str,
+                            args: Any,
+                            target_id: ClientId,
+                            request_id: Optional[str] = None) -> None:
+        """Enqueue a call of an element's method on the client.
+
+        Consecutive method calls for the same client are sent as a single "method_calls" message.
+        With the JSON wire format, the arguments are serialized right away, so that later changes of mutable arguments are not sent.
+        With the msgpack wire format, they are kept as they are, so that NumPy arrays can be sent as binary typed arrays.
+        """
+        if core.app.config.wire_format == 'json':
+            args = json.Fragment(json.dumps(args))
+        call = [element_id, name, args] if request_id is None else [element_id, name, args, request_id]
+        self.enqueue_message('method_call', call, target_id)
+
+    def before_next_flush(self, callback: Callable[[], None]) -> None:
+        """Call the given callback once right before the next flush, e.g. to enqueue buffered messages.
+
+        Registering the same callback multiple times before a flush only calls it once.
+        """
+        self._flush_callbacks[callback] = None
+        self._set_enqueue_event()
+
+    def forget(self, element: Element, prop: Optional[str] = None) -> None:
+        """Forget what has been sent for the given element so that the next update is sent in full.
+
+        This is needed whenever the browser changes the state of an element on its own,
+        e.g. when a value element without loopback updates its model value.
+
+        :param element: the element to forget
+        :param prop: only forget the given prop (default: forget the whole element)
+        """
+        if prop is None:
+            self._snapshots.pop(element.id, None)
+        elif element.id in self._snapshots:
+            self._snapshots[element.id].get('props', {}).pop(prop, None)
+
+    def forget_all(self) -> None:
+        """Forget what has been sent for all elements so that the next updates are sent in full (e.g. after reconnecting)."""
+        self._snapshots.clear()
+
+    def clear_updates(self) -> None:
+        """Discard all pending updates, e.g. because the whole page is rendered from scratch."""
+        for element_id in self.updates:
+            self._snapshots.pop(element_id, None)
+        self.updates.clear()
+
+    def _encode_updates(self) -> Optional[json.Fragment]:
+        """Encode full elements or patches for all pending updates into a single JSON fragment and clear the queue.
+
+        The serialized entries of the element snapshots are joined instead of serializing the elements again.
+        The resulting fragment is embedded as it is by Socket.IO and On Air, no matter how many browsers receive it.
+        """
+        encoded_elements: Dict[str, str] = {}
+        for element_id, element in self.updates.items():
+            if element is None:
+                encoded_elements[str(element_id)] = 'null'
+                continue
+            snapshot = _take_snapshot(element._to_dict())  # pylint: disable=protected-access
+            previous_snapshot = self._snapshots.get(element_id)
+            self._snapshots[element_id] = snapshot
+            if previous_snapshot is None:
+                encoded_elements[str(element_id)] = _encode_snapshot(snapshot)
+                continue
+            patch = _encode_patch(previous_snapshot, snapshot)
+            if patch is not None:
+                encoded_elements[str(element_id)] = json.join({'patch': patch})
+        self.updates.clear()
+        return json.Fragment(json.join(encoded_elements)) if encoded_elements else None
+
+    def resolve_flush_interval(self) -> float:
+        """Return the minimum time between two flushes for this client (falling back to the page and the run config)."""
+        return self.flush_interval if self.flush_interval is not None else self.client.page.resolve_flush_interval()
+
+    async def _wait_for_next_flush(self) -> None:
+        """Wait until the flush interval has passed since the last flush or the batch size has been reached."""
+        deadline = self._last_flush + self.resolve_flush_interval()
+        while len(self.updates) + len(self.messages) < core.app.config.flush_batch_size:
+            timeout = deadline - time.time()
+            if timeout <= 0:
+                return
+            assert self._enqueue_event is not None
+            self._enqueue_event.clear()
+            try:
+                await asyncio.wait_for(self._enqueue_event.wait(), timeout=timeout)
+            except (TimeoutError, asyncio.TimeoutError):
+                return
+
     async def loop(self) -> None:
         """Send updates and messages to all clients in an endless loop."""
         self._enqueue_event = asyncio.Event()
@@ -69,22 +169,43 @@ class Outbox:
                     await asyncio.sleep(0.1)
                     continue
 
+                await self._wait_for_next_flush()
+                if self._flush_callbacks:
+                    callbacks = list(self._flush_callbacks)
+                    self._flush_callbacks.clear()
+                    for callback in callbacks:
+                        try:
+                            callback()
+                        except Exception as e:
+                            core.app.handle_exception(e)
                 self._enqueue_event.clear()
+                self._last_flush = time.time()
 
-                coros = []
+                # NOTE: consecutive messages for the same target are batched, but a new frame is started whenever the
+                # target changes, so that messages for an individual socket and for the whole client keep their order
+                frames: List[Tuple[ClientId, List[Tuple[MessageType, Any]]]] = []
                 if self.updates:
-                    data = {
-                        element_id: None if element is None else element._to_dict()  # pylint: disable=protected-access
-                        for element_id, element in self.updates.items()
-                    }
-                    coros.append(self._emit('update', data, self.client.id))
-                    self.updates.clear()
+                    data = self._encode_updates()
+                    if data is not None:
+                        frames.append((self.client.id, [('update', data)]))
 
                 if self.messages:
                     for target_id, message_type, data in self.messages:
-                        coros.append(self._emit(message_type, data, target_id))
+                        if not frames or frames[-1][0] != target_id:
+                            frames.append((target_id, []))
+                        frame = frames[-1][1]
+                        if message_type != 'method_call':
+                            frame.append((message_type, data))
+                        elif frame and frame[-1][0] == 'method_calls':
+                            frame[-1][1].append(data)
+                        else:
+                            frame.append(('method_calls', [data]))
                     self.messages.clear()
 
+                coros = [
+                    self._emit(*frame[0], target_id) if len(frame) == 1 else self._emit('batch', frame, target_id)
+                    for target_id, frame in frames
+                ]
                 for coro in coros:
                     try:
                         await coro
@@ -103,3 +224,45 @@ class Outbox:
     def stop(self) -> None:
         """Stop the outbox loop."""
         self._should_stop = True
+
+
+def _take_snapshot(element_dict: Dict[str, Any]) -> Snapshot:
+    """Serialize each entry of an element dictionary so that it can be compared with later versions."""
+    return {
+        key: {k: json.dumps(v) for k, v in value.items()} if key in NESTED_KEYS else json.dumps(value)
+        for key, value in element_dict.items()
+    }
+
+
+def _encode_snapshot(snapshot: Snapshot) -> str:
+    """Encode a snapshot as a serialized element dictionary."""
+    return json.join({key: json.join(value) if key in NESTED_KEYS else value for key, value in snapshot.items()})
+
+
+def _encode_patch(old: Snapshot, new: Snapshot) -> Optional[str]:
+    """Encode a patch containing only the entries that differ between two snapshots (or None if there are none).
+
+    Top-level entries are replaced as a whole, while entries of props and style are patched individually.
+    """
+    patch: Dict[str, str] = {}
+    set_ = {key: value for key, value in new.items() if key not in NESTED_KEYS and old.get(key) != value}
+    unset = [key for key in old if key not in new]
+    if set_:
+        patch['set'] = json.join(set_)
+    if unset:
+        patch['unset'] = json.dumps(unset)
+    for key in NESTED_KEYS:
+        if key not in new:
+            continue
+        old_values: Dict[str, str] = old.get(key, {})
+        new_values: Dict[str, str] = new[key]
+        nested_set = {k: v for k, v in new_values.items() if old_values.get(k) != v}
+        nested_unset = [k for k in old_values if k not in new_values]
+        nested_patch: Dict[str, str] = {}
+        if nested_set:
+            nested_patch['set'] = json.join(nested_set)
+        if nested_unset:
+            nested_patch['unset'] = json.dumps(nested_unset)
+        if nested_patch:
+            patch[key] = json.join(nested_patch)
+    return json.join(patch) if patch else None
@@ -2,7 +2,6 @@ from __future__ import annotations
 
 import asyncio
 import inspect
-import time
 from functools import wraps
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Optional, Union
@@ -30,6 +29,7 @@ class page:
                  language: Language = ...,  # type: ignore
                  response_timeout: float = 3.0,
                  reconnect_timeout: Optional[float] = None,
+                 flush_interval: Optional[float] = None,
                  api_router: Optional[APIRouter] = None,
                  **kwargs: Any,
                  ) -> None:
@@ -52,6 +52,7 @@ class page:
         :param language: language of the page (defaults to `language` argument of `run` command)
         :param response_timeout: maximum time for the decorated function to build the page (default: 3.0 seconds)
         :param reconnect_timeout: maximum time the server waits for the browser to reconnect (default: 0.0 seconds)
+        :param flush_interval: minimum time between two transmissions of updates and messages to a client (defaults to `flush_interval` argument of `run` command)
         :param api_router: APIRouter instance to use, can be left `None` to use the default
         :param kwargs: additional keyword arguments passed to FastAPI's @app.get method
         """
@@ -65,6 +66,7 @@ class page:
         self.kwargs = kwargs
         self.api_router = api_router or core.app.router
         self.reconnect_timeout = reconnect_timeout
+        self.flush_interval = flush_interval
 
         create_favicon_route(self.path, favicon)
 
@@ -89,6 +91,10 @@ class page:
         """Return the language of the page."""
         return self.language if self.language is not ... else core.app.config.language
 
+    def resolve_flush_interval(self) -> float:
+        """Return the minimum time between two transmissions of updates and messages."""
+        return self.flush_interval if self.flush_interval is not None else core.app.config.flush_interval
+
     def __call__(self, func: Callable[..., Any]) -> Callable[..., Any]:
         core.app.remove_route(self.path)  # NOTE make sure only the latest route definition is used
         parameters_of_decorated_func = list(inspect.signature(func).parameters.keys())
@@ -115,11 +121,16 @@ class page:
                     with client:
                         return await result
                 task = background_tasks.create(wait_for_result())
-                deadline = time.time() + self.response_timeout
-                while task and not client.is_waiting_for_connection and not task.done():
-                    if time.time() > deadline:
-                        raise TimeoutError(f'Response not ready after {self.response_timeout} seconds')
-                    await asyncio.sleep(0.1)
+                # NOTE: return the response early if the page builder waits for the client connection
+                connection_requested = asyncio.ensure_future(
+                    client._connection_requested())  # pylint: disable=protected-access
+                try:
+                    await asyncio.wait([task, connection_requested], timeout=self.response_timeout,
+                                       return_when=asyncio.FIRST_COMPLETED)
+                finally:
+                    connection_requested.cancel()
+                if not task.done() and not client.is_waiting_for_connection:
+                    raise TimeoutError(f'Response not ready after {self.response_timeout} seconds')
                 if task.done():
                     result = task.result()
                 else:
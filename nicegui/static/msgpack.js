@@ -0,0 +1,266 @@
+// MessagePack parser for Socket.IO (counterpart of nicegui/msgpack_packet.py).
+// Extension type 0 contains embedded JSON, extension types 1 to 10 contain typed arrays.
+const msgpackParser = (() => {
+  const textEncoder = new TextEncoder();
+  const textDecoder = new TextDecoder();
+
+  const JSON_EXT_TYPE = 0;
+  const TYPED_ARRAYS = {
+    1: Int8Array,
+    2: Uint8Array,
+    3: Int16Array,
+    4: Uint16Array,
+    5: Int32Array,
+    6: Uint32Array,
+    7: Float32Array,
+    8: Float64Array,
+    9: BigInt64Array,
+    10: BigUint64Array,
+  };
+
+  function decodeExt(type, bytes) {
+    if (type === JSON_EXT_TYPE) return JSON.parse(textDecoder.decode(bytes));
+    const TypedArray = TYPED_ARRAYS[type];
+    if (!TypedArray) throw new Error(`unknown MessagePack extension type ${type}`);
+    const array = new TypedArray(bytes.slice().buffer); // NOTE: copy to get an aligned buffer
+    return array instanceof BigInt64Array || array instanceof BigUint64Array ? Float64Array.from(array, Number) : array;
+  }
+
+  function decode(buffer) {
+    const bytes = buffer instanceof Uint8Array ? buffer : new Uint8Array(buffer);
+    const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength);
+    let offset = 0;
+
+    function read(length) {
+      const result = bytes.subarray(offset, offset + length);
+      offset += length;
+      return result;
+    }
+    function readString(length) {
+      return textDecoder.decode(read(length));
+    }
+    function readArray(length) {
+      const result = new Array(length);
+      for (let i = 0; i < length; i++) result[i] = readValue();
+      return result;
+    }
+    function readMap(length) {
+      const result = {};
+      for (let i = 0; i < length; i++) {
+        const key = readValue();
+        result[key] = readValue();
+      }
+      return result;
+    }
+    function readExt(length) {
+      const type = view.getInt8(offset++);
+      return decodeExt(type, read(length));
+    }
+    function readUint(length) {
+      const value =
+        length === 1
+          ? view.getUint8(offset)
+          : length === 2
+            ? view.getUint16(offset)
+            : length === 4
+              ? view.getUint32(offset)
+              : Number(view.getBigUint64(offset));
+      offset += length;
+      return value;
+    }
+    function readInt(length) {
+      const value =
+        length === 1
+          ? view.getInt8(offset)
+          : length === 2
+            ? view.getInt16(offset)
+            : length === 4
+              ? view.getInt32(offset)
+              : Number(view.getBigInt64(offset));
+      offset += length;
+      return value;
+    }
+    function readValue() {
+      const byte = view.getUint8(offset++);
+      if (byte <= 0x7f) return byte;
+      if (byte <= 0x8f) return readMap(byte & 0x0f);
+      if (byte <= 0x9f) return readArray(byte & 0x0f);
+      if (byte <= 0xbf) return readString(byte & 0x1f);
+      if (byte >= 0xe0) return byte - 0x100;
+      switch (byte) {
+        case 0xc0:
+          return null;
+        case 0xc2:
+          return false;
+        case 0xc3:
+          return true;
+        case 0xc4:
+        case 0xc5:
+        case 0xc6:
+          return read(readUint(1 << (byte - 0xc4))).slice();
+        case 0xc7:
+        case 0xc8:
+        case 0xc9:
+          return readExt(readUint(1 << (byte - 0xc7)));
+        case 0xca: {
+          const value = view.getFloat32(offset);
+          offset += 4;
+          return value;
+        }
+        case 0xcb: {
+          const value = view.getFloat64(offset);
+          offset += 8;
+          return value;
+        }
+        case 0xcc:
+        case 0xcd:
+        case 0xce:
+        case 0xcf:
+          return readUint(1 << (byte - 0xcc));
+        case 0xd0:
+        case 0xd1:
+        case 0xd2:
+        case 0xd3:
+          return readInt(1 << (byte - 0xd0));
+        case 0xd4:
+        case 0xd5:
+        case 0xd6:
+        case 0xd7:
+        case 0xd8:
+          return readExt(1 << (byte - 0xd4));
+        case 0xd9:
+        case 0xda:
+        case 0xdb:
+          return readString(readUint(1 << (byte - 0xd9)));
+        case 0xdc:
+        case 0xdd:
+          return readArray(readUint(2 << (byte - 0xdc)));
+        case 0xde:
+        case 0xdf:
+          return readMap(readUint(2 << (byte - 0xde)));
+      }
+      throw new Error(`invalid MessagePack byte 0x${byte.toString(16)}`);
+    }
+
+    return readValue();
+  }
+
+  function encode(value) {
+    const chunks = [];
+    let size = 0;
+
+    function push(chunk) {
+      chunks.push(chunk);
+      size += chunk.length;
+    }
+    function pushHeader(byte, length, lengthBytes) {
+      const header = new Uint8Array(1 + lengthBytes);
+      const view = new DataView(header.buffer);
+      header[0] = byte;
+      if (lengthBytes === 1) view.setUint8(1, length);
+      if (lengthBytes === 2) view.setUint16(1, length);
+      if (lengthBytes === 4) view.setUint32(1, length);
+      push(header);
+    }
+    function pushLength(length, fixByte, fixLimit, byte8, byte16, byte32) {
+      if (length < fixLimit) push(new Uint8Array([fixByte | length]));
+      else if (byte8 !== null && length < 0x100) pushHeader(byte8, length, 1);
+      else if (length < 0x10000) pushHeader(byte16, length, 2);
+      else pushHeader(byte32, length, 4);
+    }
+    function pushNumber(number) {
+      const chunk = new Uint8Array(9);
+      const view = new DataView(chunk.buffer);
+      if (Number.isSafeInteger(number) && number >= -0x80000000 && number <= 0xffffffff) {
+        if (number >= 0 && number <= 0x7f) return push(new Uint8Array([number]));
+        if (number < 0 && number >= -0x20) return push(new Uint8Array([number + 0x100]));
+        if (number >= 0) {
+          chunk[0] = 0xce;
+          view.setUint32(1, number);
+        } else {
+          chunk[0] = 0xd2;
+          view.setInt32(1, number);
+        }
+        return push(chunk.subarray(0, 5));
+      }
+      if (Number.isSafeInteger(number)) {
+        chunk[0] = 0xd3;
+        view.setBigInt64(1, BigInt(number));
+        return push(chunk);
+      }
+      chunk[0] = 0xcb;
+      view.setFloat64(1, number);
+      push(chunk);
+    }
+    function pushValue(value) {
+      if (value === null || value === undefined) return push(new Uint8Array([0xc0]));
+      if (value === false) return push(new Uint8Array([0xc2]));
+      if (value === true) return push(new Uint8Array([0xc3]));
+      if (typeof value === "number") return pushNumber(value);
+      if (typeof value === "bigint") return pushNumber(Number(value));
+      if (typeof value === "string") {
+        const bytes = textEncoder.encode(value);
+        pushLength(bytes.length, 0xa0, 0x20, 0xd9, 0xda, 0xdb);
+        return push(bytes);
+      }
+      if (value instanceof ArrayBuffer || ArrayBuffer.isView(value)) {
+        const bytes = value instanceof ArrayBuffer ? new Uint8Array(value) : new Uint8Array(value.buffer, value.byteOffset, value.byteLength);
+        pushLength(bytes.length, 0xc4, 0, 0xc4, 0xc5, 0xc6);
+        return push(bytes);
+      }
+      if (typeof value.toJSON === "function") return pushValue(value.toJSON());
+      if (Array.isArray(value)) {
+        pushLength(value.length, 0x90, 0x10, null, 0xdc, 0xdd);
+        return value.forEach(pushValue);
+      }
+      const entries = Object.entries(value).filter(([_, v]) => v !== undefined && typeof v !== "function");
+      pushLength(entries.length, 0x80, 0x10, null, 0xde, 0xdf);
+      for (const [k, v] of entries) {
+        pushValue(k);
+        pushValue(v);
+      }
+    }
+
+    pushValue(value);
+    const result = new Uint8Array(size);
+    let offset = 0;
+    for (const chunk of chunks) {
+      result.set(chunk, offset);
+      offset += chunk.length;
+    }
+    return result;
+  }
+
+  class Encoder {
+    encode(packet) {
+      return [encode(packet)];
+    }
+  }
+
+  class Decoder {
+    constructor() {
+      this.callbacks = {};
+    }
+    on(event, callback) {
+      (this.callbacks[event] = this.callbacks[event] || []).push(callback);
+      return this;
+    }
+    off(event, callback) {
+      if (event === undefined) this.callbacks = {};
+      else if (callback === undefined) delete this.callbacks[event];
+      else this.callbacks[event] = (this.callbacks[event] || []).filter((c) => c !== callback);
+      return this;
+    }
+    emit(event, ...args) {
+      for (const callback of [...(this.callbacks[event] || [])]) callback(...args);
+      return this;
+    }
+    add(chunk) {
+      if (typeof chunk === "string") throw new Error("unexpected text frame for MessagePack parser");
+      this.emit("decoded", decode(chunk));
+    }
+    destroy() {}
+  }
+
+  return { Encoder, Decoder, encode, decode };
+})();
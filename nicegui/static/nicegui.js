@@ -9,14 +9,7 @@ const loaded_libraries = new Set();
 const loaded_components = new Set();
 
 function parseElements(raw_elements) {
-  return JSON.parse(
-    raw_elements
-      .replace(/&#36;/g, "$")
-      .replace(/&#96;/g, "`")
-      .replace(/&gt;/g, ">")
-      .replace(/&lt;/g, "<")
-      .replace(/&amp;/g, "&")
-  );
+  return JSON.parse(raw_elements);
 }
 
 function replaceUndefinedAttributes(elements, id) {
@@ -32,12 +25,22 @@ function replaceUndefinedAttributes(elements, id) {
   element.component ??= null;
   element.libraries ??= [];
   element.slots = {
-    default: { ids: element.children || [] },
     ...(element.slots ?? {}),
+    default: { ids: element.children || [] },
   };
   Object.values(element.slots).forEach((slot) => slot.ids.forEach((id) => replaceUndefinedAttributes(elements, id)));
 }
 
+function applyPatch(element, patch) {
+  (patch.unset ?? []).forEach((key) => delete element[key]);
+  Object.assign(element, patch.set ?? {});
+  for (const key of ["props", "style"]) {
+    if (!patch[key]) continue;
+    (patch[key].unset ?? []).forEach((name) => delete element[key][name]);
+    Object.assign(element[key], patch[key].set ?? {});
+  }
+}
+
 function getElement(id) {
   const _id = id instanceof HTMLElement ? id.id : id;
   return mounted_app.$refs["r" + _id];
@@ -62,6 +65,19 @@ function runMethod(target, method_name, args) {
   }
 }
 
+function callMethod([id, method_name, args, request_id]) {
+  try {
+    const result = runMethod(id, method_name, args);
+    if (request_id) {
+      Promise.resolve(result).then((result) => {
+        window.socket.emit("javascript_response", { request_id, client_id: window.clientId, result });
+      });
+    }
+  } catch (error) {
+    console.error(error);
+  }
+}
+
 function getComputedProp(target, prop_name) {
   if (typeof target === "object" && prop_name in target) {
     return target[prop_name];
@@ -311,6 +327,7 @@ function createApp(elements, options) {
         query: options.query,
         extraHeaders: options.extraHeaders,
         transports: options.transports,
+        parser: options.wireFormat === "msgpack" ? msgpackParser : undefined,
       });
       window.did_handshake = false;
       const messageHandlers = {
@@ -350,6 +367,15 @@ function createApp(elements, options) {
               delete this.elements[id];
               continue;
             }
+            if (element.patch) {
+              if (this.elements[id] === undefined) continue;
+              if (element.patch.set?.component || element.patch.set?.libraries) {
+                await loadDependencies(element.patch.set, options.prefix, options.version);
+              }
+              applyPatch(this.elements[id], element.patch);
+              replaceUndefinedAttributes(this.elements, id);
+              continue;
+            }
             if (element.component || element.libraries) {
               await loadDependencies(element, options.prefix, options.version);
             }
@@ -358,6 +384,7 @@ function createApp(elements, options) {
           }
         },
         run_javascript: (msg) => runJavascript(msg["code"], msg["request_id"]),
+        method_calls: (msg) => msg.forEach(callMethod),
         open: (msg) => {
           const url = msg.path.startsWith("/") ? options.prefix + msg.path : msg.path;
           const target = msg.new_tab ? "_blank" : "_self";
@@ -365,6 +392,9 @@ function createApp(elements, options) {
         },
         download: (msg) => download(msg.src, msg.filename, msg.media_type, options.prefix),
         notify: (msg) => Quasar.Notify.create(msg),
+        batch: async (msg) => {
+          for (const [event, data] of msg) await messageHandlers[event](data);
+        },
       };
       const socketMessageQueue = [];
       let isProcessingSocketMessage = false;
@@ -3,22 +3,24 @@ import contextvars
 import os
 import time
 import uuid
+import weakref
+from collections import OrderedDict
 from collections.abc import MutableMapping
 from datetime import timedelta
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional, Union
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
 
-import aiofiles
 from starlette.middleware import Middleware
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.middleware.sessions import SessionMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
-from . import background_tasks, core, json, observables
+from . import background_tasks, core, events, json, observables, run
 from .context import context
 from .logging import log
 from .observables import ObservableDict
+from .storage_backends import FileBackend, StorageBackend, create_backend
 
 request_contextvar: contextvars.ContextVar[Optional[Request]] = contextvars.ContextVar('request_var', default=None)
 
@@ -49,32 +51,119 @@ class ReadOnlyDict(MutableMapping):
 
 class PersistentDict(observables.ObservableDict):
 
-    def __init__(self, filepath: Path, encoding: Optional[str] = None, *, indent: bool = False) -> None:
+    def __init__(self,
+                 filepath: Optional[Path] = None,
+                 encoding: Optional[str] = None,
+                 *,
+                 indent: bool = False,
+                 backend: Optional[StorageBackend] = None,
+                 namespace: Optional[str] = None,
+                 ) -> None:
+        """Dictionary which is persisted by a storage backend.
+
+        It is either stored in a JSON file at `filepath` or in the namespace `namespace` of the given `backend`.
+
+        :param filepath: path of the JSON file (if no backend is given)
+        :param encoding: encoding of the JSON file (default: system encoding)
+        :param indent: whether to indent the data (if the backend stores human-readable files)
+        :param backend: storage backend (instead of a file path)
+        :param namespace: namespace within the storage backend
+        """
+        if backend is None:
+            if filepath is None:
+                raise ValueError('PersistentDict needs either a filepath or a backend and a namespace')
+            filename = filepath.name.replace('{', '{{').replace('}', '}}')
+            backend = FileBackend(filepath.parent, encoding, filename=filename)
+            namespace = filepath.stem
+        elif namespace is None:
+            raise ValueError('PersistentDict needs a namespace when using a backend')
         self.filepath = filepath
         self.encoding = encoding
+        self.backend = backend
+        self.namespace = namespace
         self.indent = indent
+        self._changes = 0
+        self._written_changes = 0
+        self._changed_ids: Set[int] = set()
+        self._is_fully_changed = False
         try:
-            data = json.loads(filepath.read_text(encoding)) if filepath.exists() else {}
+            data = backend.load(namespace)
         except Exception:
-            log.warning(f'Could not load storage file {filepath}')
+            log.warning(f'Could not load storage "{namespace}"')
             data = {}
-        super().__init__(data, on_change=self.backup)
+        super().__init__(data, on_change=self._handle_data_change)
+        self._encoded: Dict[str, Tuple[Any, str]] = {}
+        self._written: Dict[str, str] = {}
+        self._written = self._diff()[0]
+
+    @property
+    def is_dirty(self) -> bool:
+        """Whether there are changes which have not been written to the backend yet."""
+        return self._changes != self._written_changes
+
+    @property
+    def size(self) -> int:
+        """Approximate size of the serialized data in bytes (as of the last write)."""
+        return sum(len(key) + len(value) for key, value in self._written.items())
+
+    def _handle_data_change(self, e: events.ObservableChangeEventArguments) -> None:
+        # NOTE: mark the changed collection and all its ancestors, one of which is the changed top-level value
+        collection = e.sender
+        while collection is not None and collection is not self:
+            self._changed_ids.add(id(collection))
+            collection = collection._parent  # pylint: disable=protected-access
+        if collection is None:
+            self._is_fully_changed = True  # NOTE: a collection shared with another observable, so its key is unknown
+        self.backup()
+
+    def _diff(self) -> Tuple[Dict[str, str], Dict[str, str], List[str]]:
+        """Serialize the data and determine the entries which have changed since the last write.
+
+        Only values which have been replaced or changed in place since the last call are encoded again.
+        """
+        encoded: Dict[str, str] = {}
+        cache: Dict[str, Tuple[Any, str]] = {}
+        for key, value in self.items():
+            key = str(key)
+            cached = self._encoded.get(key)
+            if cached is None or cached[0] is not value or id(value) in self._changed_ids or \
+                    (self._is_fully_changed and isinstance(value, observables.ObservableCollection)):
+                cached = (value, json.dumps(value))
+            cache[key] = cached
+            encoded[key] = cached[1]
+        self._encoded = cache
+        self._changed_ids.clear()
+        self._is_fully_changed = False
+        changed = {key: value for key, value in encoded.items() if self._written.get(key) is not value}
+        deleted = [key for key in self._written if key not in encoded]
+        return encoded, changed, deleted
 
     def backup(self) -> None:
-        """Back up the data to the given file path."""
-        if not self.filepath.exists():
-            if not self:
-                return
-            self.filepath.parent.mkdir(exist_ok=True)
+        """Back up the data to the storage backend."""
+        self._changes += 1
 
         async def backup() -> None:
-            async with aiofiles.open(self.filepath, 'w', encoding=self.encoding) as f:
-                await f.write(json.dumps(self, indent=self.indent))
+            # NOTE: serialize on the event loop so that the data does not change while it is being encoded
+            encoded, changed, deleted = self._diff()
+            changes = self._changes
+            await run.io_bound(self.backend.write, self.namespace, encoded, changed, deleted, indent=self.indent)
+            if not core.app.is_stopping:
+                self._written = encoded
+                self._written_changes = changes
         if core.loop:
-            background_tasks.create_lazy(backup(), name=self.filepath.stem)
+            background_tasks.create_lazy(backup(), name=f'storage-{self.namespace}')
         else:
             core.app.on_startup(backup())
 
+    def flush(self) -> None:
+        """Synchronously write pending changes to the storage backend (e.g. when the app is shutting down)."""
+        if not self.is_dirty:
+            return
+        encoded, changed, deleted = self._diff()
+        self.backend.write(self.namespace, encoded, changed, deleted, indent=self.indent)
+        self._written = encoded
+        self._written_changes = self._changes
+
 
 class RequestTrackingMiddleware(BaseHTTPMiddleware):
 
@@ -105,10 +194,31 @@ class Storage:
     def __init__(self) -> None:
         self.path = Path(os.environ.get('NICEGUI_STORAGE_PATH', '.nicegui')).resolve()
         self.max_tab_storage_age = timedelta(days=30).total_seconds()
-        self._general = PersistentDict(self.path / 'storage-general.json', encoding='utf-8')
-        self._users: Dict[str, PersistentDict] = {}
+        self.max_user_storage_idle_time = timedelta(minutes=10).total_seconds()
+        self.max_user_storage_count: Optional[int] = None
+        self.max_user_storage_bytes: Optional[int] = None
+        self._backend: Optional[StorageBackend] = None
+        self._general: Optional[PersistentDict] = None
+        self._users: OrderedDict[str, PersistentDict] = OrderedDict()
+        self._evicted_users: weakref.WeakValueDictionary[str, PersistentDict] = weakref.WeakValueDictionary()
+        self._user_access_times: Dict[str, float] = {}
+        self._session_client_counts: Dict[str, int] = {}  # NOTE: number of clients (i.e. open pages) per session ID
+        self._user_loads = 0
+        self._user_evictions = 0
         self._tabs: Dict[str, observables.ObservableDict] = {}
 
+    @property
+    def backend(self) -> StorageBackend:
+        """The backend persisting general and user storage (created on first access).
+
+        It is selected via the `storage_backend` parameter of `ui.run` or the environment variable `NICEGUI_STORAGE_BACKEND`
+        and defaults to "file".
+        """
+        if self._backend is None:
+            name = os.environ.get('NICEGUI_STORAGE_BACKEND', 'file')
+            self._backend = create_backend(name, self.path)  # type: ignore
+        return self._backend
+
     @property
     def browser(self) -> Union[ReadOnlyDict, Dict]:
         """Small storage that is saved directly within the user's browser (encrypted cookie).
@@ -138,6 +248,11 @@ class Storage:
 
         The data is stored in a file on the server.
         It is shared between all browser tabs by identifying the user via session cookie ID.
+        It is loaded on first access and evicted from memory after `max_user_storage_idle_time` seconds without access
+        or when exceeding `max_user_storage_count` or `max_user_storage_bytes`,
+        except for users with a page which is still open.
+        Evicted storage which is still referenced elsewhere (e.g. by a binding or a running task) keeps being persisted
+        and is reused when the user accesses the storage again, so that there is only one storage object per user.
         """
         request: Optional[Request] = request_contextvar.get()
         if request is None:
@@ -148,10 +263,34 @@ class Storage:
                 raise RuntimeError('app.storage.user needs a storage_secret passed in ui.run()')
             raise RuntimeError('app.storage.user can only be used within a UI context')
         session_id = request.session['id']
-        if session_id not in self._users:
-            self._users[session_id] = PersistentDict(self.path / f'storage-user-{session_id}.json', encoding='utf-8')
+        self._user_access_times[session_id] = time.time()
+        if session_id in self._users:
+            self._users.move_to_end(session_id)
+        else:
+            persistent_dict = self._evicted_users.pop(session_id, None)
+            if persistent_dict is None:
+                persistent_dict = PersistentDict(backend=self.backend, namespace=f'user-{session_id}')
+            self._users[session_id] = persistent_dict
+            self._user_loads += 1
+            self._evict_user_storage(idle_only=False, keep_session_id=session_id)
         return self._users[session_id]
 
+    @property
+    def user_storage_stats(self) -> Dict[str, int]:
+        """Statistics about the user storage held in memory.
+
+        - "count": number of users whose storage is held in memory
+        - "bytes": approximate size of their serialized data
+        - "loads": number of times a user storage has been loaded into memory
+        - "evictions": number of times a user storage has been evicted from memory
+        """
+        return {
+            'count': len(self._users),
+            'bytes': sum(persistent_dict.size for persistent_dict in self._users.values()),
+            'loads': self._user_loads,
+            'evictions': self._user_evictions,
+        }
+
     @staticmethod
     def _is_in_auto_index_context() -> bool:
         try:
@@ -162,6 +301,8 @@ class Storage:
     @property
     def general(self) -> PersistentDict:
         """General storage shared between all users that is persisted on the server (where NiceGUI is executed)."""
+        if self._general is None:
+            self._general = PersistentDict(backend=self.backend, namespace='general')
         return self._general
 
     @property
@@ -199,10 +340,68 @@ class Storage:
                     del self._tabs[tab_id]
             await asyncio.sleep(PURGE_INTERVAL)
 
+    async def prune_user_storage(self) -> None:
+        """Regularly evict user storage which has not been accessed for `max_user_storage_idle_time` seconds."""
+        while True:
+            self._evict_user_storage(idle_only=True)
+            await asyncio.sleep(PURGE_INTERVAL)
+
+    def _evict_user_storage(self, *, idle_only: bool, keep_session_id: Optional[str] = None) -> None:
+        """Evict idle user storage and, unless `idle_only` is set, least recently used storage exceeding the limits.
+
+        Storage of users with an open page and of the user currently accessing it (`keep_session_id`) is never evicted.
+        Storage with pending changes is only evicted after the background task has written them.
+        """
+        now = time.time()
+        count = len(self._users)
+        size = sum(persistent_dict.size for persistent_dict in self._users.values()) \
+            if self.max_user_storage_bytes is not None else 0
+        for session_id, persistent_dict in list(self._users.items()):  # NOTE: least recently used first
+            if session_id == keep_session_id or session_id in self._session_client_counts:
+                continue
+            is_idle = now > self._user_access_times.get(session_id, 0) + self.max_user_storage_idle_time
+            is_exceeding_count = self.max_user_storage_count is not None and count > self.max_user_storage_count
+            is_exceeding_size = self.max_user_storage_bytes is not None and size > self.max_user_storage_bytes
+            if not is_idle and (idle_only or not (is_exceeding_count or is_exceeding_size)):
+                break  # NOTE: all following storage has been accessed more recently
+            if persistent_dict.is_dirty:
+                if core.loop is not None and core.loop.is_running():
+                    continue  # NOTE: do not block the event loop by writing the changes here
+                try:
+                    persistent_dict.flush()
+                except Exception:
+                    log.warning(f'Could not flush storage "{persistent_dict.namespace}"')
+                    continue
+            del self._users[session_id]
+            self._evicted_users[session_id] = persistent_dict
+            self._user_access_times.pop(session_id, None)
+            self._user_evictions += 1
+            count -= 1
+            size -= persistent_dict.size
+
+    def _add_session_client(self, session_id: str) -> None:
+        self._session_client_counts[session_id] = self._session_client_counts.get(session_id, 0) + 1
+
+    def _remove_session_client(self, session_id: str) -> None:
+        self._session_client_counts[session_id] -= 1
+        if self._session_client_counts[session_id] == 0:
+            del self._session_client_counts[session_id]
+
+    @property
+    def _persistent_dicts(self) -> List[PersistentDict]:
+        return [*([self._general] if self._general is not None else []), *self._users.values()]
+
+    def flush(self) -> None:
+        """Synchronously write pending changes of general and user storage to the backend."""
+        for persistent_dict in self._persistent_dicts:
+            persistent_dict.flush()
+
     def clear(self) -> None:
         """Clears all storage."""
-        self._general.clear()
+        self._general = None
         self._users.clear()
+        self._evicted_users.clear()
+        self._user_access_times.clear()
         try:
             client = context.client
         except RuntimeError:
@@ -210,7 +409,7 @@ class Storage:
         else:
             client.storage.clear()
         self._tabs.clear()
-        for filepath in self.path.glob('storage-*.json'):
-            filepath.unlink()
+        self.backend.clear()
+        self._backend = None
         if self.path.exists():
             self.path.rmdir()
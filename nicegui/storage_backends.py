@@ -0,0 +1,148 @@
+"""
+Backends persisting the general and user storage of `app.storage`.
+
+Each backend stores JSON-serializable dictionaries identified by a namespace like "general" or "user-<session ID>".
+The values are passed to the backends already serialized, key by key,
+so that backends like SQLite can write only the entries which have changed.
+"""
+import abc
+import os
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional
+
+from . import json
+
+BACKEND = Literal['file', 'sqlite']
+
+
+class StorageBackend(abc.ABC):
+
+    @abc.abstractmethod
+    def load(self, namespace: str) -> Dict[str, Any]:
+        """Load all entries of the given namespace (or raise an exception if they can't be read)."""
+
+    @abc.abstractmethod
+    def write(self, namespace: str, encoded: Dict[str, str], changed: Dict[str, str], deleted: List[str], *,
+              indent: bool = False) -> None:
+        """Write the entries of the given namespace.
+
+        :param namespace: namespace to write
+        :param encoded: all serialized entries
+        :param changed: serialized entries which have been added or changed since the last write
+        :param deleted: keys which have been deleted since the last write
+        :param indent: whether to indent the data (if the backend stores human-readable files)
+        """
+
+    @abc.abstractmethod
+    def clear(self) -> None:
+        """Delete all namespaces."""
+
+
+class FileBackend(StorageBackend):
+
+    def __init__(self, path: Path, encoding: Optional[str] = 'utf-8', *,
+                 filename: str = 'storage-{namespace}.json') -> None:
+        """Store each namespace in a JSON file which is rewritten as a whole on every write.
+
+        :param path: directory of the files
+        :param encoding: encoding of the files
+        :param filename: name of the files with a "{namespace}" placeholder
+        """
+        self.path = path
+        self.encoding = encoding
+        self.filename = filename
+
+    def _filepath(self, namespace: str) -> Path:
+        return self.path / self.filename.format(namespace=namespace)
+
+    def load(self, namespace: str) -> Dict[str, Any]:
+        filepath = self._filepath(namespace)
+        return json.loads(filepath.read_text(self.encoding)) if filepath.exists() else {}
+
+    def write(self, namespace: str, encoded: Dict[str, str], changed: Dict[str, str], deleted: List[str], *,
+              indent: bool = False) -> None:
+        filepath = self._filepath(namespace)
+        if not filepath.exists():
+            if not encoded:
+                return
+            self.path.mkdir(exist_ok=True)
+        # NOTE: write to a temporary file first so that a crash while writing does not leave a truncated file behind
+        temporary_path = filepath.with_name(f'.{filepath.name}.{threading.get_ident()}.tmp')
+        try:
+            if indent:
+                text = json.dumps({key: json.loads(value) for key, value in encoded.items()}, indent=True)
+            else:
+                text = json.join(encoded)
+            temporary_path.write_text(text, self.encoding)
+            os.replace(temporary_path, filepath)
+        finally:
+            temporary_path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        pattern = self.filename.format(namespace='*')
+        for filepath in [*self.path.glob(pattern), *self.path.glob(f'.{pattern}.*.tmp')]:
+            filepath.unlink()
+
+
+class SQLiteBackend(StorageBackend):
+
+    def __init__(self, filepath: Path) -> None:
+        """Store all namespaces in a single SQLite database (in WAL mode), writing only the entries which have changed.
+
+        The database is opened lazily and shared between threads.
+        """
+        self.filepath = filepath
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """The connection to the database (created on first access)."""
+        if self._connection is None:
+            self.filepath.parent.mkdir(parents=True, exist_ok=True)
+            self._connection = sqlite3.connect(self.filepath, check_same_thread=False, isolation_level=None)
+            self._connection.execute('PRAGMA journal_mode=WAL')
+            self._connection.execute('PRAGMA synchronous=NORMAL')
+            self._connection.execute('CREATE TABLE IF NOT EXISTS entries '
+                                     '(namespace TEXT, key TEXT, value TEXT, PRIMARY KEY (namespace, key))')
+        return self._connection
+
+    def load(self, namespace: str) -> Dict[str, Any]:
+        with self._lock:
+            rows = self.connection.execute('SELECT key, value FROM entries WHERE namespace = ?', (namespace,))
+            return {key: json.loads(value) for key, value in rows}
+
+    def write(self, namespace: str, encoded: Dict[str, str], changed: Dict[str, str], deleted: List[str], *,
+              indent: bool = False) -> None:
+        if not changed and not deleted:
+            return
+        with self._lock:
+            self.connection.execute('BEGIN IMMEDIATE')
+            try:
+                self.connection.executemany('INSERT OR REPLACE INTO entries (namespace, key, value) VALUES (?, ?, ?)',
+                                            [(namespace, key, value) for key, value in changed.items()])
+                self.connection.executemany('DELETE FROM entries WHERE namespace = ? AND key = ?',
+                                            [(namespace, key) for key in deleted])
+            except Exception:
+                self.connection.execute('ROLLBACK')
+                raise
+            self.connection.execute('COMMIT')
+
+    def clear(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            for suffix in ['', '-wal', '-shm']:
+                self.filepath.with_name(self.filepath.name + suffix).unlink(missing_ok=True)
+
+
+def create_backend(name: BACKEND, path: Path) -> StorageBackend:
+    """Create the storage backend with the given name, storing its data in the given directory."""
+    if name == 'file':
+        return FileBackend(path)
+    if name == 'sqlite':
+        return SQLiteBackend(path / 'storage.sqlite')
+    raise ValueError(f'Unknown storage backend "{name}"')
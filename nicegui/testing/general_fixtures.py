@@ -45,6 +45,7 @@ def nicegui_reset_globals() -> Generator[None, None, None]:
             cls._default_classes = []  # pylint: disable=protected-access
             element_classes.append(cls)
     Client.instances.clear()
+    app.storage._session_client_counts.clear()  # pylint: disable=protected-access
     Client.page_routes.clear()
     app.reset()
     Client.auto_index_client = Client(page('/'), request=None).__enter__()  # pylint: disable=unnecessary-dunder-call
@@ -74,6 +75,9 @@ def prepare_simulation(request: pytest.FixtureRequest) -> None:
         language='en-US',
         binding_refresh_interval=0.1,
         reconnect_timeout=3.0,
+        flush_interval=0.0,
+        flush_batch_size=1000,
+        wire_format='json',
         tailwind=True,
         prod_js=True,
         show_welcome_message=False,
@@ -31,6 +31,9 @@ def run(*,
         language: Language = 'en-US',
         binding_refresh_interval: float = 0.1,
         reconnect_timeout: float = 3.0,
+        flush_interval: float = 0.0,
+        flush_batch_size: int = 1000,
+        wire_format: Literal['json', 'msgpack'] = 'json',
         fastapi_docs: bool = False,
         show: bool = True,
         on_air: Optional[Union[str, Literal[True]]] = None,
@@ -47,6 +50,7 @@ def run(*,
         prod_js: bool = True,
         endpoint_documentation: Literal['none', 'internal', 'page', 'all'] = 'none',
         storage_secret: Optional[str] = None,
+        storage_backend: Optional[Literal['file', 'sqlite']] = None,
         show_welcome_message: bool = True,
         **kwargs: Any,
         ) -> None:
@@ -64,6 +68,9 @@ def run(*,
     :param language: language for Quasar elements (default: `'en-US'`)
     :param binding_refresh_interval: time between binding updates (default: `0.1` seconds, bigger is more CPU friendly)
     :param reconnect_timeout: maximum time the server waits for the browser to reconnect (default: 3.0 seconds)
+    :param flush_interval: minimum time between two transmissions of updates and messages to a client, i.e. the inverse of the maximum frame rate (default: 0.0 seconds, can be overwritten per page)
+    :param flush_batch_size: number of pending updates and messages which are transmitted right away without waiting for the flush interval (default: 1000)
+    :param wire_format: serialization of the socket.io connection (default: `'json'`, `'msgpack'` sends binary frames and NumPy arrays as typed arrays, requires the `msgpack` package and does not work with On Air)
     :param fastapi_docs: whether to enable FastAPI's automatic documentation with Swagger UI, ReDoc, and OpenAPI JSON (default: `False`)
     :param show: automatically open the UI in a browser tab (default: `True`)
     :param on_air: tech preview: `allows temporary remote access <https://nicegui.io/documentation/section_configuration_deployment#nicegui_on_air>`_ if set to `True` (default: disabled)
@@ -80,6 +87,7 @@ def run(*,
     :param prod_js: whether to use the production version of Vue and Quasar dependencies (default: `True`)
     :param endpoint_documentation: control what endpoints appear in the autogenerated OpenAPI docs (default: 'none', options: 'none', 'internal', 'page', 'all')
     :param storage_secret: secret key for browser-based storage (default: `None`, a value is required to enable ui.storage.individual and ui.storage.browser)
+    :param storage_backend: backend persisting `app.storage.general` and `app.storage.user` (default: `None`, uses the environment variable `NICEGUI_STORAGE_BACKEND` or `'file'`; `'sqlite'` writes only changed entries to a database in WAL mode)
     :param show_welcome_message: whether to show the welcome message (default: `True`)
     :param kwargs: additional keyword arguments are passed to `uvicorn.run`
     """
@@ -92,6 +100,9 @@ def run(*,
         language=language,
         binding_refresh_interval=binding_refresh_interval,
         reconnect_timeout=reconnect_timeout,
+        flush_interval=flush_interval,
+        flush_batch_size=flush_batch_size,
+        wire_format=wire_format,
         tailwind=tailwind,
         prod_js=prod_js,
         show_welcome_message=show_welcome_message,
@@ -146,6 +157,8 @@ def run(*,
     # NOTE: We save host and port in environment variables so the subprocess started in reload mode can access them.
     os.environ['NICEGUI_HOST'] = host
     os.environ['NICEGUI_PORT'] = str(port)
+    if storage_backend is not None:
+        os.environ['NICEGUI_STORAGE_BACKEND'] = storage_backend
 
     if show:
         helpers.schedule_browser(host, port)
@@ -154,7 +167,11 @@ def run(*,
         return [a.strip() for a in args.split(',')]
 
     if kwargs.get('workers', 1) > 1:
-        raise ValueError('NiceGUI does not support multiple workers yet.')
+        # NOTE: this is a deliberate decision: the elements of a page only exist in the process which built it,
+        # so all requests of a client would need to be routed to the same worker,
+        # and in-memory routes like images and auto-added files are not shared between workers
+        raise ValueError('NiceGUI does not support multiple workers. '
+                         'Run several instances behind a reverse proxy with sticky sessions instead.')
 
     # NOTE: The following lines are basically a copy of `uvicorn.run`, but keep a reference to the `server`.
 
@@ -1,3 +1,4 @@
+import os
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Literal, Optional, Union
@@ -19,11 +20,15 @@ def run_with(
     language: Language = 'en-US',
     binding_refresh_interval: float = 0.1,
     reconnect_timeout: float = 3.0,
+    flush_interval: float = 0.0,
+    flush_batch_size: int = 1000,
+    wire_format: Literal['json', 'msgpack'] = 'json',
     mount_path: str = '/',
     on_air: Optional[Union[str, Literal[True]]] = None,
     tailwind: bool = True,
     prod_js: bool = True,
     storage_secret: Optional[str] = None,
+    storage_backend: Optional[Literal['file', 'sqlite']] = None,
     show_welcome_message: bool = True,
 ) -> None:
     """Run NiceGUI with FastAPI.
@@ -36,11 +41,15 @@ def run_with(
     :param language: language for Quasar elements (default: `'en-US'`)
     :param binding_refresh_interval: time between binding updates (default: `0.1` seconds, bigger is more CPU friendly)
     :param reconnect_timeout: maximum time the server waits for the browser to reconnect (default: 3.0 seconds)
+    :param flush_interval: minimum time between two transmissions of updates and messages to a client, i.e. the inverse of the maximum frame rate (default: 0.0 seconds, can be overwritten per page)
+    :param flush_batch_size: number of pending updates and messages which are transmitted right away without waiting for the flush interval (default: 1000)
+    :param wire_format: serialization of the socket.io connection (default: `'json'`, `'msgpack'` sends binary frames and NumPy arrays as typed arrays, requires the `msgpack` package and does not work with On Air)
     :param mount_path: mount NiceGUI at this path (default: `'/'`)
     :param on_air: tech preview: `allows temporary remote access <https://nicegui.io/documentation/section_configuration_deployment#nicegui_on_air>`_ if set to `True` (default: disabled)
     :param tailwind: whether to use Tailwind CSS (experimental, default: `True`)
     :param prod_js: whether to use the production version of Vue and Quasar dependencies (default: `True`)
     :param storage_secret: secret key for browser-based storage (default: `None`, a value is required to enable ui.storage.individual and ui.storage.browser)
+    :param storage_backend: backend persisting `app.storage.general` and `app.storage.user` (default: `None`, uses the environment variable `NICEGUI_STORAGE_BACKEND` or `'file'`; `'sqlite'` writes only changed entries to a database in WAL mode)
     :param show_welcome_message: whether to show the welcome message (default: `True`)
     """
     core.app.config.add_run_config(
@@ -52,12 +61,17 @@ def run_with(
         language=language,
         binding_refresh_interval=binding_refresh_interval,
         reconnect_timeout=reconnect_timeout,
+        flush_interval=flush_interval,
+        flush_batch_size=flush_batch_size,
+        wire_format=wire_format,
         tailwind=tailwind,
         prod_js=prod_js,
         show_welcome_message=show_welcome_message,
     )
 
     storage.set_storage_secret(storage_secret)
+    if storage_backend is not None:
+        os.environ['NICEGUI_STORAGE_BACKEND'] = storage_backend
 
     if on_air:
         core.air = Air('' if on_air is True else on_air)
@@ -1,12 +1,15 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import Awaitable, Dict, List, Tuple
 
 import pandas as pd
 from selenium.webdriver.common.action_chains import ActionChains
 from selenium.webdriver.common.keys import Keys
 
 from nicegui import ui
-from nicegui.testing import Screen
+from nicegui.elements.aggrid import AgGridRequest
+from nicegui.events import GenericEventArguments
+from nicegui.testing import Screen, User
 
 
 def test_update_table(screen: Screen):
@@ -271,3 +274,91 @@ def test_get_client_data(screen: Screen):
     screen.click('Get Sorted Data')
     screen.wait(0.5)
     assert data == [{'name': 'Carol', 'age': 42}, {'name': 'Bob', 'age': 21}, {'name': 'Alice', 'age': 18}]
+
+
+async def test_row_transactions(user: User):
+    @ui.page('/')
+    def page():
+        ui.aggrid({
+            'columnDefs': [{'field': 'name'}, {'field': 'age'}],
+            'rowData': [{'id': 1, 'name': 'Alice', 'age': 18}, {'id': 2, 'name': 'Bob', 'age': 21}],
+        }, row_id='id')
+
+    await user.open('/')
+    grid = user.find(ui.aggrid).elements.pop()
+    calls = []
+    grid.client.outbox.enqueue_method_call = \
+        lambda element_id, name, args, target_id: calls.append((name, *args))  # type: ignore
+
+    grid.add_rows([{'id': 3, 'name': 'Carol', 'age': 42}])
+    grid.add_rows([{'id': 4, 'name': 'Dan', 'age': 5}])
+    grid.update_rows([{'id': 1, 'name': 'Alice', 'age': 19}, {'id': 4, 'name': 'Dan', 'age': 6}])
+    grid.remove_rows([{'id': 2}, {'id': 3}])
+    assert grid.options['rowData'] == [{'id': 1, 'name': 'Alice', 'age': 19}, {'id': 4, 'name': 'Dan', 'age': 6}]
+    assert grid._to_dict()['props']['transaction_version'] == 1  # pylint: disable=protected-access
+    assert grid.props['transaction_version'] == 0
+    assert not calls
+
+    grid._send_transaction()  # pylint: disable=protected-access
+    assert calls == [('apply_transaction', {
+        'add': [{'id': 4, 'name': 'Dan', 'age': 6}],
+        'update': [{'id': 1, 'name': 'Alice', 'age': 19}],
+        'remove': [{'id': 2}],
+    }, 1)]
+    assert grid.props['transaction_version'] == 1
+
+
+async def test_row_index(user: User):
+    @ui.page('/')
+    def page():
+        ui.aggrid({'columnDefs': [{'field': 'id'}], 'rowData': [{'id': i} for i in range(5)]}, row_id='id')
+
+    await user.open('/')
+    grid = user.find(ui.aggrid).elements.pop()
+    grid.client.outbox.enqueue_method_call = lambda *args: None  # type: ignore
+
+    grid.remove_rows([{'id': 0}, {'id': 1}])
+    grid.add_rows([{'id': 5}])
+    grid.add_rows([{'id': -1}], index=0)
+    grid.update_rows([{'id': 3, 'name': 'Carol'}, {'id': 5, 'name': 'Eve'}, {'id': -1, 'name': 'Zoe'}])
+    assert grid.options['rowData'] == [{'id': -1, 'name': 'Zoe'}, {'id': 2}, {'id': 3, 'name': 'Carol'}, {'id': 4},
+                                       {'id': 5, 'name': 'Eve'}]
+    assert grid._indexed_rows is grid.options['rowData']  # pylint: disable=protected-access
+
+    grid.remove_rows([{'id': 2}, {'id': 4}])
+    grid.options['rowData'].insert(0, {'id': 6})
+    grid.update_rows([{'id': 3, 'name': 'Carl'}])
+    assert grid.options['rowData'] == [{'id': 6}, {'id': -1, 'name': 'Zoe'}, {'id': 3, 'name': 'Carl'},
+                                       {'id': 5, 'name': 'Eve'}]
+
+
+async def test_datasource(user: User):
+    requests: List[AgGridRequest] = []
+
+    async def fetch(request: AgGridRequest) -> Tuple[List[Dict], int]:
+        requests.append(request)
+        await asyncio.sleep(0)
+        return [{'name': f'Person {i}'} for i in range(request.start_row, request.end_row)], 1000
+
+    @ui.page('/')
+    def page():
+        ui.aggrid({'columnDefs': [{'field': 'name'}], 'cacheBlockSize': 2}, datasource=fetch, max_cached_blocks=1)
+
+    await user.open('/')
+    grid = user.find(ui.aggrid).elements.pop()
+    assert grid.options['rowModelType'] == 'infinite'
+    calls = []
+    grid.run_method = lambda name, *args, **kwargs: calls.append((name, *args))  # type: ignore
+
+    def get_rows(request_id: int, start_row: int) -> Awaitable:
+        args = {'request_id': request_id, 'startRow': start_row, 'endRow': start_row + 2, 'sortModel': [], 'filterModel': {}}
+        return grid._handle_get_rows(GenericEventArguments(sender=grid, client=grid.client, args=args))  # pylint: disable=protected-access
+
+    await get_rows(1, 0)
+    await get_rows(2, 0)
+    assert calls == [('resolve_rows', i, [{'name': 'Person 0'}, {'name': 'Person 1'}], 1000) for i in [1, 2]]
+    assert len(requests) == 1
+
+    await get_rows(3, 2)
+    await get_rows(4, 0)
+    assert len(requests) == 3, 'the first block should have been evicted from the cache'
@@ -2,8 +2,9 @@ from typing import Dict, Optional, Tuple
 
 from selenium.webdriver.common.keys import Keys
 
-from nicegui import ui
-from nicegui.testing import Screen
+from nicegui import binding, ui
+from nicegui.observables import ObservableDict
+from nicegui.testing import Screen, User
 
 
 def test_ui_select_with_tuple_as_key(screen: Screen):
@@ -104,3 +105,40 @@ def test_missing_target_attribute(screen: Screen):
 
     screen.open('/')
     screen.should_contain("text='Hello'")
+
+
+async def test_bindable_dataclass(user: User):
+    @binding.bindable_dataclass(bindable_fields=['bindable'])
+    class TestClass:
+        not_bindable: str = 'not_bindable_text'
+        bindable: str = 'bindable_text'
+
+    instance = TestClass()
+    ui.label().bind_text_from(instance, 'not_bindable')
+    ui.label().bind_text_from(instance, 'bindable')
+    assert len(binding.active_links) == 1
+    assert next(iter(binding.active_links.values()))[1] == 'not_bindable'
+
+    await user.open('/')
+    await user.should_see('not_bindable_text')
+    await user.should_see('bindable_text')
+
+    instance.bindable = 'updated_text'
+    await user.should_see('updated_text')
+
+
+async def test_binding_to_observable_dict_without_active_links(user: User):
+    data = ObservableDict({'name': 'Alice'})
+    ui.label().bind_text_from(data, 'name', backward=lambda name: f'Name: {name}')
+    ui.input().bind_value(data, 'name')
+    assert not any(source_obj is data for source_obj, *_ in binding.active_links.values())
+
+    await user.open('/')
+    await user.should_see('Name: Alice')
+
+    data['name'] = 'Bob'
+    await user.should_see('Name: Bob', retries=1)
+
+    user.find(ui.input).type(' and Carol')
+    assert data['name'] == 'Bob and Carol'
+    await user.should_see('Name: Bob and Carol', retries=1)
@@ -1,9 +1,12 @@
+import math
+
 from pyecharts import options
 from pyecharts.charts import Bar
 from pyecharts.commons import utils
 
 from nicegui import ui
-from nicegui.testing import Screen
+from nicegui.elements.echart import lttb
+from nicegui.testing import Screen, User
 
 
 def test_create_dynamically(screen: Screen):
@@ -118,3 +121,44 @@ def test_chart_events(screen: Screen):
 
     screen.open('/')
     screen.should_contain('Chart rendered.')
+
+
+async def test_incremental_updates(user: User):
+    @ui.page('/')
+    def page():
+        ui.echart({
+            'xAxis': {'type': 'value'},
+            'yAxis': {'type': 'value'},
+            'series': [{'type': 'line', 'data': [[0, 0]]}, {'type': 'line', 'data': []}],
+        })
+
+    await user.open('/')
+    chart = user.find(ui.echart).elements.pop()
+    calls = []
+    chart.run_method = lambda name, *args, **kwargs: calls.append((name, *args))  # type: ignore
+
+    chart.append_data([[[1, 1], [2, 4]], [[1, 2]]], max_points=2)
+    chart.append_data({1: [[2, 3]]})
+    assert chart.options['series'][0]['data'] == [[1, 1], [2, 4]]
+    assert chart.options['series'][1]['data'] == [[1, 2], [2, 3]]
+    assert chart.props['data_version'] == 2
+    assert calls == [('append_data', [[[1, 1], [2, 4]], [[1, 2]]], 2, 1), ('append_data', [[], [[2, 3]]], None, 2)]
+
+    calls.clear()
+    chart.merge_options({'yAxis': {'max': 10}, 'series': [{}, {'name': 'B'}]})
+    assert chart.options['yAxis'] == {'type': 'value', 'max': 10}
+    assert chart.options['series'][1] == {'type': 'line', 'data': [[1, 2], [2, 3]], 'name': 'B'}
+    assert calls == [('merge_options', {'yAxis': {'max': 10}, 'series': [{}, {'name': 'B'}]})]
+
+    calls.clear()
+    chart.set_series_data(0, [[x, math.sin(x / 10)] for x in range(1000)], max_points=100)
+    assert len(chart.options['series'][0]['data']) == 100
+    assert chart.options['series'][0]['data'][0] == [0, 0.0]
+    assert chart.options['series'][0]['data'][-1] == [999, math.sin(99.9)]
+    assert calls[0][0] == 'merge_options'
+
+
+def test_lttb():
+    assert lttb([1, 2, 3], 5) == [1, 2, 3]
+    assert lttb([0, 0, 5, 0, 0, -5, 0, 0], 4) == [0, 5, -5, 0]
+
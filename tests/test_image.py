@@ -1,7 +1,12 @@
+import io
 from pathlib import Path
 
+import numpy as np
+from PIL import Image
+
 from nicegui import app, ui
-from nicegui.testing import Screen
+from nicegui.image_cache import image_cache
+from nicegui.testing import Screen, User
 
 example_file = Path(__file__).parent / '../examples/slideshow/slides/slide1.jpg'
 
@@ -75,3 +80,26 @@ def test_removal_of_generated_routes(screen: Screen):
     screen.click('Slide 3')
     screen.wait(0.5)
     assert len(app.routes) == number_of_routes
+
+
+async def test_cached_pil_image(user: User):
+    pixels = np.zeros((10, 10, 3), dtype=np.uint8)
+
+    @ui.page('/')
+    def page():
+        ui.image(Image.fromarray(pixels))
+        ui.image(pixels)
+
+    await user.open('/')
+    first, second = sorted(user.find(ui.image).elements, key=lambda image: image.id)
+    assert first.props['src'] == second.props['src']
+    assert first.props['src'] in image_cache
+
+    response = await user.http_client.get(first.props['src'])
+    assert response.status_code == 200
+    assert response.headers['content-type'] == 'image/png'
+    assert 'immutable' in response.headers['cache-control']
+    assert np.array_equal(np.array(Image.open(io.BytesIO(response.content))), pixels)
+
+    second.set_source(pixels + 1)
+    assert first.props['src'] != second.props['src']
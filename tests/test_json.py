@@ -51,3 +51,17 @@ def test_json():
         orjson_str = orjson_dumps(test)
         builtin_str = builtin_dumps(test)
         assert orjson_str == builtin_str, f'json serializer implementations do not match: orjson={orjson_str}, built-in={builtin_str}'
+
+
+@pytest.mark.skipif('orjson' not in sys.modules, reason='requires the orjson library.')
+def test_fragment():
+    # pylint: disable=import-outside-toplevel
+    from nicegui.json.builtin_wrapper import Fragment as BuiltinFragment
+    from nicegui.json.builtin_wrapper import dumps as builtin_dumps
+    from nicegui.json.orjson_wrapper import Fragment as OrjsonFragment
+    from nicegui.json.orjson_wrapper import dumps as orjson_dumps
+
+    fragment = '{"a":[1,2.5,null],"b":"€"}'
+    orjson_str = orjson_dumps(['update', OrjsonFragment(fragment)])
+    builtin_str = builtin_dumps(['update', BuiltinFragment(fragment)])
+    assert orjson_str == builtin_str == f'["update",{fragment}]'
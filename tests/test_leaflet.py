@@ -1,7 +1,7 @@
 import time
 
 from nicegui import ui
-from nicegui.testing import Screen
+from nicegui.testing import Screen, User
 
 
 def test_leaflet(screen: Screen):
@@ -36,3 +36,52 @@ def test_leaflet(screen: Screen):
 
     screen.click('London')
     screen.should_contain('Center: 51.505, -0.090')
+
+
+async def test_bulk_markers_and_geojson(user: User):
+    @ui.page('/')
+    def page():
+        ui.leaflet()
+
+    await user.open('/')
+    m = user.find(ui.leaflet).elements.pop()
+    calls = []
+    m.is_initialized = True
+    m.run_method = lambda name, *args, **kwargs: calls.append((name, *args))  # type: ignore
+    m._set_bounds([[0, 0], [10, 10]])  # pylint: disable=protected-access
+
+    markers = m.markers(positions={'a': (5, 5), 'b': (50, 50)}, viewport_culling=True)
+    assert calls[-1] == ('add_layer', {'type': 'markers', 'args': [{}], 'ids': ['a'], 'latlngs': [5, 5]}, markers.id)
+
+    calls.clear()
+    for i in range(10):
+        markers.add({'c': (i, i)})
+    markers.move({'a': (6, 6), 'b': (51, 51)})
+    markers.remove(['a'])
+    markers._flush()  # pylint: disable=protected-access
+    assert calls == [('update_markers', markers.id, ['c'], [9, 9], ['a'])]
+
+    calls.clear()
+    m._set_bounds([[45, 45], [55, 55]])  # pylint: disable=protected-access
+    markers._flush()  # pylint: disable=protected-access
+    assert calls == [('update_markers', markers.id, ['b'], [51, 51], ['c'])]
+
+    calls.clear()
+    features = [{'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [i, i]}} for i in range(5)]
+    geo_json = m.geo_json(data={'type': 'FeatureCollection', 'features': features}, chunk_size=2)
+    for _ in range(4):
+        geo_json._flush()  # pylint: disable=protected-access
+    assert calls[0] == ('add_layer', {'type': 'geoJSON', 'args': [None, {}]}, geo_json.id)
+    assert [len(call[3]['features']) for call in calls[1:]] == [2, 2, 1]
+    assert [call[3]['features'] for call in calls[1:]] == [features[:2], features[2:4], features[4:]]
+
+    calls.clear()
+    geo_json._handle_add('new-socket')  # pylint: disable=protected-access
+    for _ in range(4):
+        geo_json._flush()  # pylint: disable=protected-access
+    assert [call[2] for call in calls] == ['clearLayers', 'addData', 'addData', 'addData'], 'features are sent only once'
+
+    m.client.shared = True
+    assert markers._get_visible_area() is None, 'no culling on shared pages'  # pylint: disable=protected-access
+    m.client.shared = False
+
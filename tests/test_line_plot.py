@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+from nicegui import ui
+from nicegui.testing import User
+
+
+async def test_line_plot(user: User):
+    @ui.page('/')
+    def page():
+        line_plot = ui.line_plot(n=2, limit=3)
+        line_plot.push([1, 2], [[10, 20], [-1, -2]])
+        line_plot.push([3, 4], [[30, 40], [-3, -4]])
+
+    await user.open('/')
+    line_plot = user.find(ui.line_plot).elements.pop()
+    assert line_plot.x == [2, 3, 4]
+    assert line_plot.Y == [[20, 30, 40], [-2, -3, -4]]
+    assert line_plot.fig.gca().get_xlim() == (1.98, 4.02)
+    await line_plot.rendered()
+    assert '<svg' in line_plot.props['innerHTML']
+
+    line_plot.clear()
+    assert line_plot.x == []
+    assert line_plot.Y == [[], []]
+
+
+async def test_line_plot_with_datetimes(user: User):
+    @ui.page('/')
+    def page():
+        line_plot = ui.line_plot(limit=2)
+        start = datetime(2024, 1, 1)
+        for i in range(3):
+            line_plot.push([start + timedelta(seconds=i)], [[i]])
+
+    await user.open('/')
+    line_plot = user.find(ui.line_plot).elements.pop()
+    assert line_plot.x == [datetime(2024, 1, 1, 0, 0, 1), datetime(2024, 1, 1, 0, 0, 2)]
+
+
+async def test_streaming_line_plot(user: User):
+    @ui.page('/')
+    def page():
+        with ui.card():
+            line_plot = ui.line_plot(n=2, limit=3, streaming=True).with_legend(['a', 'b'])
+        line_plot.push([1, 2], [[10, 20], [-1, -2]])
+        line_plot.push([3, 4], [[30, 40], [-3, -4]])
+
+    await user.open('/')
+    line_plot = user.find(ui.line_plot).elements.pop()
+    assert line_plot.chart is not None
+    assert line_plot.chart.parent_slot is not None and line_plot.chart.parent_slot.parent is line_plot
+    assert [type(child) for child in line_plot.parent_slot.children] == [ui.line_plot]
+    assert 'innerHTML' not in line_plot.props
+    assert not hasattr(line_plot, 'fig')
+    props = line_plot.chart._to_dict()['props']  # pylint: disable=protected-access
+    assert props['data_version'] == 4
+    assert [series['name'] for series in props['options']['series']] == ['a', 'b']
+    assert [series['data'] for series in props['options']['series']] == [
+        [[2, 20], [3, 30], [4, 40]],
+        [[2, -2], [3, -3], [4, -4]],
+    ]
+    assert line_plot.chart.options['series'][0]['data'] == []  # NOTE: the data is only stored in the ring buffer
+
+
+async def test_fractional_x_values_and_assignments(user: User):
+    @ui.page('/')
+    def page():
+        line_plot = ui.line_plot(n=2, limit=3)
+        line_plot.push([1], [[10], [-1]])
+        line_plot.push([1.5], [[15], [-1.5]])
+
+    await user.open('/')
+    line_plot = user.find(ui.line_plot).elements.pop()
+    assert line_plot.x == [1, 1.5]
+
+    line_plot.x = [5, 6, 7, 8]
+    line_plot.Y = [[50, 60, 70, 80], [-5, -6, -7, -8]]
+    assert line_plot.x == [6, 7, 8]
+    assert line_plot.Y == [[60, 70, 80], [-6, -7, -8]]
+    line_plot.push([8.5], [[85], [-8.5]])
+    assert line_plot.x == [7, 8, 8.5]
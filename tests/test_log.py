@@ -1,5 +1,6 @@
 from nicegui import ui
-from nicegui.testing import Screen
+from nicegui.elements.log import STREAMING_MAX_LINES
+from nicegui.testing import Screen, User
 
 
 def test_log(screen: Screen):
@@ -53,3 +54,43 @@ def test_special_characters(screen: Screen):
     screen.should_contain('50%')
     screen.click('push')
     screen.should_contain('100%')
+
+
+async def test_streaming_log(user: User):
+    @ui.page('/')
+    def page():
+        log = ui.log(max_lines=3, streaming=True)
+        log.push('A')
+        log.push('B\nC\nD')
+        ui.button('Clear', on_click=log.clear)
+
+    await user.open('/')
+    log = user.find(ui.log).elements.pop()
+    assert not log.default_slot.children
+    assert log.lines == ['B', 'C', 'D']
+
+    user.find('Clear').click()
+    assert log.lines == []
+
+
+async def test_streaming_log_is_bounded_by_default(user: User):
+    @ui.page('/')
+    def page():
+        log = ui.log(streaming=True)
+        log.push('\n'.join(str(i) for i in range(STREAMING_MAX_LINES + 5)))
+
+    await user.open('/')
+    log = user.find(ui.log).elements.pop()
+    assert log.max_lines == STREAMING_MAX_LINES
+    assert len(log.lines) == STREAMING_MAX_LINES
+    assert log.lines[0] == '5'
+
+
+async def test_log_lines(user: User):
+    @ui.page('/')
+    def page():
+        log = ui.log(max_lines=2)
+        log.push('A\nB\nC')
+
+    await user.open('/')
+    assert user.find(ui.log).elements.pop().lines == ['B', 'C']
@@ -0,0 +1,52 @@
+from datetime import date
+from decimal import Decimal
+
+import msgpack
+import numpy as np
+from socketio import packet
+
+from nicegui import json
+from nicegui.msgpack_packet import JSON_EXT_TYPE, TYPED_ARRAY_EXT_TYPES, MsgPackPacket
+
+
+def decode_ext(code: int, data: bytes):
+    if code == JSON_EXT_TYPE:
+        return json.loads(data)
+    dtype = next(name for name, ext_type in TYPED_ARRAY_EXT_TYPES.items() if ext_type == code)
+    return np.frombuffer(data, dtype=np.dtype(dtype).newbyteorder('<')).tolist()
+
+
+def roundtrip(data):
+    encoded = MsgPackPacket(packet.EVENT, data=data, namespace='/').encode()
+    return msgpack.unpackb(encoded, ext_hook=decode_ext)['data']
+
+
+def test_native_types():
+    data = ['event', {'a': 1, 'b': -2.5, 'c': 'text', 'd': [True, None], 'e': b'\x00\x01'}]
+    assert roundtrip(data) == data
+
+
+def test_numpy_arrays_as_typed_arrays():
+    encoded = MsgPackPacket(packet.EVENT, data=['event', np.array([1.0, 2.0, 3.0])], namespace='/').encode()
+    assert msgpack.unpackb(encoded)['data'][1] == msgpack.ExtType(TYPED_ARRAY_EXT_TYPES['float64'],
+                                                                  np.array([1.0, 2.0, 3.0]).tobytes())
+
+    assert roundtrip([np.arange(3, dtype=np.uint8)]) == [[0, 1, 2]]
+    assert roundtrip([np.arange(4, dtype='>i4')]) == [[0, 1, 2, 3]]
+    assert roundtrip([np.arange(4, dtype=np.float32).reshape(2, 2)]) == [[[0, 1], [2, 3]]]
+    assert roundtrip([np.float64(1.5), np.int64(7), np.array(3)]) == [1.5, 7, 3]
+    assert roundtrip([np.array([True, False])]) == [[True, False]]
+
+
+def test_other_types_as_json():
+    assert roundtrip([json.Fragment('{"1":{"tag":"div"}}')]) == [{'1': {'tag': 'div'}}]
+    assert roundtrip([Decimal('1.5'), date(2024, 1, 2)]) == [1.5, '2024-01-02']
+
+
+def test_decoding():
+    encoded = msgpack.packb({'type': packet.EVENT, 'nsp': '/', 'data': ['event', {'id': 1}], 'id': 3})
+    decoded = MsgPackPacket(encoded_packet=encoded)
+    assert decoded.packet_type == packet.EVENT
+    assert decoded.namespace == '/'
+    assert decoded.data == ['event', {'id': 1}]
+    assert decoded.id == 3
@@ -1,7 +1,9 @@
 import asyncio
 
-from nicegui import ui
-from nicegui.testing import Screen
+from selenium.webdriver.common.by import By
+
+from nicegui import json, ui
+from nicegui.testing import Screen, User
 
 
 def test_removing_outbox_loops(screen: Screen):
@@ -23,3 +25,101 @@ def test_removing_outbox_loops(screen: Screen):
     screen.open('/')
     screen.wait(0.5)
     assert count.text == '0 tasks'
+
+
+def test_patching_elements(screen: Screen):
+    label = ui.label('Hello').classes('text-red-500').style('font-weight: bold').props('data-a=1 data-b=2')
+
+    def change() -> None:
+        label.text = 'Bye'
+        label.classes(replace='text-blue-500')
+        label.style(replace='font-style: italic')
+        label.props(remove='data-a')
+        label.props('data-b=3')
+    ui.button('Change', on_click=change)
+
+    screen.open('/')
+    element = screen.find('Hello')
+    assert element.get_attribute('class') == 'text-red-500'
+    assert element.get_attribute('data-a') == '1'
+
+    screen.click('Change')
+    screen.should_contain('Bye')
+    element = screen.find('Bye')
+    assert element.get_attribute('class') == 'text-blue-500'
+    assert element.get_attribute('style') == 'font-style: italic;'
+    assert element.get_attribute('data-a') is None
+    assert element.get_attribute('data-b') == '3'
+
+
+def test_input_value_is_reset_after_browser_changed_it(screen: Screen):
+    input_ = ui.input(value='A')
+    ui.button('Reset', on_click=lambda: input_.set_value('A'))
+
+    screen.open('/')
+    element = screen.selenium.find_element(By.XPATH, '//input')
+    element.send_keys('B')
+    screen.wait(0.5)
+    assert input_.value == 'AB'
+
+    screen.click('Reset')
+    screen.wait(0.5)
+    assert element.get_attribute('value') == 'A'
+
+
+def test_batching_updates_and_messages(screen: Screen):
+    @ui.page('/', flush_interval=0.5)
+    def page():
+        label = ui.label('A')
+
+        def change() -> None:
+            label.text = 'B'
+            ui.notify('Changed')
+            label.text = 'C'
+        ui.button('Change', on_click=change)
+
+    screen.open('/')
+    screen.click('Change')
+    screen.should_contain('C')
+    screen.should_contain('Changed')
+
+
+async def test_batching_method_calls(user: User):
+    @ui.page('/')
+    def page():
+        ui.label('A')
+
+    await user.open('/')
+    label = user.find('A').elements.pop()
+    frames = []
+
+    async def emit(message_type, data, target_id):
+        frames.append((message_type, data))
+    label.client.outbox._emit = emit  # type: ignore  # pylint: disable=protected-access
+
+    label.run_method('foo', [1, 2])
+    label.run_method('bar')
+    await asyncio.sleep(0.1)
+    assert json.loads(json.dumps(frames)) == [['method_calls', [[label.id, 'foo', [[1, 2]]], [label.id, 'bar', []]]]]
+
+
+async def test_messages_for_different_targets_keep_their_order(user: User):
+    @ui.page('/')
+    def page():
+        ui.label('A')
+
+    await user.open('/')
+    label = user.find('A').elements.pop()
+    outbox = label.client.outbox
+    frames = []
+
+    async def emit(message_type, data, target_id):
+        frames.append((target_id, message_type))
+    outbox._emit = emit  # type: ignore  # pylint: disable=protected-access
+
+    outbox.enqueue_message('notify', {'message': '1'}, label.client.id)
+    outbox.enqueue_message('notify', {'message': '2'}, 'socket')
+    outbox.enqueue_message('notify', {'message': '3'}, 'socket')
+    outbox.enqueue_message('notify', {'message': '4'}, label.client.id)
+    await asyncio.sleep(0.1)
+    assert frames == [(label.client.id, 'notify'), ('socket', 'batch'), (label.client.id, 'notify')]
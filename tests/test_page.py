@@ -1,5 +1,6 @@
 import asyncio
 import re
+import time
 from typing import Optional
 from uuid import uuid4
 
@@ -7,7 +8,7 @@ from fastapi.responses import PlainTextResponse
 from selenium.webdriver.common.by import By
 
 from nicegui import background_tasks, ui
-from nicegui.testing import Screen
+from nicegui.testing import Screen, User
 
 
 def test_page(screen: Screen):
@@ -322,3 +323,25 @@ def test_ip(screen: Screen):
 
     screen.open('/')
     screen.should_contain('127.0.0.1')
+
+
+async def test_connection_and_disconnection_resume_without_polling(user: User):
+    events = []
+
+    @ui.page('/')
+    async def page():
+        t = time.time()
+        await ui.context.client.connected()
+        events.append(('connected', time.time() - t))
+        t = time.time()
+        await ui.context.client.disconnected()
+        events.append(('disconnected', time.time() - t))
+
+    await user.open('/')
+    await asyncio.sleep(0.01)
+    assert [name for name, _ in events] == ['connected']
+    assert events[0][1] < 0.05
+
+    user.client.delete()
+    await asyncio.sleep(0.01)
+    assert [name for name, _ in events] == ['connected', 'disconnected']
@@ -2,7 +2,8 @@ import numpy as np
 import plotly.graph_objects as go
 
 from nicegui import ui
-from nicegui.testing import Screen
+from nicegui.elements.plotly import encode_typed_arrays
+from nicegui.testing import Screen, User
 
 
 def test_plotly(screen: Screen):
@@ -47,3 +48,61 @@ def test_create_dynamically(screen: Screen):
     screen.open('/')
     screen.click('Create')
     assert screen.find_by_tag('svg')
+
+
+async def test_incremental_updates(user: User):
+    @ui.page('/')
+    def page():
+        ui.plotly(go.Figure(go.Scatter(x=[1, 2], y=[3, 4])))
+
+    await user.open('/')
+    plot = user.find(ui.plotly).elements.pop()
+    calls = []
+    plot.run_method = lambda name, *args, **kwargs: calls.append((name, *args))  # type: ignore
+
+    plot.extend_traces({'x': [[3, 4]], 'y': [[5, 6]]}, [0], max_points=3)
+    plot.restyle({'marker.color': 'red'})
+    plot.relayout({'xaxis.range': [0, 5]})
+    assert plot.figure.data[0].x == (2, 3, 4)
+    assert plot.figure.data[0].marker.color == 'red'
+    assert plot.figure.layout.xaxis.range == (0, 5)
+    assert list(plot.props['options']['data'][0]['y']) == [4, 5, 6]
+    assert list(plot.props['options']['layout']['xaxis']['range']) == [0, 5]
+    assert plot.props['data_version'] == 1
+    assert calls == [
+        ('extend_traces', {'x': [[3, 4]], 'y': [[5, 6]]}, [0], 3, 1),
+        ('restyle', {'marker.color': 'red'}, [0]),
+        ('relayout', {'xaxis.range': [0, 5]}),
+    ]
+
+
+async def test_extending_traces_in_place(user: User):
+    x = [1, 2]
+
+    @ui.page('/')
+    def page():
+        ui.plotly({'data': [{'x': x, 'y': np.array([1.0, 2.0])}]}, typed_arrays=True)
+
+    await user.open('/')
+    plot = user.find(ui.plotly).elements.pop()
+    plot.run_method = lambda *args, **kwargs: None  # type: ignore
+
+    plot.extend_traces({'x': [[3]], 'y': [np.array([3.0])]}, [0], max_points=2)
+    y = plot.figure['data'][0]['y']
+    plot.extend_traces({'x': [[4]], 'y': [np.array([4.0])]}, [0], max_points=2)
+    assert plot.figure['data'][0]['x'] is x
+    assert x == [3, 4]
+    assert plot.figure['data'][0]['y'].base is y.base, 'the ring buffer should be re-used'
+    assert plot.figure['data'][0]['y'].tolist() == [3.0, 4.0]
+    assert plot._to_dict()['props']['options']['data'][0]['y'] == {'dtype': 'f8', 'bdata': 'AAAAAAAACEAAAAAAAAAQQA=='}
+    assert isinstance(plot.props['options']['data'][0]['y'], np.ndarray)
+
+
+def test_encode_typed_arrays():
+    figure = {'data': [{'x': np.array([1, 2], dtype=np.int64), 'y': np.array([[0.5], [1.5]]), 'text': ['a', 'b']}]}
+    assert encode_typed_arrays(figure) == {'data': [{
+        'x': {'dtype': 'i4', 'bdata': 'AQAAAAIAAAA='},
+        'y': {'dtype': 'f8', 'bdata': 'AAAAAAAA4D8AAAAAAAD4Pw==', 'shape': '2,1'},
+        'text': ['a', 'b'],
+    }]}
+    assert isinstance(figure['data'][0]['x'], np.ndarray)
@@ -0,0 +1,115 @@
+import asyncio
+import threading
+import time
+
+import matplotlib.pyplot as plt
+import pytest
+
+from nicegui import ui
+from nicegui.elements import pyplot as pyplot_module
+from nicegui.testing import User
+
+
+async def test_render_figure_off_loop(user: User):
+    @ui.page('/')
+    def page():
+        with ui.pyplot(close=False) as plot:
+            plot.fig.gca().set_title('First title')
+        ui.button('Update', on_click=lambda: update(plot))
+
+    def update(plot: ui.pyplot) -> None:
+        with plot:
+            plot.fig.gca().set_title('Second title')
+
+    await user.open('/')
+    plot = user.find(ui.pyplot).elements.pop()
+    await plot.rendered()
+    assert 'First title' in plot.props['innerHTML']
+
+    user.find('Update').click()
+    assert 'Second title' not in plot.props['innerHTML']
+    await plot.rendered()
+    assert 'Second title' in plot.props['innerHTML']
+    assert plt.fignum_exists(plot.fig.number)
+
+
+async def test_figure_is_closed_after_rendering(user: User):
+    @ui.page('/')
+    def page():
+        ui.button('Plot', on_click=lambda: create_plot())
+
+    def create_plot() -> None:
+        with ui.pyplot() as plot:
+            plt.title('Closed figure')
+            assert plt.fignum_exists(plot.fig.number)
+
+    await user.open('/')
+    user.find('Plot').click()
+    plot = user.find(ui.pyplot).elements.pop()
+    await plot.rendered()
+    assert 'Closed figure' in plot.props['innerHTML']
+    assert not plt.fignum_exists(plot.fig.number)
+
+
+async def test_matplotlib_is_updated_once_rendered(user: User):
+    @ui.page('/')
+    def page():
+        ui.matplotlib()
+
+    await user.open('/')
+    element = user.find(ui.matplotlib).elements.pop()
+    await element.rendered()
+    updates = []
+    element.client.outbox.enqueue_update = lambda element: updates.append(element.props['innerHTML'])  # type: ignore
+
+    with element.figure:
+        element.figure.gca().set_title('New title')
+    assert updates == []
+    await element.rendered()
+    assert len(updates) == 1
+    assert 'New title' in updates[0]
+
+
+async def test_png_format(user: User):
+    @ui.page('/')
+    def page():
+        with ui.matplotlib(format='png', figsize=(3, 2), dpi=100).figure as figure:
+            figure.gca().plot([1, 2, 3])
+
+    await user.open('/')
+    element = user.find(ui.matplotlib).elements.pop()
+    await element.rendered()
+    html = element.props['innerHTML']
+    assert html.startswith('<img src="data:image/png;base64,')
+    assert 'width="300"' in html
+
+
+async def test_changing_figure_while_rendering(user: User, monkeypatch: pytest.MonkeyPatch):
+    @ui.page('/')
+    def page():
+        ui.pyplot(close=False)
+
+    await user.open('/')
+    plot = user.find(ui.pyplot).elements.pop()
+    await plot.rendered()
+
+    is_rendering = threading.Event()
+    may_finish = threading.Event()
+
+    def render_slowly(figure, format):  # pylint: disable=redefined-builtin
+        is_rendering.set()
+        may_finish.wait(timeout=5)
+        return original_render_figure(figure, format)
+    original_render_figure = pyplot_module.render_figure
+    monkeypatch.setattr(pyplot_module, 'render_figure', render_slowly)
+
+    with plot:
+        plot.fig.gca().set_title('First title')
+    await asyncio.get_running_loop().run_in_executor(None, is_rendering.wait, 5)
+    start = time.time()
+    with plot:
+        plot.fig.gca().set_title('Second title')
+    assert time.time() - start < 1, 'changing the figure does not wait for the rendering'
+    may_finish.set()
+    await plot.rendered()
+    assert 'Second title' in plot.props['innerHTML']
@@ -1,11 +1,14 @@
-from typing import List
+import asyncio
+import base64
+from typing import List, Union
 
 import numpy as np
+import pytest
 from selenium.common.exceptions import JavascriptException
 
-from nicegui import ui
+from nicegui import core, ui
 from nicegui.elements.scene_object3d import Object3D
-from nicegui.testing import Screen
+from nicegui.testing import Screen, User
 
 
 def test_moving_sphere_with_timer(screen: Screen):
@@ -157,3 +160,101 @@ def test_gltf(screen: Screen):
     screen.open('/')
     screen.wait(1.0)
     assert screen.selenium.execute_script(f'return scene_c{scene.id}.children.length') == 5
+
+
+async def test_command_buffer(user: User):
+    @ui.page('/')
+    def page():
+        with ui.scene():
+            ui.scene.box().with_name('box')
+
+    await user.open('/')
+    scene = user.find(ui.scene).elements.pop()
+    scene._flush_commands()  # pylint: disable=protected-access
+    box = next(iter(scene.objects.values()))
+    messages = []
+    scene.client.outbox.enqueue_method_call = lambda element_id, name, args, target_id: messages.append(args)  # type: ignore
+
+    for i in range(100):
+        box.move(x=i)
+    box.scale(2)
+    box.material('red').material('blue')
+    sphere = ui.scene.sphere().move(z=1)
+    cylinder = ui.scene.cylinder().material('green').move(y=1)
+    cylinder.delete()
+    scene._flush_commands()  # pylint: disable=protected-access
+
+    assert len(messages) == 1
+    commands, ids, transforms = messages[0]
+    assert commands == [
+        ['create', 'sphere', sphere.id, 'scene', 1, 32, 16, False],
+        ['create', 'cylinder', cylinder.id, 'scene', 1, 1, 1, 8, 1, False],
+        ['delete', cylinder.id],
+        ['material', box.id, 'blue', 1.0, 'front'],
+    ]
+    assert ids == [box.id, sphere.id]
+    assert transforms == [99, 0, 0, 1, 0, 0, 0, 1, 0, 0, 0, 1, 2, 2, 2,
+                          0, 0, 1, 1, 0, 0, 0, 1, 0, 0, 0, 1, 1, 1, 1]
+
+
+@pytest.mark.parametrize('wire_format', ['json', 'msgpack'])
+async def test_streaming_point_cloud(user: User, monkeypatch: pytest.MonkeyPatch, wire_format: str):
+    @ui.page('/')
+    def page():
+        ui.scene()
+
+    await user.open('/')
+    scene = user.find(ui.scene).elements.pop()
+    scene._flush_commands()  # pylint: disable=protected-access
+    messages = []
+    scene.client.outbox.enqueue_method_call = lambda element_id, name, args, target_id: messages.append(args)  # type: ignore
+    monkeypatch.setattr(core.app.config, 'wire_format', wire_format)
+
+    def flush() -> list:
+        scene._flush_commands()  # pylint: disable=protected-access
+        commands, _, _ = messages.pop()
+        encoded_args = {'create': (6, 7), 'update_points': (3, 4)}
+        return [[decode(arg) if i in encoded_args[command[0]] else arg for i, arg in enumerate(command)]
+                for command in commands]
+
+    def decode(data: Union[str, bytes]) -> list:
+        assert isinstance(data, bytes if wire_format == 'msgpack' else str)
+        return np.frombuffer(base64.b64decode(data) if isinstance(data, str) else data, dtype='<f4').tolist()
+
+    with scene:
+        cloud = scene.point_cloud(np.arange(30).reshape(10, 3), None, point_size=0.5, chunk_size=4)
+    assert flush() == [
+        ['create', 'point_cloud', cloud.id, 'scene', 0.5, 10, [], []],
+        ['update_points', cloud.id, 0, list(range(12)), [1.0] * 12],
+    ]
+    assert flush() == [['update_points', cloud.id, 4, list(range(12, 24)), [1.0] * 12]]
+
+    cloud.update_points(1, [[-1, -1, -1]])
+    cloud.update_points(9, colors=[[0, 0, 0]])
+    assert flush() == [
+        ['update_points', cloud.id, 1, [-1.0] * 3, [1.0] * 3],
+        ['update_points', cloud.id, 8, list(range(24, 30)), [1.0] * 3 + [0.0] * 3],
+    ]
+    assert cloud.count == 10
+    assert decode(cloud.data[3][2])[:6] == [0, 1, 2, -1, -1, -1]
+    assert cloud.points[:2] == [[0, 1, 2], [-1, -1, -1]]
+    assert cloud.colors[9] == [0, 0, 0]
+
+
+async def test_method_calls_do_not_overtake_queued_commands(user: User):
+    @ui.page('/')
+    def page():
+        ui.scene()
+
+    await user.open('/')
+    scene = user.find(ui.scene).elements.pop()
+    scene._flush_commands()  # pylint: disable=protected-access
+    names = []
+    scene.client.outbox.enqueue_method_call = \
+        lambda element_id, name, args, target_id, request_id=None: names.append(name)  # type: ignore
+
+    with scene:
+        ui.scene.box()
+    scene.move_camera(x=1)
+    await asyncio.sleep(0)
+    assert names == ['apply_commands', 'move_camera']
@@ -1,12 +1,15 @@
 import asyncio
 import copy
+import json
 from pathlib import Path
 
 import httpx
 import pytest
+from starlette.requests import Request
 
 from nicegui import app, background_tasks, context, core, ui
 from nicegui import storage as storage_module
+from nicegui.storage_backends import FileBackend, SQLiteBackend
 from nicegui.testing import Screen
 
 
@@ -315,3 +318,132 @@ def test_storage_access_in_binding_function(screen: Screen):
 
     screen.open('/')
     screen.assert_py_logger('ERROR', 'app.storage.user can only be used within a UI context')
+
+
+def test_sqlite_backend_writes_changed_entries_only(tmp_path: Path):
+    backend = SQLiteBackend(tmp_path / 'storage.sqlite')
+    backend.write('general', {'a': '1', 'b': '[2]'}, {'a': '1', 'b': '[2]'}, [])
+    backend.write('general', {'a': '10', 'c': '"three"'}, {'a': '10', 'c': '"three"'}, ['b'])
+    backend.write('user-123', {'a': 'null'}, {'a': 'null'}, [])
+
+    other_backend = SQLiteBackend(tmp_path / 'storage.sqlite')
+    assert other_backend.load('general') == {'a': 10, 'c': 'three'}
+    assert other_backend.load('user-123') == {'a': None}
+    assert other_backend.load('user-456') == {}
+    assert other_backend.connection.execute('PRAGMA journal_mode').fetchone()[0] == 'wal'
+
+
+def test_file_backend_indentation(tmp_path: Path):
+    backend = FileBackend(tmp_path)
+    backend.write('general', {'a': '[1]'}, {'a': '[1]'}, [])
+    assert (tmp_path / 'storage-general.json').read_text('utf-8') == '{"a":[1]}'
+    backend.write('general', {'a': '[1]'}, {}, [], indent=True)
+    assert (tmp_path / 'storage-general.json').read_text('utf-8') == '{\n  "a": [\n    1\n  ]\n}'
+
+
+def test_user_storage_is_evicted_and_reloaded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv('NICEGUI_STORAGE_PATH', str(tmp_path))
+    storage = storage_module.Storage()
+    storage.max_user_storage_count = 2
+
+    def access(session_id: str) -> storage_module.PersistentDict:
+        storage_module.request_contextvar.set(Request({'type': 'http', 'session': {'id': session_id}}))
+        return storage.user
+
+    for session_id in ['a', 'b', 'c']:
+        storage.backend.write(f'user-{session_id}', {'id': f'"{session_id}"'}, {'id': f'"{session_id}"'}, [])
+        assert access(session_id) == {'id': session_id}
+    access('b')
+    assert storage.user_storage_stats == {'count': 2, 'bytes': 10, 'loads': 3, 'evictions': 1}
+    assert list(storage._users) == ['c', 'b']  # pylint: disable=protected-access
+
+    assert access('a') == {'id': 'a'}
+    assert storage.user_storage_stats == {'count': 2, 'bytes': 10, 'loads': 4, 'evictions': 2}
+    assert list(storage._users) == ['b', 'a']  # pylint: disable=protected-access
+
+    storage.max_user_storage_idle_time = 0
+    storage._evict_user_storage(idle_only=True)  # pylint: disable=protected-access
+    assert storage.user_storage_stats == {'count': 0, 'bytes': 0, 'loads': 4, 'evictions': 4}
+    storage_module.request_contextvar.set(None)
+
+
+@pytest.mark.parametrize('max_count, connected_session_ids, remaining_session_ids', [
+    (0, set(), ['b']),  # no storage may be held in memory
+    (1, {'a'}, ['a', 'b']),  # all other storage is protected by an open page
+])
+def test_accessed_user_storage_is_not_evicted(tmp_path: Path, monkeypatch: pytest.MonkeyPatch,
+                                              max_count: int, connected_session_ids: set, remaining_session_ids: list):
+    monkeypatch.setenv('NICEGUI_STORAGE_PATH', str(tmp_path))
+    storage = storage_module.Storage()
+    storage.max_user_storage_count = max_count
+    for session_id in connected_session_ids:
+        storage._add_session_client(session_id)  # pylint: disable=protected-access
+
+    for session_id in ['a', 'b']:
+        storage_module.request_contextvar.set(Request({'type': 'http', 'session': {'id': session_id}}))
+        storage.user['id'] = session_id
+        assert storage.user == {'id': session_id}
+    assert list(storage._users) == remaining_session_ids  # pylint: disable=protected-access
+    storage_module.request_contextvar.set(None)
+
+
+def test_persistent_dict_with_filepath(tmp_path: Path):
+    filepath = tmp_path / 'data.json'
+    filepath.write_text('{"a": 1}', 'utf-8')
+    persistent_dict = storage_module.PersistentDict(filepath, 'utf-8')
+    assert persistent_dict == {'a': 1}
+
+    persistent_dict['b'] = [2]
+    persistent_dict.flush()
+    assert json.loads(filepath.read_text('utf-8')) == {'a': 1, 'b': [2]}
+    assert [path.name for path in tmp_path.iterdir()] == ['data.json']
+
+
+def test_persistent_dict_encodes_changed_values_only(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    persistent_dict = storage_module.PersistentDict(backend=FileBackend(tmp_path), namespace='general')
+    persistent_dict.update({'a': {'x': [1]}, 'b': {'y': 2}, 'c': 3})
+    persistent_dict.flush()
+    encoded_values = []
+    dumps = storage_module.json.dumps
+    monkeypatch.setattr(storage_module.json, 'dumps', lambda value, **kwargs: encoded_values.append(value) or
+                        dumps(value, **kwargs))
+
+    persistent_dict['a']['x'].append(10)
+    persistent_dict['c'] = 30
+    del persistent_dict['b']
+    encoded, changed, deleted = persistent_dict._diff()  # pylint: disable=protected-access
+    assert encoded_values == [{'x': [1, 10]}, 30]
+    assert changed == {'a': '{"x":[1,10]}', 'c': '30'}
+    assert deleted == ['b']
+    assert encoded == changed
+
+
+def test_evicted_user_storage_is_reused(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv('NICEGUI_STORAGE_PATH', str(tmp_path))
+    storage = storage_module.Storage()
+    storage_module.request_contextvar.set(Request({'type': 'http', 'session': {'id': 'a'}}))
+    user_storage = storage.user  # e.g. held by a binding or a background task
+    storage.max_user_storage_idle_time = 0
+    storage._evict_user_storage(idle_only=True)  # pylint: disable=protected-access
+    assert storage.user_storage_stats['count'] == 0
+
+    user_storage['key'] = 'value'
+    assert storage.user is user_storage
+    storage_module.request_contextvar.set(None)
+
+
+async def test_user_storage_is_evicted_after_writing_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv('NICEGUI_STORAGE_PATH', str(tmp_path))
+    monkeypatch.setattr(core, 'loop', asyncio.get_running_loop())
+    storage = storage_module.Storage()
+    storage.max_user_storage_idle_time = 0
+    storage_module.request_contextvar.set(Request({'type': 'http', 'session': {'id': 'a'}}))
+    storage.user['key'] = 'value'
+    storage._evict_user_storage(idle_only=True)  # pylint: disable=protected-access
+    assert storage.user_storage_stats['count'] == 1, 'the changes have not been written yet'
+
+    await asyncio.sleep(0.5)
+    storage._evict_user_storage(idle_only=True)  # pylint: disable=protected-access
+    assert storage.user_storage_stats['count'] == 0
+    assert json.loads((tmp_path / 'storage-user-a.json').read_text('utf-8')) == {'key': 'value'}
+    storage_module.request_contextvar.set(None)
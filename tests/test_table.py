@@ -1,11 +1,13 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
-from typing import List
+from typing import Dict, List, Tuple
 
 import pandas as pd
 from selenium.webdriver.common.by import By
 
 from nicegui import ui
-from nicegui.testing import Screen
+from nicegui.elements.table import TableRequest
+from nicegui.testing import Screen, User
 
 
 def columns() -> List:
@@ -318,3 +320,66 @@ def test_columns_from_df(screen: Screen):
     screen.click('Update cars with columns')  # updated columns via parameter
     screen.should_contain('Hyundai')
     screen.should_contain('i30')
+
+
+async def test_server_side_rows(user: User):
+    persons = [{'id': i, 'name': f'Person {i}', 'age': i % 7} for i in range(1000)]
+
+    @ui.page('/')
+    def page():
+        ui.table.from_source(persons, rows_per_page=5)
+
+    await user.open('/')
+    table = user.find(ui.table).elements.pop()
+    assert [row['id'] for row in table.rows] == [0, 1, 2, 3, 4]
+    assert table.pagination['rowsNumber'] == 1000
+
+    table._request_rows({'page': 2, 'rowsPerPage': 3, 'sortBy': 'age', 'descending': True})  # pylint: disable=protected-access
+    assert [row['id'] for row in table.rows] == [27, 34, 41]
+    assert table.pagination == {'page': 2, 'rowsPerPage': 3, 'sortBy': 'age', 'descending': True, 'rowsNumber': 1000}
+
+    table.filter = 'Person 99'
+    table._request_rows({'page': 1, 'rowsPerPage': 3, 'sortBy': None, 'descending': False})  # pylint: disable=protected-access
+    assert [row['id'] for row in table.rows] == [99, 990, 991]
+    assert table.pagination['rowsNumber'] == 11
+
+
+async def test_server_side_rows_from_pandas(user: User):
+    df = pd.DataFrame({'id': range(100), 'name': [f'Person {i}' for i in range(100)]})
+
+    @ui.page('/')
+    def page():
+        ui.table.from_source(df, rows_per_page=2)
+
+    await user.open('/')
+    table = user.find(ui.table).elements.pop()
+    assert table.rows == [{'id': 0, 'name': 'Person 0'}, {'id': 1, 'name': 'Person 1'}]
+
+    table.filter = 'person 4'
+    table._request_rows({'page': 99, 'rowsPerPage': 2, 'sortBy': 'id', 'descending': True})  # pylint: disable=protected-access
+    assert table.rows == [{'id': 4, 'name': 'Person 4'}]
+    assert table.pagination['page'] == 6
+    assert table.pagination['rowsNumber'] == 11
+
+
+async def test_server_side_rows_from_async_function(user: User):
+    requests: List[TableRequest] = []
+
+    async def fetch(request: TableRequest) -> Tuple[List[Dict], int]:
+        requests.append(request)
+        await asyncio.sleep(0.1)
+        return [{'id': request.page}], 42
+
+    @ui.page('/')
+    def page():
+        ui.table.from_source(fetch, columns=[{'name': 'id', 'label': 'ID', 'field': 'id'}])
+
+    await user.open('/')
+    table = user.find(ui.table).elements.pop()
+    table._request_rows({'page': 3, 'rowsPerPage': 10})  # pylint: disable=protected-access
+    assert table.props['loading'] is True
+    await asyncio.sleep(0.3)
+    assert table.props['loading'] is False
+    assert table.rows == [{'id': 3}]
+    assert table.pagination['rowsNumber'] == 42
+    assert [request.page for request in requests] == [1, 3]
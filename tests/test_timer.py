@@ -1,9 +1,11 @@
 import asyncio
 import gc
+import weakref
 
 import pytest
 
 from nicegui import ui
+from nicegui.elements import timer as timer_module
 from nicegui.testing import Screen, User
 
 
@@ -145,3 +147,69 @@ async def test_cleanup(user: User):
     await asyncio.sleep(0.1)
     gc.collect()
     assert count() == 1, 'only current timer object is in memory'
+
+
+async def test_timers_on_private_page_share_one_task(user: User):
+    counter = Counter()
+
+    @ui.page('/')
+    def page():
+        for _ in range(100):
+            ui.timer(0.05, counter.increment)
+
+    tasks_before = len(asyncio.all_tasks())
+    await user.open('/')
+    await asyncio.sleep(0.2)
+    assert counter.value >= 200, 'all timers fire repeatedly after the client connected'
+    assert len(asyncio.all_tasks()) < tasks_before + 10, 'timers do not create a task each'
+
+
+async def test_async_callback_in_slot_context(user: User):
+    async def add_label():
+        await asyncio.sleep(0.01)
+        ui.label('added asynchronously')
+
+    @ui.page('/')
+    def page():
+        with ui.card():
+            ui.timer(0.01, add_label, once=True)
+
+    await user.open('/')
+    await user.should_see('added asynchronously')
+
+
+async def test_period_and_phase(user: User, monkeypatch: pytest.MonkeyPatch):
+    @ui.page('/')
+    def page():
+        ui.timer(0.3, lambda: None, active=False)
+
+    await user.open('/')
+    timer = user.find(ui.timer).elements.pop()
+    due_times = []
+    with monkeypatch.context() as m:
+        m.setattr(timer_module.scheduler, 'add', lambda _, due: due_times.append(due))
+        m.setattr(timer_module.scheduler, '_phases', {})
+        timer._due = 100.05  # pylint: disable=protected-access
+        m.setattr(timer_module.time, 'time', lambda: 100.1)
+        timer._schedule_next()  # pylint: disable=protected-access
+        m.setattr(timer_module.time, 'time', lambda: 101.0)
+        timer._schedule_next()  # pylint: disable=protected-access
+        timer._due = 100.25  # pylint: disable=protected-access
+        m.setattr(timer_module.time, 'time', lambda: 100.3)
+        timer._schedule_next()  # pylint: disable=protected-access
+    assert due_times[:2] == [pytest.approx(100.35), pytest.approx(101.25)], 'missed executions are skipped'
+    assert due_times[2] == pytest.approx(100.65), 'timers with the same interval share a phase'
+
+
+async def test_deleted_timer_is_not_kept_alive_by_scheduler(user: User):
+    @ui.page('/')
+    def page():
+        ui.timer(10, lambda: None)
+
+    await user.open('/')
+    timer = user.find(ui.timer).elements.pop()
+    timer_ref = weakref.ref(timer)
+    timer.delete()
+    del timer
+    gc.collect()
+    assert timer_ref() is None
@@ -221,6 +221,46 @@ def aggrid_run_row_method():
               on_click=lambda: grid.run_row_method('Alice', 'setDataValue', 'age', 99))
 
 
+@doc.demo('Row transactions', '''
+    Instead of updating the whole grid, you can add, update and remove rows with
+    `add_rows`, `update_rows` and `remove_rows`.
+    Only the changed rows are sent to the client and applied as an AG Grid transaction,
+    while `options['rowData']` is kept in sync on the server.
+    This requires the `row_id` parameter naming the field with unique row IDs.
+''')
+def aggrid_row_transactions():
+    import itertools
+    import random
+
+    grid = ui.aggrid({
+        'columnDefs': [{'field': 'id'}, {'field': 'value'}],
+        'rowData': [{'id': i, 'value': random.randint(0, 100)} for i in range(1000)],
+    }, row_id='id')
+    ids = itertools.count(1000)
+    with ui.row():
+        ui.button('Add', on_click=lambda: grid.add_rows([{'id': next(ids), 'value': 0}], index=0))
+        ui.button('Update', on_click=lambda: grid.update_rows([{**grid.options['rowData'][0], 'value': random.randint(0, 100)}]))
+        ui.button('Remove', on_click=lambda: grid.remove_rows(grid.options['rowData'][:1]))
+
+
+@doc.demo('Datasource for large data sets', '''
+    For large data sets you can pass a `datasource` function instead of `rowData`.
+    The grid uses AG Grid's infinite row model and only requests the visible blocks of rows.
+    The datasource receives an `AgGridRequest` with the row range, the sort model and the filter model
+    and returns the rows together with the total number of rows.
+    It can be an async function, e.g. to query a database without blocking the event loop.
+''')
+def aggrid_datasource():
+    from nicegui.elements.aggrid import AgGridRequest
+
+    def fetch(request: AgGridRequest):
+        descending = any(sort['sort'] == 'desc' for sort in request.sort_model)
+        numbers = range(999_999, -1, -1) if descending else range(1_000_000)
+        return [{'number': n, 'square': n * n} for n in numbers[request.start_row:request.end_row]], len(numbers)
+
+    ui.aggrid({'columnDefs': [{'field': 'number', 'sortable': True}, {'field': 'square'}]}, datasource=fetch)
+
+
 @doc.demo('Filter return values', '''
     You can filter the return values of method calls by passing string that defines a JavaScript function.
     This demo runs the grid method "getDisplayedRowAtIndex" and returns the "data" property of the result.
@@ -139,4 +139,22 @@ def echarts_gl_demo() -> None:
     })
 
 
+@doc.demo('Incremental updates', '''
+    Instead of calling `update` after changing the options, which sends all options to the client,
+    you can use `append_data` to only send new data points.
+    Similarly, `merge_options` only sends partial options and `set_series_data` only sends a single series,
+    optionally downsampled with the LTTB algorithm to a maximum number of points.
+''')
+def incremental_updates():
+    import math
+    import time
+
+    echart = ui.echart({
+        'xAxis': {'type': 'value', 'scale': True},
+        'yAxis': {'type': 'value'},
+        'series': [{'type': 'line', 'showSymbol': False, 'data': []}],
+    })
+    ui.timer(0.1, lambda: echart.append_data([[[time.time(), math.sin(time.time())]]], max_points=100))
+
+
 doc.reference(ui.echart)
@@ -24,7 +24,9 @@ def base64():
 
 
 @doc.demo('PIL image', '''
-    You can also use a PIL image as image source.
+    You can also use a PIL image or a NumPy array as image source.
+    It is served from an in-memory cache under a URL containing a hash of the image data,
+    so the browser can cache it and re-rendering the page does not send the image again.
 ''')
 def pil():
     import numpy as np
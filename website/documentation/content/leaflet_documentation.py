@@ -64,6 +64,45 @@ def move_markers() -> None:
     ui.button('Move marker', on_click=lambda: marker.move(51.51, -0.09))
 
 
+@doc.demo('Many Markers', '''
+    The `markers` layer manages many markers with a single layer.
+    Markers added, moved or removed with `add`, `move` and `remove` are sent to the client in a single message per update cycle.
+    With `viewport_culling=True` only markers within (or close to) the visible area of the map are sent.
+    Culling is disabled on shared pages like the auto-index page, because each browser has its own viewport.
+''')
+def many_markers() -> None:
+    import random
+
+    m = ui.leaflet(center=(51.505, -0.09))
+    positions = {i: (51.505 + random.gauss(0, 0.05), -0.09 + random.gauss(0, 0.1)) for i in range(1000)}
+    markers = m.markers(positions=positions, viewport_culling=True)
+
+    def move() -> None:
+        markers.move({i: (lat + random.gauss(0, 0.005), lng + random.gauss(0, 0.005))
+                      for i, (lat, lng) in markers.positions.items()})
+    ui.button('Move markers', on_click=move)
+
+
+@doc.demo('GeoJSON', '''
+    The `geo_json` layer displays a GeoJSON feature collection.
+    Large collections are streamed to the client in chunks of `chunk_size` features.
+    More features can be added with `add_data`.
+''')
+def geo_json() -> None:
+    m = ui.leaflet(center=(51.505, -0.09), zoom=11)
+    m.geo_json(data={
+        'type': 'FeatureCollection',
+        'features': [
+            {
+                'type': 'Feature',
+                'properties': {},
+                'geometry': {'type': 'Point', 'coordinates': [-0.09 + 0.02 * i, 51.505]},
+            }
+            for i in range(-5, 6)
+        ],
+    })
+
+
 @doc.demo('Vector Layers', '''
     Leaflet supports a set of [vector layers](https://leafletjs.com/reference.html#:~:text=VideoOverlay-,Vector%20Layers,-Path) like circle, polygon etc.
     These can be added with the `generic_layer` method.
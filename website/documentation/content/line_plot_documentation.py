@@ -32,4 +32,17 @@ def main_demo() -> None:
     line_checkbox.on('update:model-value', handle_change, args=[None])
 
 
+@doc.demo('Streaming mode', '''
+    With `streaming=True` the line plot is rendered in the browser using ECharts.
+    Only new data points are sent to the client, which is much faster than rendering a new figure on every update.
+''')
+def streaming_demo() -> None:
+    import math
+    import time
+
+    line_plot = ui.line_plot(n=2, limit=200, streaming=True).classes('w-full h-64') \
+        .with_legend(['sin', 'cos'])
+    ui.timer(0.05, lambda: line_plot.push([time.time()], [[math.sin(time.time())], [math.cos(time.time())]]))
+
+
 doc.reference(ui.line_plot)
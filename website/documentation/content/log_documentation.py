@@ -41,4 +41,16 @@ def logger_handler():
     ui.button('Log time', on_click=lambda: logger.warning(datetime.now().strftime('%X.%f')[:-5]))
 
 
+@doc.demo('Streaming mode', '''
+    For logs with many lines per second you can set `streaming=True`.
+    The log then keeps the last `max_lines` lines (10,000 by default) in a ring buffer
+    and only sends new lines to the browser instead of creating a label element for each line.
+''')
+def streaming_demo() -> None:
+    from datetime import datetime
+
+    log = ui.log(max_lines=1000, streaming=True).classes('w-full h-20')
+    ui.timer(0.05, lambda: log.push(datetime.now().strftime('%X.%f')[:-3]))
+
+
 doc.reference(ui.log)
@@ -14,4 +14,17 @@ def main_demo() -> None:
         ax.plot(x, y, '-')
 
 
+@doc.demo('PNG format', '''
+    Figures are rendered as SVG by default.
+    For dense plots like scatter plots with many points, the SVG can get very large.
+    Set `format='png'` to render the figure as raster image instead.
+''')
+def png_demo() -> None:
+    import numpy as np
+
+    with ui.matplotlib(figsize=(3, 2), format='png').figure as fig:
+        x, y = np.random.randn(2, 10_000)
+        fig.gca().scatter(x, y, s=1)
+
+
 doc.reference(ui.matplotlib)
@@ -67,6 +67,31 @@ def plot_updates():
     ui.button('Add trace', on_click=add_trace)
 
 
+@doc.demo('Incremental updates', '''
+    Instead of sending the whole figure with `plot.update()`,
+    you can send only the changes with `extend_traces`, `restyle` and `relayout`.
+    These methods correspond to the [JavaScript Plotly API](https://plotly.com/javascript/plotlyjs-function-reference/)
+    and keep the figure on the server in sync, so that it is up-to-date when the page is reloaded.
+    With `typed_arrays=True` NumPy arrays in the trace data are sent as compact base64-encoded typed arrays.
+''')
+def plot_incremental_updates():
+    from random import random
+
+    fig = {
+        'data': [{'type': 'scatter', 'x': [], 'y': []}],
+        'layout': {'margin': {'l': 15, 'r': 0, 't': 0, 'b': 15}},
+    }
+    plot = ui.plotly(fig).classes('w-full h-40')
+    counter = {'x': 0}
+
+    def add_point():
+        counter['x'] += 1
+        plot.extend_traces({'x': [[counter['x']]], 'y': [[random()]]}, [0], max_points=50)
+
+    ui.timer(0.2, add_point)
+    ui.button('Red', on_click=lambda: plot.restyle({'line.color': 'red'}))
+
+
 @doc.demo('Plot events', r'''
     This demo shows how to handle Plotly events.
     Try clicking on a data point to see the event data.
@@ -142,7 +142,10 @@ def immediate_updates() -> None:
 @doc.demo('Rendering point clouds', '''
     You can render point clouds using the `point_cloud` method.
     The `points` argument is a list of point coordinates, and the `colors` argument is a list of RGB colors (0..1).
-    You can update the cloud using its `set_points()` method.
+    Both can also be NumPy arrays of shape (n, 3), which are sent to the browser as binary buffers.
+    Large clouds are loaded progressively in chunks of `chunk_size` points.
+    You can update the cloud using its `set_points()` method
+    or only change a range of points and colors in place using `update_points()`.
 ''')
 def point_clouds() -> None:
     import numpy as np
@@ -162,6 +165,25 @@ def point_clouds() -> None:
         .on_value_change(lambda e: point_cloud.set_points(*generate_data(e.value)))
 
 
+@doc.demo('Instanced meshes', '''
+    To render many copies of the same geometry efficiently, use the `instanced_mesh` method.
+    Like for point clouds, positions and colors can be NumPy arrays and are updated with `set_points()` and `update_points()`.
+''')
+def instanced_meshes() -> None:
+    import numpy as np
+
+    positions = np.random.uniform(-3, 3, (1000, 3)) * [1, 1, 0.3] + [0, 0, 1]
+    colors = np.random.uniform(0, 1, (1000, 3))
+    with ui.scene().classes('w-full h-64') as scene:
+        cubes = scene.instanced_mesh(positions, colors, geometry='box', geometry_args=(0.1, 0.1, 0.1))
+
+    def shake() -> None:
+        index = np.random.randint(900)
+        positions[index:index + 100] += np.random.normal(0, 0.05, (100, 3))
+        cubes.update_points(index, positions[index:index + 100])
+    ui.timer(0.1, shake)
+
+
 @doc.demo('Wait for Initialization', '''
     You can wait for the scene to be initialized with the `initialized` method.
     This demo animates a camera movement after the scene has been fully loaded.
@@ -70,6 +70,7 @@ doc.text('', '''
     - `MATPLOTLIB` (default: true) can be set to `false` to avoid the potentially costly import of Matplotlib.
         This will make `ui.pyplot` and `ui.line_plot` unavailable.
     - `NICEGUI_STORAGE_PATH` (default: local ".nicegui") can be set to change the location of the storage files.
+    - `NICEGUI_STORAGE_BACKEND` (default: "file") can be set to "sqlite" to persist the storage in a SQLite database.
     - `MARKDOWN_CONTENT_CACHE_SIZE` (default: 1000): The maximum number of Markdown content snippets that are cached in memory.
     - `RST_CONTENT_CACHE_SIZE` (default: 1000): The maximum number of ReStructuredText content snippets that are cached in memory.
 ''')
@@ -180,6 +181,19 @@ doc.text('', '''
     Note that there are additional steps required to allow multiple workers.
 ''')
 
+doc.text('Multiple Instances', '''
+    NiceGUI deliberately does not support uvicorn's `workers` parameter and raises an error if it is greater than 1.
+    The elements of a page only exist in the process which has built it,
+    so every request and the websocket connection of a client must reach that same process.
+    In-memory routes like cached images and automatically added files are not shared between processes either.
+
+    To use more than one CPU core, you can run several instances of your app behind a reverse proxy with sticky sessions,
+    e.g. NGINX with `ip_hash` or Traefik with a sticky cookie, so that each browser always talks to the same instance.
+    Note that global variables are not shared between instances
+    and that each instance keeps `app.storage.general` and `app.storage.user` in memory,
+    so changes made by one instance are not seen by the others.
+''')
+
 doc.text('Package for Installation', '''
     NiceGUI apps can also be bundled into an executable with `nicegui-pack` which is based on [PyInstaller](https://www.pyinstaller.org/).
     This allows you to distribute your app as a single file that can be executed on any computer.
@@ -159,3 +159,14 @@ doc.text('Indentation', '''
     You can change this to an indentation of 2 spaces by setting
     `app.storage.general.indent = True` or `app.storage.user.indent = True`.
 ''')
+
+
+doc.text('Memory Usage of User Storage', '''
+    User storage is loaded into memory when it is accessed for the first time.
+    It is written back and evicted from memory after 10 minutes without access (`app.storage.max_user_storage_idle_time`)
+    or, least recently used first, when the number of users or the size of their data exceeds
+    `app.storage.max_user_storage_count` or `app.storage.max_user_storage_bytes` (both `None` by default).
+    The storage of users with an open page is never evicted.
+    `app.storage.user_storage_stats` reports the number and size of user storages in memory
+    as well as the number of loads and evictions.
+''')
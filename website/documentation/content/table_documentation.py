@@ -166,6 +166,19 @@ def table_from_pandas_demo():
     ui.table.from_pandas(df).classes('max-h-40')
 
 
+@doc.demo('Server-side pagination', '''
+    For large data sets you can use the `from_source` method.
+    It only sends the rows of the current page to the browser
+    and sorts and filters the rows on the server when the user changes the page, the sorting or the filter.
+    The source can be a list of rows, a Pandas DataFrame or a (possibly async) function
+    receiving a `TableRequest` and returning the rows of the requested page and the total number of rows.
+''')
+def server_side_pagination_demo():
+    rows = [{'id': i, 'name': f'Person {i}', 'age': i % 100} for i in range(100_000)]
+    table = ui.table.from_source(rows, rows_per_page=5)
+    ui.input('Filter').bind_value(table, 'filter')
+
+
 @doc.demo('Adding rows', '''
     It's simple to add new rows with the `add_row(dict)` and `add_rows(list[dict])` methods.
     With the "virtual-scroll" prop set, the table can be programmatically scrolled with the `scrollTo` JavaScript function.